@@ -1,34 +1,26 @@
 """VOICEVOX ENGINE の実行"""
 
 import argparse
+import atexit
 import multiprocessing
 import os
 import sys
+import time
 import warnings
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from io import TextIOWrapper
 from pathlib import Path
 from typing import TextIO
 
-import uvicorn
 from pydantic import TypeAdapter
 
-from voicevox_engine.app.application import generate_app
-from voicevox_engine.cancellable_engine import CancellableEngine
-from voicevox_engine.core.core_initializer import initialize_cores
-from voicevox_engine.engine_manifest import load_manifest
-from voicevox_engine.library.library_manager import LibraryManager
-from voicevox_engine.preset.preset_manager import PresetManager
 from voicevox_engine.setting.model import CorsPolicyMode
-from voicevox_engine.setting.setting_manager import USER_SETTING_PATH, SettingHandler
-from voicevox_engine.tts_pipeline.song_engine import make_song_engines_from_cores
-from voicevox_engine.tts_pipeline.tts_engine import make_tts_engines_from_cores
-from voicevox_engine.user_dict.user_dict_manager import UserDictionary
-from voicevox_engine.utility.path_utility import (
-    engine_manifest_path,
-    engine_root,
-    get_save_dir,
-)
+from voicevox_engine.setting.setting_manager import USER_SETTING_PATH
+
+# NOTE: 音声合成や API サーバーに関わる重いモジュールは、引数の解析後に `main()` 内で読み込む。
+#       これにより `-h` 等の起動が速くなり、`--profile_startup` で読み込み時間を計測できる。
 
 # Uvicorn でバインドするアドレスを "localhost" にすることで IPv4 (127.0.0.1) と IPv6 ([::1]) の両方でリッスンできます.
 # これは Uvicorn のドキュメントに記載されていない挙動です; 将来のアップデートにより動作しなくなる可能性があります.
@@ -162,6 +154,41 @@ def select_first_not_none_or_none[T](candidates: list[T | None]) -> T | None:
     return None
 
 
+class _StartupProfiler:
+    """エンジン起動処理の各フェーズにかかる時間を計測する。"""
+
+    def __init__(self, enabled: bool) -> None:
+        self._enabled = enabled
+        self._phases: list[tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """`with` ブロック内の処理を 1 つのフェーズとして計測する。"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phases.append((name, time.perf_counter() - start))
+
+    def report(self) -> None:
+        """計測結果を標準エラー出力へ表示する。計測が無効な場合は何もしない。"""
+        if not self._enabled:
+            return
+        import psutil
+
+        # NOTE: `main()` 以前のインタープリタ起動やモジュール読み込みも含めるため、プロセス生成時刻を起点とする
+        sec_since_process_start = time.time() - psutil.Process().create_time()
+        sec_phases = sum(sec for _, sec in self._phases)
+        lines = ["起動時間の内訳:"]
+        for name, sec in self._phases:
+            lines.append(f"  {name}: {sec:.3f} sec")
+        lines.append(
+            f"  その他 (インタープリタ起動等): {sec_since_process_start - sec_phases:.3f} sec"
+        )
+        lines.append(f"  合計 (プロセス生成から): {sec_since_process_start:.3f} sec")
+        print("\n".join(lines), file=sys.stderr)
+
+
 @dataclass(frozen=True)
 class _CLIArgs:
     host: str | None
@@ -181,6 +208,10 @@ class _CLIArgs:
     setting_file: Path
     preset_file: Path | None
     disable_mutable_api: bool
+    katakana_english_words: Path | None
+    text_frontend_processes: int
+    prediction_cache_size: int
+    profile_startup: bool
 
 
 _cli_args_adapter = TypeAdapter(_CLIArgs)
@@ -320,6 +351,33 @@ def read_cli_arguments(envs: Envs) -> _CLIArgs:
         ),
     )
 
+    parser.add_argument(
+        "--katakana_english_words",
+        type=Path,
+        default=None,
+        help="起動時にカタカナ読みを生成しておく英単語の一覧ファイル（1行に1単語）を指定できます。",
+    )
+
+    parser.add_argument(
+        "--text_frontend_processes",
+        type=int,
+        default=0,
+        help="テキスト解析をおこなうワーカープロセス数です。0の場合、テキスト解析はリクエストを処理するスレッドでおこなわれます。",
+    )
+
+    parser.add_argument(
+        "--prediction_cache_size",
+        type=int,
+        default=0,
+        help="音素長・音高の推論結果をアクセント句ごとにキャッシュする数です。0の場合、キャッシュしません。キャッシュした推論結果は前後の文脈が同じアクセント句に再利用されます。",
+    )
+
+    parser.add_argument(
+        "--profile_startup",
+        action="store_true",
+        help="起動処理の各フェーズにかかった時間を、サーバーの待ち受け開始前に表示します。",
+    )
+
     args_dict = vars(parser.parse_args())
 
     # NOTE: 複数個の同名引数に基づいてリスト化されるため `CLIArgs` で複数形にリネームされている
@@ -346,74 +404,132 @@ def main() -> None:
     if args.output_log_utf8:
         set_output_log_utf8()
 
-    use_gpu = select_first_not_none([args.use_gpu, envs.use_gpu])
+    profiler = _StartupProfiler(args.profile_startup)
+
+    with profiler.phase("モジュール読み込み"):
+        import uvicorn
+
+        from voicevox_engine.app.application import generate_app
+        from voicevox_engine.cancellable_engine import CancellableEngine
+        from voicevox_engine.core.core_initializer import initialize_cores
+        from voicevox_engine.engine_manifest import load_manifest
+        from voicevox_engine.preset.preset_manager import PresetManager
+        from voicevox_engine.setting.setting_manager import SettingHandler
+        from voicevox_engine.tts_pipeline.frontend_pool import TextFrontendPool
+        from voicevox_engine.tts_pipeline.katakana_english import (
+            get_conversion_cache_info,
+            preload_english_words,
+        )
+        from voicevox_engine.tts_pipeline.song_engine import (
+            make_song_engines_from_cores,
+        )
+        from voicevox_engine.tts_pipeline.tts_engine import make_tts_engines_from_cores
+        from voicevox_engine.user_dict.user_dict_manager import UserDictionary
+        from voicevox_engine.utility.path_utility import (
+            engine_manifest_path,
+            engine_root,
+            get_save_dir,
+        )
 
-    core_manager = initialize_cores(
-        use_gpu=use_gpu,
-        voicelib_dirs=args.voicelib_dirs,
-        voicevox_dir=args.voicevox_dir,
-        runtime_dirs=args.runtime_dirs,
-        cpu_num_threads=args.cpu_num_threads,
-        enable_mock=args.enable_mock,
-        load_all_models=args.load_all_models,
-    )
-    tts_engines = make_tts_engines_from_cores(core_manager)
-    song_engines = make_song_engines_from_cores(core_manager)
-    assert len(tts_engines.versions()) != 0, "音声合成エンジンがありません。"
-    assert len(song_engines.versions()) != 0, "音声合成エンジンがありません。"
+    use_gpu = select_first_not_none([args.use_gpu, envs.use_gpu])
 
-    cancellable_engine: CancellableEngine | None = None
-    if args.enable_cancellable_synthesis:
-        cancellable_engine = CancellableEngine(
-            init_processes=args.init_processes,
+    with profiler.phase("コア初期化"):
+        core_manager = initialize_cores(
             use_gpu=use_gpu,
             voicelib_dirs=args.voicelib_dirs,
             voicevox_dir=args.voicevox_dir,
             runtime_dirs=args.runtime_dirs,
             cpu_num_threads=args.cpu_num_threads,
             enable_mock=args.enable_mock,
+            load_all_models=args.load_all_models,
         )
+        song_engines = make_song_engines_from_cores(core_manager)
+        assert len(song_engines.versions()) != 0, "音声合成エンジンがありません。"
 
-    setting_loader = SettingHandler(args.setting_file)
-    settings = setting_loader.load()
-
-    # 複数方式で指定可能な場合、優先度は上から「引数」「環境変数」「設定ファイル」「デフォルト値」
-
-    host = select_first_not_none([args.host, envs.host, _DEFAULT_HOST])
-    port = select_first_not_none([args.port, envs.port, _DEFAULT_PORT])
-
-    cors_policy_mode = select_first_not_none(
-        [args.cors_policy_mode, settings.cors_policy_mode]
-    )
+    cancellable_engine: CancellableEngine | None = None
+    if args.enable_cancellable_synthesis:
+        with profiler.phase("キャンセル可能な音声合成の初期化"):
+            cancellable_engine = CancellableEngine(
+                init_processes=args.init_processes,
+                use_gpu=use_gpu,
+                voicelib_dirs=args.voicelib_dirs,
+                voicevox_dir=args.voicevox_dir,
+                runtime_dirs=args.runtime_dirs,
+                cpu_num_threads=args.cpu_num_threads,
+                enable_mock=args.enable_mock,
+            )
+
+    with profiler.phase("設定・プリセット読み込み"):
+        setting_loader = SettingHandler(args.setting_file)
+        settings = setting_loader.load()
+
+        # 複数方式で指定可能な場合、優先度は上から「引数」「環境変数」「設定ファイル」「デフォルト値」
+
+        host = select_first_not_none([args.host, envs.host, _DEFAULT_HOST])
+        port = select_first_not_none([args.port, envs.port, _DEFAULT_PORT])
+
+        cors_policy_mode = select_first_not_none(
+            [args.cors_policy_mode, settings.cors_policy_mode]
+        )
 
-    setting_allow_origins = None
-    if settings.allow_origin is not None:
-        setting_allow_origins = settings.allow_origin.split(" ")
-    allow_origin = select_first_not_none_or_none(
-        [args.allow_origins, setting_allow_origins]
-    )
+        setting_allow_origins = None
+        if settings.allow_origin is not None:
+            setting_allow_origins = settings.allow_origin.split(" ")
+        allow_origin = select_first_not_none_or_none(
+            [args.allow_origins, setting_allow_origins]
+        )
 
-    if envs.env_preset_path is not None and len(envs.env_preset_path) != 0:
-        env_preset_path = Path(envs.env_preset_path)
-    else:
-        env_preset_path = None
-    default_preset_path = get_save_dir() / "presets.yaml"
-    preset_path = select_first_not_none(
-        [args.preset_file, env_preset_path, default_preset_path]
-    )
-    preset_manager = PresetManager(preset_path)
+        if envs.env_preset_path is not None and len(envs.env_preset_path) != 0:
+            env_preset_path = Path(envs.env_preset_path)
+        else:
+            env_preset_path = None
+        default_preset_path = get_save_dir() / "presets.yaml"
+        preset_path = select_first_not_none(
+            [args.preset_file, env_preset_path, default_preset_path]
+        )
+        preset_manager = PresetManager(preset_path)
+
+    with profiler.phase("ユーザー辞書の構築"):
+        # NOTE: 単語の編集に伴う辞書のコンパイルで API の応答が遅れないよう、バックグラウンドで更新する
+        user_dict = UserDictionary(enable_background_update=True)
+
+    english_words: list[str] = []
+    if args.katakana_english_words is not None:
+        with profiler.phase("英単語のカタカナ読みの事前生成"):
+            with args.katakana_english_words.open(encoding="utf-8") as f:
+                english_words = f.readlines()
+            preload_english_words(english_words)
+
+    text_frontend_pool: TextFrontendPool | None = None
+    if args.text_frontend_processes > 0:
+        with profiler.phase("テキスト解析プロセスの起動"):
+            # NOTE: 各ワーカープロセスは独立したキャッシュを持つため、起動時に同じ英単語を事前生成する
+            text_frontend_pool = TextFrontendPool(
+                args.text_frontend_processes, user_dict, english_words
+            )
+        # 終了時にワーカープロセスを停止する
+        atexit.register(text_frontend_pool.shutdown)
+
+    with profiler.phase("音声合成エンジンの生成"):
+        # NOTE: テキスト解析プロセスがユーザー辞書を参照するため、ユーザー辞書の構築後に生成する
+        tts_engines = make_tts_engines_from_cores(
+            core_manager, text_frontend_pool, args.prediction_cache_size
+        )
+        assert len(tts_engines.versions()) != 0, "音声合成エンジンがありません。"
 
-    user_dict = UserDictionary()
+    with profiler.phase("マニフェスト・音声ライブラリ管理の初期化"):
+        # NOTE: 音声ライブラリ管理の依存モジュールの読み込みも本フェーズで計測する
+        from voicevox_engine.library.library_manager import LibraryManager
 
-    engine_manifest = load_manifest(engine_manifest_path())
+        engine_manifest = load_manifest(engine_manifest_path())
 
-    library_manager = LibraryManager(
-        get_save_dir() / "installed_libraries",
-        engine_manifest.supported_vvlib_manifest_version,
-        engine_manifest.brand_name,
-        engine_manifest.name,
-        engine_manifest.uuid,
-    )
+        library_manager = LibraryManager(
+            get_save_dir() / "installed_libraries",
+            engine_manifest.supported_vvlib_manifest_version,
+            engine_manifest.brand_name,
+            engine_manifest.name,
+            engine_manifest.uuid,
+        )
 
     root_dir = select_first_not_none([args.voicevox_dir, engine_root()])
     character_info_dir = root_dir / "resources" / "character_info"
@@ -424,25 +540,42 @@ def main() -> None:
     disable_mutable_api = args.disable_mutable_api or envs.disable_mutable_api
 
     # ASGI に準拠した VOICEVOX ENGINE アプリケーションを生成する
-    app = generate_app(
-        tts_engines,
-        song_engines,
-        core_manager,
-        setting_loader,
-        preset_manager,
-        user_dict,
-        engine_manifest,
-        library_manager,
-        cancellable_engine,
-        character_info_dir,
-        cors_policy_mode,
-        allow_origin,
-        disable_mutable_api=disable_mutable_api,
-    )
+    with profiler.phase("アプリケーション生成"):
+        app = generate_app(
+            tts_engines,
+            song_engines,
+            core_manager,
+            setting_loader,
+            preset_manager,
+            user_dict,
+            engine_manifest,
+            library_manager,
+            cancellable_engine,
+            character_info_dir,
+            cors_policy_mode,
+            allow_origin,
+            disable_mutable_api=disable_mutable_api,
+            morphing_analysis_mode=settings.morphing_analysis_mode,
+        )
+
+    profiler.report()
 
     # VOICEVOX ENGINE サーバーを起動
     # NOTE: デフォルトは ASGI に準拠した HTTP/1.1 サーバー
-    uvicorn.run(app, host=host, port=port)
+    try:
+        uvicorn.run(app, host=host, port=port)
+    finally:
+        # NOTE: テキスト解析プロセスを用いる場合、変換はワーカープロセスでおこなわれこのプロセスでは集計されないため表示しない
+        if args.katakana_english_words is not None and text_frontend_pool is None:
+            # 事前生成した読みの効果を確認できるよう、終了時にキャッシュの利用状況を表示する
+            cache_info = get_conversion_cache_info()
+            print(
+                "英単語のカタカナ読みのキャッシュ: "
+                f"ヒット {cache_info.hits} 回, ミス {cache_info.misses} 回, "
+                f"ヒット率 {cache_info.hit_rate:.3f}, "
+                f"保持数 {cache_info.size}/{cache_info.max_size}",
+                file=sys.stderr,
+            )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,130 @@
+"""
+モーフィング用の音声分析の方式ごとの品質の客観比較
+
+各方式で分析した基本周波数と、モーフィングで再合成した音声を、高品質な方式（harvest）の結果や元の音声と比較する。
+実行コマンドは `python -m test.benchmark.morphing_quality` である。
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from test.benchmark.speed.synthesis import _generate_query
+from voicevox_engine.dev.tts_engine.mock import MockTTSEngine
+from voicevox_engine.metas.metas import StyleId
+from voicevox_engine.morphing.model import MorphingAnalysisMode
+from voicevox_engine.morphing.morphing import (
+    _estimate_f0,
+    synthesis_morphing_parameter,
+    synthesize_morphed_wave,
+)
+
+_TEXT = "こんにちは、音声合成の世界へようこそ。"
+_FFT_SIZE = 1024
+_HOP_SIZE = 256
+
+
+@dataclass(frozen=True)
+class _QualityReport:
+    """分析方式ひとつの品質指標"""
+
+    # harvest との基本周波数の二乗平均平方根誤差（双方が有声のフレーム）[cent]
+    f0_rmse_cent: float
+    # harvest と有声・無声の判定が異なるフレームの割合
+    voicing_error_rate: float
+    # 元の音声と、割合 0.0 で再合成した音声の対数スペクトル距離 [dB]
+    resynthesis_lsd: float
+    # harvest による結果と、割合 0.5 でモーフィングした音声の対数スペクトル距離 [dB]
+    morph_lsd: float
+
+
+def _log_spectrogram(wave: NDArray[np.float64]) -> NDArray[np.float64]:
+    """音声の対数振幅スペクトログラム [dB] を得る。"""
+    n_frame = max(1, 1 + (len(wave) - _FFT_SIZE) // _HOP_SIZE)
+    window = np.hanning(_FFT_SIZE)
+    padded = np.pad(wave, (0, max(0, _FFT_SIZE - len(wave))))
+    frames = np.stack(
+        [
+            padded[i * _HOP_SIZE : i * _HOP_SIZE + _FFT_SIZE] * window
+            for i in range(n_frame)
+        ]
+    )
+    amplitude = np.abs(np.fft.rfft(frames, axis=1))
+    return 20 * np.log10(np.maximum(amplitude, 1e-10))
+
+
+def _log_spectral_distance(
+    wave_1: NDArray[np.float64], wave_2: NDArray[np.float64]
+) -> float:
+    """2 つの音声の対数スペクトル距離 [dB] を得る。長さは短い方に揃える。"""
+    length = min(len(wave_1), len(wave_2))
+    spec_1 = _log_spectrogram(wave_1[:length])
+    spec_2 = _log_spectrogram(wave_2[:length])
+    return float(np.mean(np.sqrt(np.mean((spec_1 - spec_2) ** 2, axis=1))))
+
+
+def _compare_f0(
+    f0: NDArray[np.float64],
+    frame_period: float,
+    reference_f0: NDArray[np.float64],
+    reference_frame_period: float,
+) -> tuple[float, float]:
+    """基本周波数を基準のフレーム間隔へ間引いて比較し、誤差 [cent] と有声・無声の判定誤り率を得る。"""
+    step = round(frame_period / reference_frame_period)
+    reference_f0 = reference_f0[::step]
+    length = min(len(f0), len(reference_f0))
+    f0, reference_f0 = f0[:length], reference_f0[:length]
+
+    voiced = (f0 > 0) & (reference_f0 > 0)
+    voicing_error_rate = float(np.mean((f0 > 0) != (reference_f0 > 0)))
+    if not np.any(voiced):
+        return 0.0, voicing_error_rate
+    cent = 1200 * np.log2(f0[voiced] / reference_f0[voiced])
+    return float(np.sqrt(np.mean(cent**2))), voicing_error_rate
+
+
+def compare_morphing_analysis_modes(
+    text: str = _TEXT,
+) -> dict[MorphingAnalysisMode, _QualityReport]:
+    """分析方式ごとに、harvest による結果や元の音声と比較した品質指標を得る。"""
+    tts_engine = MockTTSEngine()
+    query = _generate_query(text)
+    fs = query.outputSamplingRate
+    base_wave = tts_engine.synthesize_wave(query, StyleId(0), True).astype(np.double)
+
+    reference_f0, _ = _estimate_f0(base_wave, fs, MorphingAnalysisMode.quality)
+    reference_param = synthesis_morphing_parameter(
+        tts_engine, query, StyleId(0), StyleId(1), True, MorphingAnalysisMode.quality
+    )
+    reference_morph = synthesize_morphed_wave(reference_param, 0.5, fs)
+
+    reports: dict[MorphingAnalysisMode, _QualityReport] = {}
+    for mode in MorphingAnalysisMode:
+        param = synthesis_morphing_parameter(
+            tts_engine, query, StyleId(0), StyleId(1), True, mode
+        )
+        f0, _ = _estimate_f0(base_wave, fs, mode)
+        f0_rmse_cent, voicing_error_rate = _compare_f0(
+            f0, param.frame_period, reference_f0, reference_param.frame_period
+        )
+        resynthesized = synthesize_morphed_wave(param, 0.0, fs).astype(np.double)
+        morphed = synthesize_morphed_wave(param, 0.5, fs).astype(np.double)
+        reports[mode] = _QualityReport(
+            f0_rmse_cent=f0_rmse_cent,
+            voicing_error_rate=voicing_error_rate,
+            resynthesis_lsd=_log_spectral_distance(base_wave, resynthesized),
+            morph_lsd=_log_spectral_distance(
+                reference_morph.astype(np.double), morphed
+            ),
+        )
+    return reports
+
+
+if __name__ == "__main__":
+    for mode, report in compare_morphing_analysis_modes().items():
+        print(f"{mode.value}:")
+        print(f"  基本周波数の誤差: {report.f0_rmse_cent:.2f} cent")
+        print(f"  有声・無声の判定誤り率: {report.voicing_error_rate:.4f}")
+        print(f"  再合成音声の対数スペクトル距離: {report.resynthesis_lsd:.3f} dB")
+        print(f"  モーフィング音声の対数スペクトル距離: {report.morph_lsd:.3f} dB")
@@ -40,6 +40,26 @@ def benchmark_get_speaker_info_all(
     return average_time
 
 
+def benchmark_post_morphable_targets_all(
+    server: ServerType, root_dir: Path | None = None
+) -> float:
+    """全ての喋れるスタイルをベースとした `POST /morphable_targets` にかかる時間を測定する。"""
+    client = generate_client(server, root_dir)
+
+    # style_id 一覧を準備
+    response = client.get("/speakers", params={})
+    assert response.status_code == 200
+    talk_characters = response.json()
+    style_ids = [style["id"] for c in talk_characters for style in c["styles"]]
+
+    def execute() -> None:
+        """計測対象となる処理を実行する"""
+        client.post("/morphable_targets", json=style_ids)
+
+    average_time = benchmark_time(execute, n_repeat=10)
+    return average_time
+
+
 def benchmark_request_time_for_all_talk_characters(
     server: ServerType, root_dir: Path | None = None
 ) -> float:
@@ -92,6 +112,17 @@ if __name__ == "__main__":
         f"全ての喋れるキャラクター `GET /speaker_info` localhost: {result_spk_infos_localhost} sec"
     )
 
+    result_morphable_fakeserve = benchmark_post_morphable_targets_all("fake", root_dir)
+    result_morphable_localhost = benchmark_post_morphable_targets_all(
+        "localhost", root_dir
+    )
+    print(
+        f"全ての喋れるスタイル `POST /morphable_targets` fakeserve: {result_morphable_fakeserve:.3f} sec"
+    )
+    print(
+        f"全ての喋れるスタイル `POST /morphable_targets` localhost: {result_morphable_localhost:.3f} sec"
+    )
+
     req_time_all_fake = benchmark_request_time_for_all_talk_characters("fake", root_dir)
     req_time_all_local = benchmark_request_time_for_all_talk_characters(
         "localhost", root_dir
@@ -0,0 +1,24 @@
+"""AquesTalk 風記法のパースにかかる時間の測定"""
+
+from test.benchmark.speed.utility import benchmark_time
+from voicevox_engine.tts_pipeline.kana_converter import parse_kana
+
+
+def benchmark_parse_kana(n_mora: int = 10000) -> float:
+    """`n_mora` モーラの長いアクセント句と、短いアクセント句の列からなる AquesTalk 風記法テキストのパースにかかる時間を測定する。"""
+    long_phrase = "キャ'" + "_シュ" * (n_mora - 1)
+    short_phrases = "/".join(["コ'ンニチワ", "ボイ'ス"] * (n_mora // 10))
+    text = long_phrase + "、" + short_phrases
+
+    def execute() -> None:
+        """計測対象となる処理を実行する"""
+        parse_kana(text)
+
+    average_time = benchmark_time(execute, n_repeat=10, sec_sleep=0.0)
+    return average_time
+
+
+if __name__ == "__main__":
+    # 実行コマンドは `python -m test.benchmark.speed.kana_parser` である。
+    result = benchmark_parse_kana()
+    print(f"AquesTalk 風記法のパース (10000 モーラ): {result:.4f} sec")
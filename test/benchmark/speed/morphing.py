@@ -0,0 +1,102 @@
+"""モーフィング用パラメータの生成にかかる時間と、モーフィングで確保されるメモリの測定"""
+
+import tracemalloc
+
+from test.benchmark.speed.synthesis import _generate_query
+from test.benchmark.speed.utility import benchmark_time
+from voicevox_engine.dev.tts_engine.mock import MockTTSEngine
+from voicevox_engine.metas.metas import StyleId
+from voicevox_engine.morphing.model import MorphingAnalysisMode
+from voicevox_engine.morphing.morphing import (
+    _synthesize_and_analyze,
+    synthesis_morphing_parameter,
+    synthesize_morphed_wave,
+)
+from voicevox_engine.morphing.parameter_cache import _count_parameter_bytes
+
+_MORPHING_TEXT = "こんにちは、音声合成の世界へようこそ。"
+
+
+def benchmark_morphing_parameter(
+    text: str = _MORPHING_TEXT,
+    analysis_mode: MorphingAnalysisMode = MorphingAnalysisMode.quality,
+) -> float:
+    """モーフィング用パラメータの生成にかかる時間を測定する。CPU が複数ある場合、ベースとターゲットの合成・分析は並行しておこなわれる。"""
+    tts_engine = MockTTSEngine()
+    query = _generate_query(text)
+
+    def execute() -> None:
+        """計測対象となる処理を実行する"""
+        synthesis_morphing_parameter(
+            tts_engine, query, StyleId(0), StyleId(1), True, analysis_mode
+        )
+
+    average_time = benchmark_time(execute, n_repeat=5, sec_sleep=0.0)
+    return average_time
+
+
+def benchmark_sequential_morphing_parameter(text: str = _MORPHING_TEXT) -> float:
+    """比較用に、ベースとターゲットの合成・分析を逐次おこなった場合にかかる時間を測定する。"""
+    import pyworld as pw
+
+    tts_engine = MockTTSEngine()
+    query = _generate_query(text)
+
+    def execute() -> None:
+        """計測対象となる処理を実行する"""
+        wave, f0, time_axis, _ = _synthesize_and_analyze(
+            tts_engine, query, StyleId(0), True, MorphingAnalysisMode.quality
+        )
+        pw.d4c(wave, f0, time_axis, query.outputSamplingRate)
+        _synthesize_and_analyze(
+            tts_engine, query, StyleId(1), True, MorphingAnalysisMode.quality
+        )
+
+    average_time = benchmark_time(execute, n_repeat=5, sec_sleep=0.0)
+    return average_time
+
+
+def measure_morphing_peak_memory(
+    text: str = _MORPHING_TEXT,
+    analysis_mode: MorphingAnalysisMode = MorphingAnalysisMode.quality,
+) -> tuple[int, int]:
+    """
+    モーフィング 1 回で確保されるメモリの最大量と、モーフィング用パラメータのサイズを測定する。
+
+    Returns
+    -------
+    peak : int
+        モーフィング用パラメータの生成からモーフィングした音声の生成までに確保されるメモリの最大量 [byte]
+    param_nbytes : int
+        キャッシュに保持されるモーフィング用パラメータの配列の合計サイズ [byte]
+    """
+    tts_engine = MockTTSEngine()
+    query = _generate_query(text)
+    # 初回のみの確保を除外する
+    synthesis_morphing_parameter(
+        tts_engine, query, StyleId(0), StyleId(1), True, analysis_mode
+    )
+
+    tracemalloc.start()
+    try:
+        param = synthesis_morphing_parameter(
+            tts_engine, query, StyleId(0), StyleId(1), True, analysis_mode
+        )
+        synthesize_morphed_wave(param, 0.5, query.outputSamplingRate)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak, _count_parameter_bytes(param)
+
+
+if __name__ == "__main__":
+    # 実行コマンドは `python -m test.benchmark.speed.morphing` である。
+    result_parallel = benchmark_morphing_parameter()
+    result_sequential = benchmark_sequential_morphing_parameter()
+    result_fast = benchmark_morphing_parameter(analysis_mode=MorphingAnalysisMode.fast)
+    print(f"モーフィング用パラメータの生成（並行）: {result_parallel:.5f} sec")
+    print(f"モーフィング用パラメータの生成（逐次）: {result_sequential:.5f} sec")
+    print(f"モーフィング用パラメータの生成（fast）: {result_fast:.5f} sec")
+    peak, param_nbytes = measure_morphing_peak_memory()
+    print(f"モーフィングの最大メモリ確保量: {peak} byte")
+    print(f"モーフィング用パラメータのサイズ: {param_nbytes} byte")
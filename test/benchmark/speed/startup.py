@@ -0,0 +1,70 @@
+"""エンジンの起動にかかる時間の測定"""
+
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from urllib.error import URLError
+from urllib.request import urlopen
+
+from test.benchmark.speed.utility import benchmark_time
+
+_ROOT_DIR = Path(__file__).parents[3]
+
+
+def _find_free_port() -> int:
+    """空いている TCP ポート番号を取得する。"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+    return port
+
+
+def _start_and_stop_engine(extra_args: list[str], timeout: float) -> None:
+    """エンジンを起動し、`GET /version` へ応答できるようになった時点で停止する。"""
+    port = _find_free_port()
+    command = [sys.executable, "run.py", "--port", str(port), *extra_args]
+    process = subprocess.Popen(
+        command,
+        cwd=_ROOT_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError("エンジンが起動途中で終了しました。")
+            try:
+                with urlopen(f"http://127.0.0.1:{port}/version", timeout=1.0) as res:
+                    if res.status == 200:
+                        return
+            except URLError, ConnectionError, TimeoutError:
+                pass
+            time.sleep(0.05)
+        raise TimeoutError("エンジンの起動がタイムアウトしました。")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def benchmark_startup(
+    extra_args: list[str] | None = None, timeout: float = 120.0
+) -> float:
+    """エンジンのプロセス起動から `GET /version` へ応答できるまでにかかる時間を測定する。"""
+    if extra_args is None:
+        extra_args = ["--enable_mock"]
+
+    def execute() -> None:
+        """計測対象となる処理を実行する"""
+        _start_and_stop_engine(extra_args, timeout)
+
+    average_time = benchmark_time(execute, n_repeat=3)
+    return average_time
+
+
+if __name__ == "__main__":
+    # 実行コマンドは `python -m test.benchmark.speed.startup` である。
+    result = benchmark_startup()
+    print(f"エンジン起動 (モック): {result:.3f} sec")
@@ -0,0 +1,151 @@
+"""音声合成の内部処理にかかる時間の測定"""
+
+import tracemalloc
+from io import BytesIO
+
+import numpy as np
+import soundfile
+
+from test.benchmark.speed.text_analysis import BENCHMARK_TEXT
+from test.benchmark.speed.utility import benchmark_throughput, benchmark_time
+from voicevox_engine.dev.core.mock import MockCoreWrapper
+from voicevox_engine.metas.metas import StyleId
+from voicevox_engine.model import AudioQuery
+from voicevox_engine.tts_pipeline.tts_engine import (
+    TTSEngine,
+    _apply_interrogative_upspeak,
+    _query_to_decoder_feature,
+)
+
+
+def _generate_query(text: str) -> AudioQuery:
+    """モックコアを用いてベンチマーク用の音声合成用クエリを生成する。"""
+    tts_engine = TTSEngine(MockCoreWrapper())
+    accent_phrases = tts_engine.create_accent_phrases(
+        text, StyleId(1), enable_katakana_english=False
+    )
+    return AudioQuery(
+        accent_phrases=accent_phrases,
+        speedScale=1.0,
+        pitchScale=0.0,
+        intonationScale=1.0,
+        volumeScale=1.0,
+        prePhonemeLength=0.1,
+        postPhonemeLength=0.1,
+        pauseLength=None,
+        pauseLengthScale=1.0,
+        outputSamplingRate=24000,
+        outputStereo=False,
+    )
+
+
+def benchmark_decoder_feature(text: str = BENCHMARK_TEXT) -> float:
+    """音声合成用のクエリからデコーダー入力特徴量を構築する処理にかかる時間を測定する。"""
+    query = _generate_query(text)
+
+    def execute() -> None:
+        """計測対象となる処理を実行する"""
+        _query_to_decoder_feature(query)
+
+    average_time = benchmark_time(execute, n_repeat=100, sec_sleep=0.0)
+    return average_time
+
+
+def benchmark_decoder_feature_throughput(text: str = BENCHMARK_TEXT) -> float:
+    """複数のスレッドから並行してデコーダー入力特徴量を構築した場合の、1 秒あたりの処理回数を測定する。"""
+    query = _generate_query(text)
+
+    def execute() -> None:
+        """計測対象となる処理を実行する"""
+        _query_to_decoder_feature(query)
+
+    return benchmark_throughput(execute)
+
+
+def _prepare_query_for_synthesis(query: AudioQuery) -> None:
+    """`TTSEngine.synthesize_wave()` と同様に、引数のクエリを変更せずにデコーダー入力特徴量を構築する。"""
+    upspoken_query = query.model_copy(
+        update={
+            "accent_phrases": _apply_interrogative_upspeak(query.accent_phrases, True)
+        }
+    )
+    _query_to_decoder_feature(upspoken_query)
+
+
+def benchmark_query_preparation(text: str = BENCHMARK_TEXT) -> float:
+    """音声合成時に、音声合成用のクエリからデコーダー入力特徴量を構築するまでの処理にかかる時間を測定する。"""
+    query = _generate_query(text)
+
+    def execute() -> None:
+        """計測対象となる処理を実行する"""
+        _prepare_query_for_synthesis(query)
+
+    average_time = benchmark_time(execute, n_repeat=100, sec_sleep=0.0)
+    return average_time
+
+
+def measure_query_preparation_allocation(text: str = BENCHMARK_TEXT) -> int:
+    """音声合成時に、音声合成用のクエリからデコーダー入力特徴量を構築するまでの処理で確保されるメモリの最大量 [byte] を測定する。"""
+    query = _generate_query(text)
+    _prepare_query_for_synthesis(query)  # 初回のみの確保を除外する
+
+    tracemalloc.start()
+    try:
+        _prepare_query_for_synthesis(query)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def benchmark_wave_encoding(
+    sec_wave: float = 10.0, sampling_rate: int = 24000
+) -> float:
+    """音声波形を WAV 形式へエンコードする処理にかかる時間を測定する。"""
+    rng = np.random.default_rng(0)
+    n_sample = int(sec_wave * sampling_rate)
+    wave = rng.uniform(-0.5, 0.5, n_sample).astype(np.float32)
+
+    def execute() -> None:
+        """計測対象となる処理を実行する"""
+        with BytesIO() as f:
+            soundfile.write(file=f, data=wave, samplerate=sampling_rate, format="WAV")
+
+    average_time = benchmark_time(execute, n_repeat=100, sec_sleep=0.0)
+    return average_time
+
+
+def benchmark_wave_encoding_throughput(
+    sec_wave: float = 10.0, sampling_rate: int = 24000
+) -> float:
+    """複数のスレッドから並行して音声波形を WAV 形式へエンコードした場合の、1 秒あたりの処理回数を測定する。"""
+    rng = np.random.default_rng(0)
+    n_sample = int(sec_wave * sampling_rate)
+    wave = rng.uniform(-0.5, 0.5, n_sample).astype(np.float32)
+
+    def execute() -> None:
+        """計測対象となる処理を実行する"""
+        with BytesIO() as f:
+            soundfile.write(file=f, data=wave, samplerate=sampling_rate, format="WAV")
+
+    return benchmark_throughput(execute)
+
+
+if __name__ == "__main__":
+    # 実行コマンドは `python -m test.benchmark.speed.synthesis` である。
+    result_feature = benchmark_decoder_feature()
+    result_preparation = benchmark_query_preparation()
+    result_allocation = measure_query_preparation_allocation()
+    result_encoding = benchmark_wave_encoding()
+    result_feature_throughput = benchmark_decoder_feature_throughput()
+    result_encoding_throughput = benchmark_wave_encoding_throughput()
+    print(f"デコーダー入力特徴量の構築: {result_feature:.5f} sec")
+    print(f"合成時のクエリの前処理: {result_preparation:.5f} sec")
+    print(f"合成時のクエリの前処理の最大メモリ確保量: {result_allocation} byte")
+    print(f"WAV エンコード (10 sec): {result_encoding:.5f} sec")
+    print(
+        f"デコーダー入力特徴量の構築のスループット: {result_feature_throughput:.2f} /sec"
+    )
+    print(
+        f"WAV エンコード (10 sec) のスループット: {result_encoding_throughput:.2f} /sec"
+    )
@@ -0,0 +1,51 @@
+"""テキスト解析にかかる時間の測定"""
+
+from test.benchmark.speed.utility import benchmark_throughput, benchmark_time
+from voicevox_engine.tts_pipeline.njd_feature_processor import (
+    text_to_full_context_labels,
+)
+from voicevox_engine.tts_pipeline.text_analyzer import (
+    full_context_labels_to_accent_phrases,
+)
+
+BENCHMARK_TEXT = (
+    "こんにちは、音声合成の世界へようこそ。"
+    "吾輩は猫である。名前はまだ無い。どこで生れたかとんと見当がつかぬ。"
+    "何でも薄暗いじめじめした所でニャーニャー泣いていた事だけは記憶している。"
+    "VOICEVOXは無料で使える中品質なテキスト読み上げソフトウェアです。"
+)
+
+
+def benchmark_text_analysis(text: str = BENCHMARK_TEXT) -> float:
+    """テキストからアクセント句系列を生成するテキスト解析にかかる時間を測定する。"""
+
+    def execute() -> None:
+        """計測対象となる処理を実行する"""
+        full_context_labels = text_to_full_context_labels(
+            text, enable_katakana_english=True
+        )
+        full_context_labels_to_accent_phrases(full_context_labels)
+
+    average_time = benchmark_time(execute, n_repeat=10, sec_sleep=0.0)
+    return average_time
+
+
+def benchmark_text_analysis_throughput(text: str = BENCHMARK_TEXT) -> float:
+    """複数のスレッドから並行してテキスト解析をおこなった場合の、1 秒あたりの処理回数を測定する。"""
+
+    def execute() -> None:
+        """計測対象となる処理を実行する"""
+        full_context_labels = text_to_full_context_labels(
+            text, enable_katakana_english=True
+        )
+        full_context_labels_to_accent_phrases(full_context_labels)
+
+    return benchmark_throughput(execute)
+
+
+if __name__ == "__main__":
+    # 実行コマンドは `python -m test.benchmark.speed.text_analysis` である。
+    result = benchmark_text_analysis()
+    result_throughput = benchmark_text_analysis_throughput()
+    print(f"テキスト解析: {result:.4f} sec")
+    print(f"テキスト解析のスループット: {result_throughput:.2f} /sec")
@@ -0,0 +1,73 @@
+"""ユーザー辞書の処理にかかる時間の測定"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from uuid import uuid4
+
+from test.benchmark.speed.utility import benchmark_time
+from voicevox_engine.user_dict.user_dict_manager import UserDictionary
+from voicevox_engine.user_dict.user_dict_word import WordProperty, create_word
+
+
+def _generate_user_dict(tmp_dir: str, n_word: int) -> tuple[UserDictionary, str]:
+    """`n_word` 語を含むユーザー辞書と、その単語のうち 1 つの UUID を生成する。"""
+    user_dict = UserDictionary(user_dict_path=Path(tmp_dir) / "user_dict.json")
+    words = {
+        str(uuid4()): create_word(
+            WordProperty(
+                surface=f"ベンチマーク{i}",
+                pronunciation="ベンチマーク",
+                accent_type=1,
+            )
+        )
+        for i in range(n_word)
+    }
+    user_dict.import_user_dict(words)
+    return user_dict, next(iter(words))
+
+
+def benchmark_user_dict_compile(n_word: int = 1000) -> float:
+    """`n_word` 語を含むユーザー辞書の単語を 1 つ書き換え、OpenJTalk 用にコンパイルして読み込む処理にかかる時間を測定する。"""
+    with TemporaryDirectory() as tmp_dir:
+        user_dict, word_uuid = _generate_user_dict(tmp_dir, n_word)
+        n_execution = 0
+
+        def execute() -> None:
+            """計測対象となる処理を実行する"""
+            # NOTE: コンパイル済み辞書のキャッシュが使われないよう、毎回異なる内容の辞書とする
+            nonlocal n_execution
+            n_execution += 1
+            user_dict.rewrite_word(
+                word_uuid,
+                WordProperty(
+                    surface=f"コンパイル{n_execution}",
+                    pronunciation="コンパイル",
+                    accent_type=1,
+                ),
+            )
+
+        average_time = benchmark_time(execute, n_repeat=10, sec_sleep=0.0)
+    return average_time
+
+
+def benchmark_user_dict_load_cached(n_word: int = 1000) -> float:
+    """`n_word` 語を含むユーザー辞書を、コンパイル済み辞書のキャッシュから読み込む処理にかかる時間を測定する。"""
+    with TemporaryDirectory() as tmp_dir:
+        user_dict, _ = _generate_user_dict(tmp_dir, n_word)
+
+        def execute() -> None:
+            """計測対象となる処理を実行する"""
+            user_dict.update_dict()
+
+        average_time = benchmark_time(execute, n_repeat=10, sec_sleep=0.0)
+    return average_time
+
+
+if __name__ == "__main__":
+    # 実行コマンドは `python -m test.benchmark.speed.user_dict` である。
+    result_compile = benchmark_user_dict_compile()
+    result_load_cached = benchmark_user_dict_load_cached()
+    print(f"ユーザー辞書のコンパイル (1000 語): {result_compile:.4f} sec")
+    print(
+        f"ユーザー辞書のキャッシュからの読み込み (1000 語): {result_load_cached:.4f} sec"
+    )
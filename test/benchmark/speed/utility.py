@@ -1,5 +1,6 @@
 """速度ベンチマーク用のユーティリティ"""
 
+import threading
 import time
 from collections.abc import Callable
 
@@ -17,3 +18,36 @@ def benchmark_time(
         time.sleep(sec_sleep)
     average = sum(scores) / len(scores)
     return average
+
+
+def benchmark_throughput(
+    target_function: Callable[[], None], n_thread: int = 4, sec_duration: float = 2.0
+) -> float:
+    """
+    対象関数を `n_thread` 個のスレッドから繰り返し実行し、一定時間内に完了した 1 秒あたりの実行回数を計測する。
+
+    各スレッドは計測時間の終了後に実行中の呼び出しを完了させ、その呼び出しも回数と経過時間に含める。
+    """
+    n_completed = 0
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(n_thread + 1)
+    deadline = 0.0
+
+    def worker() -> None:
+        nonlocal n_completed
+        start_barrier.wait()
+        while time.perf_counter() < deadline:
+            target_function()
+            with lock:
+                n_completed += 1
+
+    threads = [threading.Thread(target=worker) for _ in range(n_thread)]
+    for thread in threads:
+        thread.start()
+    start = time.perf_counter()
+    deadline = start + sec_duration
+    start_barrier.wait()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return n_completed / elapsed
@@ -0,0 +1,68 @@
+"""/editing_sessions API のテスト。"""
+
+from fastapi.testclient import TestClient
+
+from test.e2e.single_api.utils import gen_mora
+
+
+def _gen_query() -> dict[str, object]:
+    return {
+        "accent_phrases": [
+            {
+                "moras": [
+                    gen_mora("テ", "t", 2.3, "e", 0.8, 3.3),
+                    gen_mora("ス", "s", 2.1, "U", 0.3, 0.0),
+                    gen_mora("ト", "t", 2.3, "o", 1.8, 4.1),
+                ],
+                "accent": 1,
+                "pause_mora": None,
+                "is_interrogative": False,
+            }
+        ],
+        "speedScale": 1.0,
+        "pitchScale": 0.0,
+        "intonationScale": 1.0,
+        "volumeScale": 1.0,
+        "prePhonemeLength": 0.1,
+        "postPhonemeLength": 0.1,
+        "outputSamplingRate": 24000,
+        "outputStereo": False,
+    }
+
+
+def test_editing_session(client: TestClient) -> None:
+    response = client.post("/editing_sessions", json=_gen_query())
+    assert response.status_code == 200
+    session_id = response.json()
+
+    response = client.patch(
+        f"/editing_sessions/{session_id}",
+        json=[{"path": "/accent_phrases/0/moras/0/pitch", "value": 5.0}],
+    )
+    assert response.status_code == 200
+    assert response.json() == [
+        {"path": "/accent_phrases/0/moras/0/pitch", "value": 5.0}
+    ]
+
+    response = client.get(f"/editing_sessions/{session_id}")
+    assert response.status_code == 200
+    assert response.json()["accent_phrases"][0]["moras"][0]["pitch"] == 5.0
+
+    response = client.post(
+        f"/editing_sessions/{session_id}/synthesis", params={"speaker": 0}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "audio/wav"
+
+    response = client.delete(f"/editing_sessions/{session_id}")
+    assert response.status_code == 204
+    assert client.get(f"/editing_sessions/{session_id}").status_code == 404
+
+
+def test_patch_editing_session_422(client: TestClient) -> None:
+    session_id = client.post("/editing_sessions", json=_gen_query()).json()
+    response = client.patch(
+        f"/editing_sessions/{session_id}",
+        json=[{"path": "/accent_phrases/0/accent", "value": 4}],
+    )
+    assert response.status_code == 422
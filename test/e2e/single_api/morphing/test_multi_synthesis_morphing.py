@@ -0,0 +1,84 @@
+"""/multi_synthesis_morphing API のテスト。"""
+
+import io
+import zipfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+from test.e2e.single_api.utils import gen_mora
+
+
+def test_post_multi_synthesis_morphing_200(client: TestClient) -> None:
+    query = {
+        "accent_phrases": [
+            {
+                "moras": [
+                    gen_mora("テ", "t", 2.3, "e", 0.8, 3.3),
+                    gen_mora("ス", "s", 2.1, "U", 0.3, 0.0),
+                    gen_mora("ト", "t", 2.3, "o", 1.8, 4.1),
+                ],
+                "accent": 1,
+                "pause_mora": None,
+                "is_interrogative": False,
+            }
+        ],
+        "speedScale": 1.0,
+        "pitchScale": 1.0,
+        "intonationScale": 1.0,
+        "volumeScale": 1.0,
+        "prePhonemeLength": 0.1,
+        "postPhonemeLength": 0.1,
+        "pauseLength": None,
+        "pauseLengthScale": 1.0,
+        "outputSamplingRate": 24000,
+        "outputStereo": False,
+        "kana": "テ'_スト",
+    }
+    response = client.post(
+        "/multi_synthesis_morphing",
+        params={
+            "base_speaker": 0,
+            "target_speaker": 0,
+            "morph_rates": [0.0, 0.5, 1.0],
+        },
+        json=query,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    with zipfile.ZipFile(io.BytesIO(response.content)) as zip_file:
+        assert zip_file.namelist() == ["001.wav", "002.wav", "003.wav"]
+
+
+@pytest.mark.parametrize(
+    "morph_rates",
+    [
+        [0.5, 100],  # 範囲外の割合
+        [0.5] * 33,  # 割合の数が上限を超える
+    ],
+)
+def test_post_multi_synthesis_morphing_422(
+    client: TestClient, morph_rates: list[float]
+) -> None:
+    query = {
+        "accent_phrases": [
+            {
+                "moras": [gen_mora("テ", "t", 2.3, "e", 0.8, 3.3)],
+                "accent": 1,
+            }
+        ],
+        "speedScale": 1.0,
+        "pitchScale": 1.0,
+        "intonationScale": 1.0,
+        "volumeScale": 1.0,
+        "prePhonemeLength": 0.1,
+        "postPhonemeLength": 0.1,
+        "outputSamplingRate": 24000,
+        "outputStereo": False,
+    }
+    response = client.post(
+        "/multi_synthesis_morphing",
+        params={"base_speaker": 0, "target_speaker": 0, "morph_rates": morph_rates},
+        json=query,
+    )
+    assert response.status_code == 422
@@ -0,0 +1,72 @@
+"""/import_user_dict_file API のテスト。"""
+
+import json
+
+from fastapi.testclient import TestClient
+
+
+def test_post_import_user_dict_file_csv(client: TestClient) -> None:
+    csv_text = (
+        "ｔｅｓｔ４,1348,1348,8609,名詞,固有名詞,一般,*,*,*,*,テストヨン,テストヨン,1/5,*\n"
+        "ｔｅｓｔ５,1345,1345,5746,名詞,一般,*,*,*,*,*,テストゴ,テストゴ,0/4,*\n"
+    )
+    response = client.post(
+        "/import_user_dict_file",
+        content=csv_text.encode("utf-8"),
+        params={"file_format": "csv", "override": True},
+    )
+    assert response.status_code == 204
+
+    # NOTE: 'GET /user_dict' が正しく機能することを前提とする
+    surfaces = {word["surface"] for word in client.get("/user_dict").json().values()}
+    assert {"ｔｅｓｔ４", "ｔｅｓｔ５"} <= surfaces
+
+
+def test_post_import_user_dict_file_ndjson(client: TestClient) -> None:
+    word = {
+        "accent_associative_rule": "*",
+        "accent_type": 1,
+        "context_id": 1348,
+        "inflectional_form": "*",
+        "inflectional_type": "*",
+        "part_of_speech": "名詞",
+        "part_of_speech_detail_1": "固有名詞",
+        "part_of_speech_detail_2": "一般",
+        "part_of_speech_detail_3": "*",
+        "priority": 4,
+        "pronunciation": "テストロク",
+        "stem": "*",
+        "surface": "ｔｅｓｔ６",
+        "yomi": "テストロク",
+    }
+    ndjson_text = (
+        json.dumps({"a66696ad-caa8-4f4e-8eb3-3d2261c798fd": word}, ensure_ascii=False)
+        + "\n"
+    )
+    response = client.post(
+        "/import_user_dict_file",
+        content=ndjson_text.encode("utf-8"),
+        params={"file_format": "ndjson", "override": True},
+    )
+    assert response.status_code == 204
+
+    user_dict = client.get("/user_dict").json()
+    assert user_dict["a66696ad-caa8-4f4e-8eb3-3d2261c798fd"]["surface"] == "ｔｅｓｔ６"
+
+
+def test_post_import_user_dict_file_422(client: TestClient) -> None:
+    csv_text = (
+        "ｔｅｓｔ７,1348,1348,8609,名詞,固有名詞,一般,*,*,*,*,テストナナ,テストナナ,1/5,*\n"
+        "ｔｅｓｔ８,2,2,8609,フィラー,*,*,*,*,*,*,テストハチ,テストハチ,1/5,*\n"
+    )
+    user_dict_before = client.get("/user_dict").json()
+
+    # 不正な行を含む場合は辞書を変更せず、不正な行を報告する
+    response = client.post(
+        "/import_user_dict_file",
+        content=csv_text.encode("utf-8"),
+        params={"file_format": "csv", "override": True},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"].startswith("2行目")
+    assert client.get("/user_dict").json() == user_dict_before
@@ -0,0 +1,44 @@
+"""/user_dict_operations API のテスト。"""
+
+from fastapi.testclient import TestClient
+
+
+def test_post_user_dict_operations_200(client: TestClient) -> None:
+    operations = [
+        {"type": "add", "surface": "test", "pronunciation": "テスト", "accent_type": 1},
+        {
+            "type": "update",
+            "word_uuid": "a89596ad-caa8-4f4e-8eb3-3d2261c798fd",
+            "surface": "test3",
+            "pronunciation": "テストサン",
+            "accent_type": 1,
+        },
+        {"type": "delete", "word_uuid": "c89596ad-caa8-4f4e-8eb3-3d2261c798fd"},
+    ]
+    response = client.post("/user_dict_operations", json=operations)
+    assert response.status_code == 200
+    word_uuids = response.json()
+    assert word_uuids[1:] == [
+        "a89596ad-caa8-4f4e-8eb3-3d2261c798fd",
+        "c89596ad-caa8-4f4e-8eb3-3d2261c798fd",
+    ]
+
+    user_dict = client.get("/user_dict").json()
+    assert user_dict.keys() == {word_uuids[0], word_uuids[1]}
+    assert user_dict[word_uuids[0]]["surface"] == "ｔｅｓｔ"
+    assert user_dict[word_uuids[1]]["surface"] == "ｔｅｓｔ３"
+
+
+def test_post_user_dict_operations_422(client: TestClient) -> None:
+    operations = [
+        {"type": "add", "surface": "test", "pronunciation": "テスト", "accent_type": 1},
+        {"type": "delete", "word_uuid": "00000000-0000-4000-8000-000000000000"},
+        {"type": "add", "surface": "test", "pronunciation": "てすと", "accent_type": 1},
+    ]
+    user_dict_before = client.get("/user_dict").json()
+
+    # 不正な操作を含む場合は辞書を変更せず、不正な操作を報告する
+    response = client.post("/user_dict_operations", json=operations)
+    assert response.status_code == 422
+    assert [error["index"] for error in response.json()["detail"]] == [1, 2]
+    assert client.get("/user_dict").json() == user_dict_before
@@ -40,6 +40,8 @@ def test_disable_mutable_api(app_params: dict[str, Any]) -> None:
     _assert_request_and_response_403(client, "put", "/user_dict_word/dummy")
     _assert_request_and_response_403(client, "delete", "/user_dict_word/dummy")
     _assert_request_and_response_403(client, "post", "/import_user_dict")
+    _assert_request_and_response_403(client, "post", "/import_user_dict_file")
+    _assert_request_and_response_403(client, "post", "/user_dict_operations")
     _assert_request_and_response_403(client, "post", "/setting")
 
     # FIXME: EngineManifestをDI可能にし、EngineManifestに従ってこれらのAPIを加える
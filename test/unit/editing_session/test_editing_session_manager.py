@@ -0,0 +1,221 @@
+"""編集セッション管理の単体テスト。"""
+
+import time
+
+import pytest
+
+from voicevox_engine.editing_session.editing_session_manager import (
+    EditingSessionInputError,
+    EditingSessionManager,
+    EditingSessionNotFoundError,
+)
+from voicevox_engine.editing_session.model import AudioQueryDelta
+from voicevox_engine.model import AudioQuery
+from voicevox_engine.tts_pipeline.model import AccentPhrase, Mora
+
+
+def _gen_query() -> AudioQuery:
+    moras = [
+        Mora(
+            text="テ",
+            consonant="t",
+            consonant_length=0.1,
+            vowel="e",
+            vowel_length=0.2,
+            pitch=5.0,
+        ),
+        Mora(
+            text="ス",
+            consonant="s",
+            consonant_length=0.1,
+            vowel="U",
+            vowel_length=0.1,
+            pitch=0.0,
+        ),
+        Mora(
+            text="ト",
+            consonant="t",
+            consonant_length=0.1,
+            vowel="o",
+            vowel_length=0.2,
+            pitch=5.5,
+        ),
+    ]
+    return AudioQuery(
+        accent_phrases=[AccentPhrase(moras=moras, accent=1)],
+        speedScale=1.0,
+        pitchScale=0.0,
+        intonationScale=1.0,
+        volumeScale=1.0,
+        prePhonemeLength=0.1,
+        postPhonemeLength=0.1,
+        outputSamplingRate=24000,
+        outputStereo=False,
+    )
+
+
+def test_apply_deltas() -> None:
+    """`EditingSessionManager.apply_deltas()` は変更を適用し、実際に変化した値のみを返す。"""
+    # Inputs
+    manager = EditingSessionManager()
+    session_id = manager.create_session(_gen_query())
+    deltas = [
+        AudioQueryDelta(path="/accent_phrases/0/moras/2/pitch", value=6.0),
+        AudioQueryDelta(path="/accent_phrases/0/moras/0/vowel_length", value=0.2),
+        AudioQueryDelta(path="/speedScale", value=1.5),
+    ]
+    # Expects
+    true_changes = [
+        AudioQueryDelta(path="/accent_phrases/0/moras/2/pitch", value=6.0),
+        AudioQueryDelta(path="/speedScale", value=1.5),
+    ]
+    # Outputs
+    changes = manager.apply_deltas(session_id, deltas)
+    query = manager.get_query(session_id)
+    # Test
+    assert changes == true_changes
+    assert query.accent_phrases[0].moras[2].pitch == 6.0
+    assert query.speedScale == 1.5
+
+
+def test_read_query() -> None:
+    """`EditingSessionManager.read_query()` は複製せずに保持しているクエリを読み取らせる。"""
+    # Inputs
+    manager = EditingSessionManager()
+    session_id = manager.create_session(_gen_query())
+    manager.apply_deltas(session_id, [AudioQueryDelta(path="/speedScale", value=1.5)])
+    # Outputs
+    first = manager.read_query(session_id, lambda query: query)
+    second = manager.read_query(session_id, lambda query: query)
+    # Test
+    assert first is second
+    assert first.speedScale == 1.5
+
+
+def test_apply_deltas_update_pitch() -> None:
+    """`EditingSessionManager.apply_deltas()` はアクセント位置が変化した場合に音高を生成し直し、変化した音高を返す。"""
+    # Inputs
+    manager = EditingSessionManager()
+    session_id = manager.create_session(_gen_query())
+
+    def update_pitch(accent_phrases: list[AccentPhrase]) -> list[AccentPhrase]:
+        for accent_phrase in accent_phrases:
+            accent_phrase.moras[accent_phrase.accent - 1].pitch = 6.5
+        return accent_phrases
+
+    # Outputs
+    changes = manager.apply_deltas(
+        session_id,
+        [AudioQueryDelta(path="/accent_phrases/0/accent", value=3)],
+        update_pitch,
+    )
+    # Test
+    assert changes == [
+        AudioQueryDelta(path="/accent_phrases/0/accent", value=3),
+        AudioQueryDelta(path="/accent_phrases/0/moras/2/pitch", value=6.5),
+    ]
+
+
+def test_apply_deltas_update_pitch_only_changed_accent_phrases() -> None:
+    """`EditingSessionManager.apply_deltas()` はアクセント位置が変化していないアクセント句の音高を書き換えない。"""
+    # Inputs
+    query = _gen_query()
+    query.accent_phrases.append(query.accent_phrases[0].model_copy(deep=True))
+    manager = EditingSessionManager()
+    session_id = manager.create_session(query)
+    # 別のアクセント句の音高を手で編集しておく
+    manager.apply_deltas(
+        session_id,
+        [AudioQueryDelta(path="/accent_phrases/1/moras/0/pitch", value=6.0)],
+    )
+
+    def update_pitch(accent_phrases: list[AccentPhrase]) -> list[AccentPhrase]:
+        for accent_phrase in accent_phrases:
+            for mora in accent_phrase.moras:
+                mora.pitch = 4.0
+        return accent_phrases
+
+    # Outputs
+    changes = manager.apply_deltas(
+        session_id,
+        [AudioQueryDelta(path="/accent_phrases/0/accent", value=3)],
+        update_pitch,
+    )
+    query = manager.get_query(session_id)
+    # Test
+    assert changes == [
+        AudioQueryDelta(path="/accent_phrases/0/accent", value=3),
+        AudioQueryDelta(path="/accent_phrases/0/moras/0/pitch", value=4.0),
+        AudioQueryDelta(path="/accent_phrases/0/moras/1/pitch", value=4.0),
+        AudioQueryDelta(path="/accent_phrases/0/moras/2/pitch", value=4.0),
+    ]
+    assert [mora.pitch for mora in query.accent_phrases[1].moras] == [6.0, 0.0, 5.5]
+
+
+def test_apply_deltas_update_pitch_error() -> None:
+    """`EditingSessionManager.apply_deltas()` は音高の生成に失敗した場合、どの変更も適用しない。"""
+    # Inputs
+    manager = EditingSessionManager()
+    session_id = manager.create_session(_gen_query())
+
+    def update_pitch(accent_phrases: list[AccentPhrase]) -> list[AccentPhrase]:
+        raise RuntimeError("音高の生成に失敗しました")
+
+    # Test
+    with pytest.raises(RuntimeError):
+        manager.apply_deltas(
+            session_id,
+            [
+                AudioQueryDelta(path="/speedScale", value=2.0),
+                AudioQueryDelta(path="/accent_phrases/0/accent", value=3),
+            ],
+            update_pitch,
+        )
+    assert manager.get_query(session_id) == _gen_query()
+
+
+@pytest.mark.parametrize(
+    "delta",
+    [
+        AudioQueryDelta(path="/accent_phrases/1/accent", value=1),
+        AudioQueryDelta(path="/accent_phrases/0/accent", value=4),
+        AudioQueryDelta(path="/accent_phrases/0/moras/0/text", value=1),
+        AudioQueryDelta(path="/accent_phrases/0/pause_mora/vowel_length", value=0.1),
+        AudioQueryDelta(path="/outputSamplingRate", value=0.5),
+    ],
+)
+def test_apply_deltas_invalid(delta: AudioQueryDelta) -> None:
+    """`EditingSessionManager.apply_deltas()` は不正な変更を含む場合、どの変更も適用しない。"""
+    # Inputs
+    manager = EditingSessionManager()
+    session_id = manager.create_session(_gen_query())
+    valid_delta = AudioQueryDelta(path="/speedScale", value=2.0)
+    # Test
+    with pytest.raises(EditingSessionInputError):
+        manager.apply_deltas(session_id, [valid_delta, delta])
+    assert manager.get_query(session_id) == _gen_query()
+
+
+def test_session_expires() -> None:
+    """一定時間操作の無い編集セッションは破棄される。"""
+    # Inputs
+    manager = EditingSessionManager(ttl=0.01)
+    session_id = manager.create_session(_gen_query())
+    time.sleep(0.02)
+    # Test
+    with pytest.raises(EditingSessionNotFoundError):
+        manager.get_query(session_id)
+
+
+def test_session_evicted_over_max_sessions() -> None:
+    """最大数を超えた場合、最も長く使われていない編集セッションから破棄される。"""
+    # Inputs
+    manager = EditingSessionManager(max_sessions=2)
+    first_id = manager.create_session(_gen_query())
+    second_id = manager.create_session(_gen_query())
+    manager.get_query(first_id)
+    manager.create_session(_gen_query())
+    # Test
+    manager.get_query(first_id)
+    with pytest.raises(EditingSessionNotFoundError):
+        manager.get_query(second_id)
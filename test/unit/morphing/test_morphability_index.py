@@ -0,0 +1,109 @@
+"""モーフィング可否の索引の単体テスト。"""
+
+from typing import Literal
+from unittest.mock import MagicMock
+
+import pytest
+
+from voicevox_engine.metas.metas import (
+    SpeakerStyle,
+    SpeakerSupportedFeatures,
+    StyleId,
+)
+from voicevox_engine.metas.metas_store import Character
+from voicevox_engine.morphing.morphing import (
+    MorphabilityIndex,
+    MorphabilityIndexStore,
+    StyleIdNotFoundError,
+)
+
+
+def _gen_character(
+    uuid: str,
+    talk_style_ids: list[int],
+    sing_style_ids: list[int],
+    permitted_synthesis_morphing: Literal["ALL", "SELF_ONLY", "NOTHING"],
+) -> Character:
+    return Character(
+        name="",
+        uuid=uuid,
+        talk_styles=[
+            SpeakerStyle(name="", id=StyleId(i), type="talk") for i in talk_style_ids
+        ],
+        sing_styles=[
+            SpeakerStyle(name="", id=StyleId(i), type="sing") for i in sing_style_ids
+        ],
+        version="",
+        supported_features=SpeakerSupportedFeatures(
+            permitted_synthesis_morphing=permitted_synthesis_morphing
+        ),
+    )
+
+
+_CHARACTERS = [
+    _gen_character("all_1", [0, 1], [6000], "ALL"),
+    _gen_character("all_2", [2], [], "ALL"),
+    _gen_character("self_only", [3, 4], [], "SELF_ONLY"),
+    _gen_character("nothing", [5], [], "NOTHING"),
+]
+
+
+def test_is_morphable() -> None:
+    """`MorphabilityIndex.is_morphable()` はキャラクターの許可設定とスタイルの種類に従って判定する。"""
+    # Inputs
+    index = MorphabilityIndex(_CHARACTERS)
+    # Test
+    assert index.is_morphable(StyleId(0), StyleId(1))
+    assert index.is_morphable(StyleId(0), StyleId(2))
+    assert not index.is_morphable(StyleId(0), StyleId(6000))
+    assert index.is_morphable(StyleId(3), StyleId(4))
+    assert not index.is_morphable(StyleId(3), StyleId(0))
+    assert not index.is_morphable(StyleId(5), StyleId(5))
+    with pytest.raises(StyleIdNotFoundError):
+        index.is_morphable(StyleId(0), StyleId(100))
+
+
+def test_morphable_targets() -> None:
+    """`MorphabilityIndex.morphable_targets()` はベーススタイルごとに全スタイルの可否を返す。"""
+    # Inputs
+    index = MorphabilityIndex(_CHARACTERS)
+    # Outputs
+    targets = index.morphable_targets([StyleId(0), StyleId(3)])
+    # Test
+    assert len(targets) == 2
+    assert list(targets[0].keys()) == [0, 1, 6000, 2, 3, 4, 5]
+    assert [t.is_morphable for t in targets[0].values()] == [
+        True,
+        True,
+        False,
+        True,
+        False,
+        False,
+        False,
+    ]
+    assert [t.is_morphable for t in targets[1].values()] == [
+        False,
+        False,
+        False,
+        False,
+        True,
+        True,
+        False,
+    ]
+
+
+def test_store_reuses_index_until_cleared() -> None:
+    """`MorphabilityIndexStore` はコアバージョンごとに索引を一度だけ構築し、`clear()` 後に構築し直す。"""
+    # Inputs
+    get_characters = MagicMock(return_value=_CHARACTERS)
+    store = MorphabilityIndexStore(get_characters)
+    # Outputs
+    first = store.get("0.0.0")
+    second = store.get("0.0.0")
+    store.get("0.0.1")
+    store.clear()
+    third = store.get("0.0.0")
+    # Test
+    assert first is second
+    assert first is not third
+    assert get_characters.call_count == 3
@@ -0,0 +1,53 @@
+"""モーフィングの単体テスト。"""
+
+import numpy as np
+
+from voicevox_engine.morphing.morphing import (
+    _MorphingParameter,
+    synthesize_morphed_wave,
+    synthesize_morphed_wave_chunks,
+)
+
+
+def _gen_param(n_frame: int) -> _MorphingParameter:
+    """一定の音高・平坦なスペクトル包絡をもつモーフィング用パラメータを生成する。"""
+    n_bin = 1024 // 2 + 1  # 24000 Hz における WORLD の FFT 長に対応するビン数
+    return _MorphingParameter(
+        fs=24000,
+        frame_period=5.0,
+        base_f0=np.full(n_frame, 150.0, dtype=np.float64),
+        base_aperiodicity=np.full((n_frame, n_bin), 0.1, dtype=np.float32),
+        base_spectrogram=np.full((n_frame, n_bin), 1e-4, dtype=np.float32),
+        target_spectrogram=np.full((n_frame, n_bin), 2e-4, dtype=np.float32),
+    )
+
+
+def test_synthesize_morphed_wave_chunks_single_chunk() -> None:
+    """区間が全体より長い場合、`synthesize_morphed_wave_chunks()` は一括合成と同じ音声を生成する。"""
+    # Inputs
+    param = _gen_param(100)
+    # Expects
+    expected = synthesize_morphed_wave(param, 0.5, 24000)
+    # Outputs
+    chunks = list(synthesize_morphed_wave_chunks(param, 0.5, 24000, chunk_frames=200))
+    # Test
+    assert len(chunks) == 1
+    assert np.array_equal(chunks[0], expected)
+
+
+def test_synthesize_morphed_wave_chunks_multiple_chunks() -> None:
+    """`synthesize_morphed_wave_chunks()` が区間ごとに生成した音声は、連結すると一括合成と同じ長さになる。"""
+    # Inputs
+    param = _gen_param(400)
+    # Expects
+    expected = synthesize_morphed_wave(param, 0.5, 24000, output_stereo=True)
+    # Outputs
+    chunks = list(
+        synthesize_morphed_wave_chunks(
+            param, 0.5, 24000, output_stereo=True, chunk_frames=64
+        )
+    )
+    result = np.concatenate(chunks)
+    # Test
+    assert len(chunks) == 7
+    assert result.shape == expected.shape
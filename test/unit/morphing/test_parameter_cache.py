@@ -0,0 +1,133 @@
+"""モーフィング用パラメータのキャッシュの単体テスト。"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from voicevox_engine.metas.metas import StyleId
+from voicevox_engine.model import AudioQuery
+from voicevox_engine.morphing.model import MorphingAnalysisMode
+from voicevox_engine.morphing.morphing import _MorphingParameter
+from voicevox_engine.morphing.parameter_cache import (
+    MorphingParameterCache,
+    MorphingParameterKey,
+    digest_query,
+)
+
+
+def _gen_param(n_frame: int) -> _MorphingParameter:
+    """1 フレームあたり 1000 byte のモーフィング用パラメータを生成する。"""
+    return _MorphingParameter(
+        fs=24000,
+        frame_period=1.0,
+        base_f0=np.zeros(n_frame, dtype=np.float64),
+        base_aperiodicity=np.zeros((n_frame, 82), dtype=np.float32),
+        base_spectrogram=np.zeros((n_frame, 83), dtype=np.float32),
+        target_spectrogram=np.zeros((n_frame, 83), dtype=np.float32),
+    )
+
+
+def _gen_key(base_style_id: int) -> MorphingParameterKey:
+    return (
+        "digest",
+        StyleId(base_style_id),
+        StyleId(0),
+        True,
+        "0.0.0",
+        MorphingAnalysisMode.quality,
+    )
+
+
+def _gen_query(output_sampling_rate: int, volume_scale: float) -> AudioQuery:
+    return AudioQuery(
+        accent_phrases=[],
+        speedScale=1.0,
+        pitchScale=0.0,
+        intonationScale=1.0,
+        volumeScale=volume_scale,
+        prePhonemeLength=0.1,
+        postPhonemeLength=0.1,
+        outputSamplingRate=output_sampling_rate,
+        outputStereo=False,
+    )
+
+
+def test_get_or_create_reuses_parameter() -> None:
+    """`MorphingParameterCache.get_or_create()` は同じキーに対してパラメータを生成し直さない。"""
+    # Inputs
+    cache = MorphingParameterCache()
+    create = MagicMock(return_value=_gen_param(10))
+    # Outputs
+    first = cache.get_or_create(_gen_key(1), create)
+    second = cache.get_or_create(_gen_key(1), create)
+    # Test
+    assert first is second
+    assert create.call_count == 1
+    assert cache.nbytes == 10 * 1000
+
+
+def test_get_or_create_evicts_over_max_bytes() -> None:
+    """合計サイズが上限を超える場合、最も長く使われていないパラメータから破棄される。"""
+    # Inputs
+    cache = MorphingParameterCache(max_bytes=25 * 1000)
+    cache.get_or_create(_gen_key(1), lambda: _gen_param(10))
+    cache.get_or_create(_gen_key(2), lambda: _gen_param(10))
+    cache.get_or_create(_gen_key(1), lambda: _gen_param(10))
+    cache.get_or_create(_gen_key(3), lambda: _gen_param(10))
+    create = MagicMock(return_value=_gen_param(10))
+    # Outputs
+    cache.get_or_create(_gen_key(1), create)
+    cache.get_or_create(_gen_key(2), create)
+    # Test
+    assert create.call_count == 1
+    assert cache.nbytes == 20 * 1000
+
+
+def test_get_or_create_does_not_keep_too_large_parameter() -> None:
+    """上限を単独で超えるパラメータは保持されない。"""
+    # Inputs
+    cache = MorphingParameterCache(max_bytes=5 * 1000)
+    # Outputs
+    cache.get_or_create(_gen_key(1), lambda: _gen_param(10))
+    # Test
+    assert cache.nbytes == 0
+
+
+def test_get_or_create_deduplicates_concurrent_creation() -> None:
+    """`MorphingParameterCache.get_or_create()` は同じキーの並行した要求に対してパラメータを 1 度だけ生成する。"""
+    # Inputs
+    cache = MorphingParameterCache()
+    started = threading.Event()
+    release = threading.Event()
+    param = _gen_param(10)
+
+    def create() -> _MorphingParameter:
+        started.set()
+        release.wait()
+        return param
+
+    mock_create = MagicMock(side_effect=create)
+    # Outputs
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        first = executor.submit(cache.get_or_create, _gen_key(1), mock_create)
+        started.wait()
+        others = [
+            executor.submit(cache.get_or_create, _gen_key(1), mock_create)
+            for _ in range(3)
+        ]
+        time.sleep(0.1)  # 後着の要求が生成の完了を待ち始めるまで待つ
+        release.set()
+        results = [first.result()] + [other.result() for other in others]
+    # Test
+    assert all(result is param for result in results)
+    assert mock_create.call_count == 1
+
+
+def test_digest_query() -> None:
+    """クエリのダイジェストは出力設定の違いを無視し、合成結果に影響する値の違いを区別する。"""
+    # Test
+    assert digest_query(_gen_query(24000, 1.0)) == digest_query(_gen_query(48000, 1.0))
+    assert digest_query(_gen_query(24000, 1.0)) != digest_query(_gen_query(24000, 1.5))
@@ -89,3 +89,37 @@ def test_without_filemap() -> None:
     # 登録されていないハッシュが渡された場合エラー
     with pytest.raises(ResourceManagerError):
         manager.resource_path("NOT_EXIST_HASH")
+
+
+def test_base64_is_cached(tmp_path: Path) -> None:
+    """一度 base64 文字列に変換したリソースは、ファイルを読み直さずに返される。"""
+    # Inputs
+    resource_path = tmp_path / "dummy.wav"
+    resource_path.write_bytes(b"before")
+    manager = ResourceManager(True)
+    manager.register_dir(tmp_path)
+    # Expects
+    true_str = _b64encode_str(b"before")
+    # Outputs
+    manager.resource_str(resource_path, "base64")
+    resource_path.write_bytes(b"after")
+    result_str = manager.resource_str(resource_path, "base64")
+    # Test
+    assert result_str == true_str
+
+
+def test_base64_over_max_cache_bytes_is_not_cached(tmp_path: Path) -> None:
+    """キャッシュの上限を超える base64 文字列は保持されない。"""
+    # Inputs
+    resource_path = tmp_path / "dummy.wav"
+    resource_path.write_bytes(b"before")
+    manager = ResourceManager(True, max_base64_cache_bytes=4)
+    manager.register_dir(tmp_path)
+    # Expects
+    true_str = _b64encode_str(b"after")
+    # Outputs
+    manager.resource_str(resource_path, "base64")
+    resource_path.write_bytes(b"after")
+    result_str = manager.resource_str(resource_path, "base64")
+    # Test
+    assert result_str == true_str
@@ -3,6 +3,7 @@
 
 from pathlib import Path
 
+from voicevox_engine.morphing.model import MorphingAnalysisMode
 from voicevox_engine.setting.model import CorsPolicyMode
 from voicevox_engine.setting.setting_manager import Setting, SettingHandler
 
@@ -61,6 +62,23 @@ def test_setting_handler_load_exist_file_3() -> None:
     assert true_setting == setting
 
 
+def test_setting_handler_load_exist_file_4() -> None:
+    """`SettingHandler` に設定ファイルのパスを渡すとその値を読み込む。"""
+    # Inputs
+    setting_path = Path("test/unit/setting/setting-test-load-4.yaml")
+    setting_loader = SettingHandler(setting_path)
+    # Expects
+    true_setting = Setting(
+        cors_policy_mode=CorsPolicyMode.localapps,
+        allow_origin=None,
+        morphing_analysis_mode=MorphingAnalysisMode.fast,
+    )
+    # Outputs
+    setting = setting_loader.load()
+    # Test
+    assert true_setting == setting
+
+
 def test_setting_handler_save(tmp_path: Path) -> None:
     """`SettingHandler.save()` で設定値を保存できる。"""
     # Inputs
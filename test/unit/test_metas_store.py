@@ -1,8 +1,18 @@
 """キャラクターメタ情報の単体テスト。"""
 # TODO: モジュール/ファイル名とモジュール docstring の一貫性を検証
 
+import json
 import uuid
+from pathlib import Path
+from unittest.mock import MagicMock
 
+import pytest
+
+from voicevox_engine.core.core_adapter import (
+    CoreCharacter,
+    CoreCharacterStyle,
+    CoreStyleId,
+)
 from voicevox_engine.metas.metas import (
     SpeakerStyle,
     SpeakerSupportedFeatures,
@@ -13,8 +23,12 @@ from voicevox_engine.metas.metas_store import (
     _SING_STYLE_TYPES,
     _TALK_STYLE_TYPES,
     Character,
+    CharacterInfoNotFoundError,
+    MetasStore,
+    _index_character_directory,
     filter_characters_and_styles,
 )
+from voicevox_engine.resource_manager import ResourceManager
 
 
 def _gen_character(style_types: list[StyleType]) -> Character:
@@ -97,3 +111,143 @@ def test_filter_characters_and_styles_with_sing() -> None:
     for character in result:
         for style in character.talk_styles + character.sing_styles:
             assert style.type in ["singing_teacher", "frame_decode", "sing"]
+
+
+def test_filter_characters_and_styles_does_not_modify_input() -> None:
+    """`filter_characters_and_styles()` は引数のキャラクターを変更しない。"""
+    # Inputs
+    allstyle = _gen_character(["talk", "sing"])
+
+    # Outputs
+    filter_characters_and_styles([allstyle], "talk")
+    filter_characters_and_styles([allstyle], "sing")
+
+    # Tests
+    assert len(allstyle.talk_styles) == 1
+    assert len(allstyle.sing_styles) == 1
+
+
+def test_metas_store_catalogue_is_cached_until_cleared(tmp_path: Path) -> None:
+    """`MetasStore.catalogue()` はスナップショットを使い回し、`clear_cache()` 後に生成し直す。"""
+    # Inputs
+    character_uuid = str(uuid.uuid4())
+    (tmp_path / character_uuid).mkdir()
+    (tmp_path / character_uuid / "metas.json").write_text("{}", encoding="utf-8")
+    get_core_characters = MagicMock(
+        return_value=[
+            CoreCharacter(
+                name="テスト",
+                speaker_uuid=character_uuid,
+                styles=[
+                    CoreCharacterStyle(name="ノーマル", id=CoreStyleId(0)),
+                    CoreCharacterStyle(
+                        name="ソング", id=CoreStyleId(6000), type="sing"
+                    ),
+                ],
+                version="0.0.1",
+            )
+        ]
+    )
+    metas_store = MetasStore(tmp_path, get_core_characters, ResourceManager(False))
+
+    # Outputs
+    first = metas_store.catalogue(None)
+    second = metas_store.catalogue(None)
+    metas_store.clear_cache()
+    third = metas_store.catalogue(None)
+
+    # Tests
+    assert first is second
+    assert first is not third
+    assert get_core_characters.call_count == 2
+    assert [c.uuid for c in first.talk_characters] == [character_uuid]
+    assert first.talk_characters[0].sing_styles == []
+    assert first.sing_characters[0].talk_styles == []
+    talk_speakers = json.loads(first.talk_speakers_json)
+    assert [s["speaker_uuid"] for s in talk_speakers] == [character_uuid]
+    assert [style["id"] for style in talk_speakers[0]["styles"]] == [0]
+
+
+def _gen_character_info_dir(
+    character_path: Path, with_policy: bool, portrait_style_ids: list[int]
+) -> None:
+    """スタイル ID 0 と 1 をもつキャラクターの情報ディレクトリを生成する。"""
+    (character_path / "icons").mkdir(parents=True)
+    (character_path / "portraits").mkdir()
+    (character_path / "voice_samples").mkdir()
+    (character_path / "metas.json").write_text("{}", encoding="utf-8")
+    if with_policy:
+        (character_path / "policy.md").write_text("利用規約", encoding="utf-8")
+    (character_path / "portrait.png").write_bytes(b"portrait")
+    for style_id in [0, 1]:
+        (character_path / "icons" / f"{style_id}.png").write_bytes(b"icon")
+        for i in range(1, 4):
+            voice_sample_path = (
+                character_path / "voice_samples" / f"{style_id}_00{i}.wav"
+            )
+            voice_sample_path.write_bytes(b"voice")
+    for style_id in portrait_style_ids:
+        (character_path / "portraits" / f"{style_id}.png").write_bytes(b"portrait")
+
+
+def _gen_metas_store(engine_characters_path: Path, character_uuid: str) -> MetasStore:
+    get_core_characters = MagicMock(
+        return_value=[
+            CoreCharacter(
+                name="テスト",
+                speaker_uuid=character_uuid,
+                styles=[
+                    CoreCharacterStyle(name="ノーマル", id=CoreStyleId(0)),
+                    CoreCharacterStyle(name="あまあま", id=CoreStyleId(1)),
+                ],
+                version="0.0.1",
+            )
+        ]
+    )
+    resource_manager = ResourceManager(True)
+    resource_manager.register_dir(engine_characters_path)
+    return MetasStore(engine_characters_path, get_core_characters, resource_manager)
+
+
+def test_index_character_directory(tmp_path: Path) -> None:
+    """`_index_character_directory()` は利用規約と立ち絵の存在するスタイル ID を索引する。"""
+    # Inputs
+    _gen_character_info_dir(tmp_path, with_policy=True, portrait_style_ids=[1])
+    (tmp_path / "portraits" / "README.txt").write_text("", encoding="utf-8")
+    # Outputs
+    character_dir = _index_character_directory(tmp_path)
+    # Tests
+    assert character_dir.policy == "利用規約"
+    assert character_dir.portrait_style_ids == {StyleId(1)}
+
+
+def test_character_info_without_policy(tmp_path: Path) -> None:
+    """`MetasStore.character_info()` は利用規約が存在しない場合にエラーを送出する。"""
+    # Inputs
+    character_uuid = str(uuid.uuid4())
+    _gen_character_info_dir(
+        tmp_path / character_uuid, with_policy=False, portrait_style_ids=[0, 1]
+    )
+    metas_store = _gen_metas_store(tmp_path, character_uuid)
+    # Tests
+    with pytest.raises(CharacterInfoNotFoundError):
+        metas_store.character_info(character_uuid, "talk", None, "", "base64")
+
+
+def test_character_info_without_style_portrait(tmp_path: Path) -> None:
+    """`MetasStore.character_info()` は立ち絵の存在しないスタイルの立ち絵を None とする。"""
+    # Inputs
+    character_uuid = str(uuid.uuid4())
+    _gen_character_info_dir(
+        tmp_path / character_uuid, with_policy=True, portrait_style_ids=[1]
+    )
+    metas_store = _gen_metas_store(tmp_path, character_uuid)
+    # Outputs
+    character_info = metas_store.character_info(
+        character_uuid, "talk", None, "", "base64"
+    )
+    # Tests
+    assert character_info.policy == "利用規約"
+    assert [style_info.id for style_info in character_info.style_infos] == [0, 1]
+    assert character_info.style_infos[0].portrait is None
+    assert character_info.style_infos[1].portrait is not None
@@ -0,0 +1,148 @@
+"""`run_benchmarks.py` のテスト"""
+
+import dataclasses
+from pathlib import Path
+
+from tools.run_benchmarks import (
+    _BenchmarkEnvironment,
+    _BenchmarkReport,
+    _BenchmarkResult,
+    _detect_regressions,
+    _dump_report,
+    _environment_differences,
+    _load_report,
+    _missing_baselines,
+)
+
+
+def _gen_environment() -> _BenchmarkEnvironment:
+    return _BenchmarkEnvironment(
+        python_version="3.14.0",
+        python_implementation="CPython",
+        gil_enabled=True,
+        platform="Linux-6.8.0-x86_64-with-glibc2.39",
+        machine="x86_64",
+        cpu_count=8,
+    )
+
+
+def test_detect_regressions_within_tolerance() -> None:
+    """許容幅内の変動は性能劣化として検出されない。"""
+    # Inputs
+    baseline = {"a": _BenchmarkResult(latency=1.0, throughput=1.0)}
+    results = {"a": _BenchmarkResult(latency=1.1, throughput=1 / 1.1)}
+    # Outputs
+    regressions = _detect_regressions(
+        results, baseline, latency_tolerance=0.2, throughput_tolerance=0.2
+    )
+
+    # Test
+    assert regressions == []
+
+
+def test_detect_regressions_latency_and_throughput() -> None:
+    """レイテンシの増加とスループットの減少をそれぞれ検出できる。"""
+    # Inputs
+    baseline = {
+        "slow": _BenchmarkResult(latency=1.0, throughput=100.0),
+        "low_throughput": _BenchmarkResult(latency=1.0, throughput=100.0),
+    }
+    results = {
+        "slow": _BenchmarkResult(latency=1.5, throughput=100.0),
+        "low_throughput": _BenchmarkResult(latency=1.0, throughput=50.0),
+    }
+    # Outputs
+    regressions = _detect_regressions(
+        results, baseline, latency_tolerance=0.2, throughput_tolerance=0.2
+    )
+
+    # Test
+    assert len(regressions) == 2
+    assert regressions[0].startswith("slow: latency")
+    assert regressions[1].startswith("low_throughput: throughput")
+
+
+def test_detect_regressions_without_throughput() -> None:
+    """スループットを計測していないベンチマークはレイテンシのみ比較される。"""
+    # Inputs
+    baseline = {
+        "a": _BenchmarkResult(latency=1.0, throughput=100.0),
+        "b": _BenchmarkResult(latency=1.0),
+    }
+    results = {
+        "a": _BenchmarkResult(latency=1.0),
+        "b": _BenchmarkResult(latency=1.0, throughput=1.0),
+    }
+    # Outputs
+    regressions = _detect_regressions(
+        results, baseline, latency_tolerance=0.2, throughput_tolerance=0.2
+    )
+
+    # Test
+    assert regressions == []
+
+
+def test_detect_regressions_without_baseline() -> None:
+    """ベースラインに存在しないベンチマークは比較されない。"""
+    # Inputs
+    results = {"new": _BenchmarkResult(latency=100.0, throughput=0.01)}
+    # Outputs
+    regressions = _detect_regressions(
+        results, {}, latency_tolerance=0.2, throughput_tolerance=0.2
+    )
+
+    # Test
+    assert regressions == []
+
+
+def test_missing_baselines() -> None:
+    """ベースラインに存在しないベンチマークを検出できる。"""
+    # Inputs
+    baseline = {"a": _BenchmarkResult(latency=1.0, throughput=1.0)}
+    results = {
+        "a": _BenchmarkResult(latency=1.0, throughput=1.0),
+        "b": _BenchmarkResult(latency=1.0, throughput=1.0),
+    }
+    # Outputs
+    missing_names = _missing_baselines(results, baseline)
+
+    # Test
+    assert missing_names == ["b"]
+
+
+def test_environment_differences() -> None:
+    """性能に影響する計測環境の差異のみを検出できる。"""
+    # Inputs
+    baseline_environment = _gen_environment()
+    environment = dataclasses.replace(
+        baseline_environment,
+        python_version="3.13.5",
+        platform="Linux-6.18.0-x86_64-with-glibc2.41",
+        cpu_count=1,
+    )
+    # Outputs
+    differences = _environment_differences(environment, baseline_environment)
+
+    # Test
+    assert differences == [
+        "python_version: 3.13.5 (baseline 3.14.0)",
+        "cpu_count: 1 (baseline 8)",
+    ]
+
+
+def test_report_round_trip(tmp_path: Path) -> None:
+    """計測環境と計測結果を JSON として保存・読み込みできる。"""
+    # Inputs
+    report = _BenchmarkReport(
+        environment=_gen_environment(),
+        results={
+            "a": _BenchmarkResult(latency=0.5, throughput=2.0),
+            "b": _BenchmarkResult(latency=0.5),
+        },
+    )
+    path = tmp_path / "report.json"
+    # Outputs
+    path.write_text(_dump_report(report), encoding="utf-8")
+
+    # Test
+    assert _load_report(path) == report
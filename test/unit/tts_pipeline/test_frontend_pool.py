@@ -0,0 +1,114 @@
+"""テキスト解析プールの単体テスト。"""
+
+from pathlib import Path
+
+import pytest
+
+from voicevox_engine.tts_pipeline.frontend_pool import (
+    TextFrontendPool,
+    _from_compact_accent_phrase,
+    _to_compact_accent_phrase,
+)
+from voicevox_engine.tts_pipeline.katakana_english import get_conversion_cache_info
+from voicevox_engine.tts_pipeline.model import AccentPhrase
+from voicevox_engine.tts_pipeline.njd_feature_processor import (
+    text_to_full_context_labels,
+)
+from voicevox_engine.tts_pipeline.text_analyzer import (
+    full_context_labels_to_accent_phrases,
+)
+from voicevox_engine.user_dict.user_dict_manager import UserDictionary
+from voicevox_engine.user_dict.user_dict_word import WordProperty
+
+
+def _analyze_locally(text: str) -> list[AccentPhrase]:
+    full_context_labels = text_to_full_context_labels(
+        text, enable_katakana_english=False
+    )
+    return full_context_labels_to_accent_phrases(full_context_labels)
+
+
+def test_compact_accent_phrase_round_trip() -> None:
+    """アクセント句はプロセス間でやり取りする形式を経由しても変化しない。"""
+    # Inputs
+    accent_phrases = _analyze_locally("こんにちは、今日はいい天気ですね？")
+    # Outputs
+    round_tripped = [
+        _from_compact_accent_phrase(_to_compact_accent_phrase(ap))
+        for ap in accent_phrases
+    ]
+    # Test
+    assert round_tripped == accent_phrases
+
+
+def test_text_to_accent_phrases(tmp_path: Path) -> None:
+    """`TextFrontendPool.text_to_accent_phrases()` はユーザー辞書の更新を反映し、プロセス内の解析と同じ結果を返す。"""
+    # Inputs
+    user_dict = UserDictionary(user_dict_path=tmp_path / "user_dict.json")
+    text = "ボイボ寮で暮らしています。"
+    pool = TextFrontendPool(1, user_dict)
+    try:
+        # Expects
+        true_accent_phrases_before = _analyze_locally(text)
+        # Outputs
+        accent_phrases_before = pool.text_to_accent_phrases(text, False)
+
+        user_dict.apply_word(
+            WordProperty(
+                surface="ボイボ寮", pronunciation="ボイボリョウ", accent_type=4
+            )
+        )
+        # Expects
+        true_accent_phrases_after = _analyze_locally(text)
+        # Outputs
+        accent_phrases_after = pool.text_to_accent_phrases(text, False)
+    finally:
+        pool.shutdown()
+
+    # Test
+    assert accent_phrases_before == true_accent_phrases_before
+    assert accent_phrases_after == true_accent_phrases_after
+    assert accent_phrases_after != accent_phrases_before
+
+
+def test_text_to_accent_phrases_dict_load_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """ワーカープロセスがユーザー辞書を読み込めない場合、`TextFrontendPool.text_to_accent_phrases()` はプロセス内の解析結果を返す。"""
+    # Inputs
+    user_dict = UserDictionary(user_dict_path=tmp_path / "user_dict.json")
+    monkeypatch.setattr(
+        UserDictionary,
+        "loaded_dict_paths",
+        property(lambda _: [tmp_path / "missing.dic"]),
+    )
+    text = "ボイボ寮で暮らしています。"
+    pool = TextFrontendPool(1, user_dict)
+    try:
+        # Expects
+        true_accent_phrases = _analyze_locally(text)
+        # Outputs
+        accent_phrases = pool.text_to_accent_phrases(text, False)
+    finally:
+        pool.shutdown()
+
+    # Test
+    assert accent_phrases == true_accent_phrases
+
+
+def test_preload_english_words_in_workers(tmp_path: Path) -> None:
+    """`TextFrontendPool` は各ワーカープロセスの起動時に英単語のカタカナ読みを事前生成する。"""
+    # Inputs
+    user_dict = UserDictionary(user_dict_path=tmp_path / "user_dict.json")
+    english_words = ["voicevox\n", "engine\n", "日本語\n"]
+    pool = TextFrontendPool(1, user_dict, english_words)
+    try:
+        # Outputs
+        cache_info = pool._executor.submit(get_conversion_cache_info).result()
+    finally:
+        pool.shutdown()
+
+    # Test
+    assert cache_info.size == 2
+    assert cache_info.hits == 0
+    assert cache_info.misses == 0
@@ -0,0 +1,95 @@
+"""差分合成の単体テスト。"""
+
+import numpy as np
+from numpy.typing import NDArray
+
+from voicevox_engine.metas.metas import StyleId
+from voicevox_engine.tts_pipeline.incremental_synthesis import decode_incrementally
+
+
+def _gen_feature(n_frame: int) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
+    """フレームごとに音素と音高が変化する特徴量を生成する。"""
+    phoneme = np.zeros((n_frame, 4), dtype=np.float32)
+    phoneme[np.arange(n_frame), np.arange(n_frame) % 4] = 1
+    f0 = np.linspace(5.0, 6.0, n_frame, dtype=np.float32)
+    return phoneme, f0
+
+
+class _FrameLocalDecoder:
+    """フレームごとに独立に波形を生成するデコーダー。呼び出されたフレーム長を記録する。"""
+
+    def __init__(self) -> None:
+        self.decoded_lengths: list[int] = []
+
+    def __call__(
+        self, phoneme: NDArray[np.float32], f0: NDArray[np.float32]
+    ) -> tuple[NDArray[np.float32], int]:
+        self.decoded_lengths.append(f0.shape[0])
+        frame_values = f0 * (np.argmax(phoneme, axis=1) + 1)
+        return np.repeat(frame_values, 256).astype(np.float32), 24000
+
+
+def test_decode_incrementally_equals_full_decode() -> None:
+    """`decode_incrementally()` は変化した区間のみを波形生成し、全体を波形生成した結果と一致する。"""
+    # Inputs
+    decoder = _FrameLocalDecoder()
+    phoneme, f0 = _gen_feature(200)
+    previous = decode_incrementally(None, phoneme, f0, StyleId(0), decoder)
+    new_phoneme, new_f0 = phoneme.copy(), f0.copy()
+    new_f0[100:110] += 1.0
+    decoder.decoded_lengths.clear()
+
+    # Expects
+    true_wave, _ = _FrameLocalDecoder()(new_phoneme, new_f0)
+    # Outputs
+    decoded = decode_incrementally(previous, new_phoneme, new_f0, StyleId(0), decoder)
+
+    # Test
+    np.testing.assert_allclose(decoded.raw_wave, true_wave, rtol=1e-6)
+    assert decoder.decoded_lengths == [10 + 16 * 2]
+
+
+def test_decode_incrementally_with_length_change() -> None:
+    """`decode_incrementally()` は区間が挿入されフレーム長が変わった場合も、全体を波形生成した結果と一致する。"""
+    # Inputs
+    decoder = _FrameLocalDecoder()
+    phoneme, f0 = _gen_feature(200)
+    previous = decode_incrementally(None, phoneme, f0, StyleId(0), decoder)
+    inserted_phoneme, inserted_f0 = _gen_feature(7)
+    new_phoneme = np.concatenate([phoneme[:50], inserted_phoneme, phoneme[50:]])
+    new_f0 = np.concatenate([f0[:50], inserted_f0 + 3.0, f0[50:]])
+
+    # Expects
+    true_wave, _ = _FrameLocalDecoder()(new_phoneme, new_f0)
+    # Outputs
+    decoded = decode_incrementally(previous, new_phoneme, new_f0, StyleId(0), decoder)
+
+    # Test
+    np.testing.assert_allclose(decoded.raw_wave, true_wave, rtol=1e-6)
+
+
+def test_decode_incrementally_without_change() -> None:
+    """`decode_incrementally()` は特徴量が変化していない場合、波形生成せずに前回の波形を返す。"""
+    # Inputs
+    decoder = _FrameLocalDecoder()
+    phoneme, f0 = _gen_feature(200)
+    previous = decode_incrementally(None, phoneme, f0, StyleId(0), decoder)
+    decoder.decoded_lengths.clear()
+    # Outputs
+    decoded = decode_incrementally(previous, phoneme, f0, StyleId(0), decoder)
+    # Test
+    assert decoded.raw_wave is previous.raw_wave
+    assert decoder.decoded_lengths == []
+
+
+def test_decode_incrementally_with_other_style() -> None:
+    """`decode_incrementally()` はスタイルが変わった場合、全体を波形生成する。"""
+    # Inputs
+    decoder = _FrameLocalDecoder()
+    phoneme, f0 = _gen_feature(200)
+    previous = decode_incrementally(None, phoneme, f0, StyleId(0), decoder)
+    decoder.decoded_lengths.clear()
+    # Outputs
+    decode_incrementally(previous, phoneme, f0, StyleId(1), decoder)
+    # Test
+    assert decoder.decoded_lengths == [200]
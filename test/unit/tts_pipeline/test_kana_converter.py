@@ -56,6 +56,21 @@ def test_unvoice() -> None:
     assert parse_kana("_ス'")[0].moras[0].vowel == "U"
 
 
+def test_long_phrase() -> None:
+    """長いアクセント句もモーラ数の上限なくパースできる。"""
+    # Inputs
+    n_mora = 10000
+    text = "キャ'" + "_シュ" * (n_mora - 1)
+    # Outputs
+    accent_phrases = parse_kana(text)
+
+    # Test
+    assert len(accent_phrases) == 1
+    assert len(accent_phrases[0].moras) == n_mora
+    assert accent_phrases[0].moras[0].text == "キャ"
+    assert accent_phrases[0].moras[-1].vowel == "U"
+
+
 def test_roundtrip() -> None:
     for text in [
         "コンニチワ'",
@@ -575,6 +590,11 @@ class _TestParseKanaException(TestCase):
             kana_converter.parse_kana("ア？ア'")
         assert e.value.errcode == ParseKanaErrorCode.INTERROGATION_MARK_NOT_AT_END
 
+        with pytest.raises(ParseKanaError) as e:
+            parse_kana("アひら'がな")
+        assert e.value.errcode == ParseKanaErrorCode.UNKNOWN_TEXT
+        assert e.value.kwargs == {"text": "ひら"}
+
 
 def test_create_kana_interrogative() -> None:
     def koreha_arimasuka_accent_phrases() -> list[AccentPhrase]:
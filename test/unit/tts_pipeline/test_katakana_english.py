@@ -7,8 +7,11 @@ from voicevox_engine.tts_pipeline.katakana_english import (
     _convert_as_char_wise_katakana,
     _should_convert_english_to_katakana,
     _split_into_words,
+    clear_conversion_cache,
     convert_english_to_katakana,
+    get_conversion_cache_info,
     is_hankaku_alphabet,
+    preload_english_words,
 )
 
 
@@ -75,3 +78,19 @@ def test_convert_english_to_katakana() -> None:
     expected_pron = "ヴォイヴォ"
 
     assert expected_pron == pron
+
+
+def test_convert_english_to_katakana_cache() -> None:
+    """`convert_english_to_katakana` は事前生成した読みをキャッシュから返す。"""
+    # inputs
+    clear_conversion_cache()
+    n_word = preload_english_words(["Voivo\n", "ボイボ\n", "\n"])
+    # outputs
+    pron = convert_english_to_katakana(HankakuAlphabet("Voivo"))
+    cache_info = get_conversion_cache_info()
+    # tests
+    assert n_word == 1
+    assert pron == "ヴォイヴォ"
+    # 事前生成による変換は集計されない
+    assert (cache_info.hits, cache_info.misses, cache_info.size) == (1, 0, 1)
+    assert cache_info.hit_rate == 1.0
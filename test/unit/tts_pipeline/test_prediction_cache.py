@@ -0,0 +1,80 @@
+"""アクセント句ごとの推論結果のキャッシュの単体テスト。"""
+
+from voicevox_engine.metas.metas import StyleId
+from voicevox_engine.tts_pipeline.prediction_cache import PhrasePredictionCache
+
+
+def _predict_with_context(signatures: list[int]) -> list[tuple[int, ...]]:
+    """前後 2 個のアクセント句と系列の端に依存する推論を模擬する。"""
+    n_phrase = len(signatures)
+    results: list[tuple[int, ...]] = []
+    for i in range(n_phrase):
+        value = 0
+        for weight, j in enumerate(range(i - 2, i + 3), start=1):
+            value += weight * (signatures[j] if 0 <= j < n_phrase else 100)
+        results.append((value,))
+    return results
+
+
+def test_predict_equals_full_prediction() -> None:
+    """`PhrasePredictionCache.predict()` は編集のたびに系列全体を推論した結果と一致し、編集箇所の周辺のみを推論する。"""
+    # Inputs
+    cache = PhrasePredictionCache[int, int](max_size=1000, context_phrases=2)
+    signatures = list(range(20))
+    edits = [(5, 50), (19, 51), (0, 52), (10, 53)]
+    predicted_sizes: list[int] = []
+
+    def predict(start: int, end: int) -> list[tuple[int, ...]]:
+        predicted_sizes.append(end - start)
+        return _predict_with_context(signatures[start:end])
+
+    cache.predict(signatures, StyleId(0), predict)
+    predicted_sizes.clear()
+    for index, signature in edits:
+        signatures[index] = signature
+        # Expects
+        true_results = _predict_with_context(signatures)
+        # Outputs
+        results = cache.predict(signatures, StyleId(0), predict)
+        # Test
+        assert results == true_results
+
+    # 編集箇所と前後 2 個のアクセント句の文脈のみが推論される
+    assert max(predicted_sizes) <= 9
+    assert len(predicted_sizes) == len(edits)
+
+
+def test_predict_distinguishes_styles() -> None:
+    """`PhrasePredictionCache.predict()` はスタイルごとに推論結果を保持する。"""
+    # Inputs
+    cache = PhrasePredictionCache[int, int](max_size=1000)
+    signatures = [1, 2, 3]
+    # Outputs
+    results_0 = cache.predict(signatures, StyleId(0), lambda s, e: [(0,)] * (e - s))
+    results_1 = cache.predict(signatures, StyleId(1), lambda s, e: [(1,)] * (e - s))
+    # Test
+    assert results_0 == [(0,), (0,), (0,)]
+    assert results_1 == [(1,), (1,), (1,)]
+
+
+def test_predict_evicts_least_recently_used() -> None:
+    """`PhrasePredictionCache` は最大数を超えた場合、最も長く使われていない推論結果を破棄する。"""
+    # Inputs
+    cache = PhrasePredictionCache[int, int](max_size=2, context_phrases=0)
+    predicted: list[int] = []
+
+    def predict(signatures: list[int]) -> list[tuple[int, ...]]:
+        def _predict(start: int, end: int) -> list[tuple[int, ...]]:
+            predicted.extend(signatures[start:end])
+            return [(signature,) for signature in signatures[start:end]]
+
+        return cache.predict(signatures, StyleId(0), _predict)
+
+    predict([1, 2])
+    predict([1])
+    predict([3])
+    predicted.clear()
+    # Outputs
+    predict([1, 2, 3])
+    # Test
+    assert predicted == [2]
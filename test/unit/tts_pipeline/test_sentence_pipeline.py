@@ -0,0 +1,48 @@
+"""文ごとのパイプライン処理の単体テスト。"""
+
+import pytest
+
+from voicevox_engine.tts_pipeline.sentence_pipeline import (
+    run_two_stage_pipeline,
+    split_into_sentences,
+)
+
+
+@pytest.mark.parametrize(
+    ("text", "true_sentences"),
+    [
+        ("こんにちは", ["こんにちは"]),
+        ("こんにちは。元気ですか？", ["こんにちは。", "元気ですか？"]),
+        ("本当ですか！？はい。", ["本当ですか！？", "はい。"]),
+        ("「そうです。」と言った。", ["「そうです。」と言った。"]),
+        ("一行目\n\n二行目\n", ["一行目", "二行目"]),
+    ],
+)
+def test_split_into_sentences(text: str, true_sentences: list[str]) -> None:
+    """`split_into_sentences()` はテキストを文末記号と改行で文へ分割する。"""
+    # Outputs
+    sentences = split_into_sentences(text)
+    # Test
+    assert sentences == true_sentences
+
+
+def test_run_two_stage_pipeline() -> None:
+    """`run_two_stage_pipeline()` は各要素へ前段・後段を順に適用した結果を要素順に返す。"""
+    # Outputs
+    results = run_two_stage_pipeline(range(10), lambda x: x * 2, lambda x: x + 1)
+    # Test
+    assert results == [x * 2 + 1 for x in range(10)]
+
+
+def test_run_two_stage_pipeline_error() -> None:
+    """`run_two_stage_pipeline()` は前段で発生した例外を送出する。"""
+
+    # Inputs
+    def fail_on_three(x: int) -> int:
+        if x == 3:
+            raise ValueError("3 は処理できません")
+        return x
+
+    # Test
+    with pytest.raises(ValueError, match="3 は処理できません"):
+        run_two_stage_pipeline(range(10), fail_on_three, lambda x: x)
@@ -1,5 +1,6 @@
 """TTSEngine のテスト"""
 
+import copy
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -18,12 +19,16 @@ from voicevox_engine.tts_pipeline.model import (
     Note,
     Score,
 )
+from voicevox_engine.tts_pipeline.sentence_pipeline import (
+    SENTENCE_BOUNDARY_PAUSE_TEXT,
+)
 from voicevox_engine.tts_pipeline.song_engine import (
     SongEngine,
 )
 from voicevox_engine.tts_pipeline.tts_engine import (
     TTSEngine,
     _apply_interrogative_upspeak,
+    _query_to_moras,
     _to_flatten_phonemes,
     to_flatten_moras,
 )
@@ -275,6 +280,181 @@ def test_mocked_synthesize_wave_output(snapshot_json: SnapshotAssertion) -> None
     assert snapshot_json == summarize_big_ndarray(round_floats(result, round_value=2))
 
 
+def test_query_to_moras_copies_only_modified_moras() -> None:
+    """`_query_to_moras()` はクエリの設定により値が変わるモーラのみを複製し、クエリを変更しない。"""
+    # Inputs
+    query = _gen_hello_hiho_query()
+    query.speedScale = 1.0
+    query.pitchScale = 0.0
+    query.intonationScale = 1.0
+    query.pauseLength = None
+    query.pauseLengthScale = 0.5
+    # Expects
+    expected = query.model_copy(deep=True)
+    query_moras = to_flatten_moras(query.accent_phrases)
+    # Outputs
+    moras = _query_to_moras(query)
+    # Test
+    assert query == expected
+    # 前後無音を除くモーラのうち、無音時間スケールが適用される無音モーラのみが複製される
+    for query_mora, mora in zip(query_moras, moras[1:-1], strict=True):
+        assert (mora is query_mora) == (query_mora.vowel != "pau")
+    assert moras[6].vowel_length == 0.05
+
+
+def test_synthesize_wave_does_not_modify_query() -> None:
+    """`TTSEngine.synthesize_wave()` は引数の音声合成用のクエリを変更しない。"""
+    # Inputs
+    tts_engine = TTSEngine(MockCoreWrapper())
+    query = _gen_hello_hiho_query()
+    query.accent_phrases[-1].is_interrogative = True
+    # Expects
+    expected = query.model_copy(deep=True)
+    # Outputs
+    tts_engine.synthesize_wave(query, StyleId(1), enable_interrogative_upspeak=True)
+    tts_engine.synthesize_wave(
+        query,
+        StyleId(1),
+        enable_interrogative_upspeak=True,
+        enable_sentence_pipeline=True,
+    )
+    # Test
+    assert query == expected
+
+
+def test_create_accent_phrases_with_sentence_pipeline() -> None:
+    """文ごとのパイプライン処理で生成したアクセント句系列は、文の境界の無音のテキストを除き一括処理と同じ内容になる。"""
+    # Inputs
+    tts_engine = TTSEngine(MockCoreWrapper())
+    text = "こんにちは、ヒホです。よろしくお願いします"
+    # Expects
+    expected = tts_engine.create_accent_phrases(
+        text, StyleId(1), enable_katakana_english=False
+    )
+    # 2 つ目の無音（`。` の位置）が文の境界である
+    sentence_boundary_pause = [p.pause_mora for p in expected if p.pause_mora][1]
+    sentence_boundary_pause.text = SENTENCE_BOUNDARY_PAUSE_TEXT
+    # Outputs
+    result = tts_engine.create_accent_phrases(
+        text, StyleId(1), enable_katakana_english=False, enable_sentence_pipeline=True
+    )
+    # Test
+    _assert_equal_accent_phrases(expected, result)
+
+
+def test_update_length_and_pitch_with_prediction_cache() -> None:
+    """推論結果のキャッシュを用いて更新したアクセント句系列は、系列全体を推論し直した結果と一致する。"""
+    # Inputs
+    core = MockCoreWrapper()
+    core.yukarin_s_forward = MagicMock(wraps=core.yukarin_s_forward)  # type: ignore[method-assign]
+    cached_engine = TTSEngine(core, prediction_cache_size=100)
+    full_engine = TTSEngine(MockCoreWrapper())
+    text = "こんにちは、ヒホです。今日はいい天気ですね。散歩に行きましょう"
+    accent_phrases = cached_engine.create_accent_phrases(
+        text, StyleId(1), enable_katakana_english=False
+    )
+    # 1 つのアクセント句のアクセント位置を編集する
+    accent_phrases[3].accent = 1
+
+    # Expects
+    true_accent_phrases = full_engine.update_length_and_pitch(
+        copy.deepcopy(accent_phrases), StyleId(1)
+    )
+    # Outputs
+    result = cached_engine.update_length_and_pitch(accent_phrases, StyleId(1))
+
+    # Test
+    _assert_equal_accent_phrases(true_accent_phrases, result)
+    # 音素系列が変わらないため、音素長は推論し直されない
+    assert core.yukarin_s_forward.call_count == 1
+
+
+def test_synthesize_wave_with_sentence_pipeline() -> None:
+    """文ごとの区間のパイプライン処理で生成した音声波形は、一括処理と同じ内容になる。"""
+    # Inputs
+    core = MockCoreWrapper()
+    core.decode_forward = MagicMock(wraps=core.decode_forward)  # type: ignore[method-assign]
+    tts_engine = TTSEngine(core)
+    accent_phrases = tts_engine.create_accent_phrases(
+        "こんにちは、ヒホです。よろしくお願いします",
+        StyleId(1),
+        enable_katakana_english=False,
+        enable_sentence_pipeline=True,
+    )
+    query = _gen_hello_hiho_query()
+    query.accent_phrases = accent_phrases
+    # NOTE: 区間の境界で無音を半分ずつに分けても無音の長さが変わらないことを確かめるため、奇数フレーム長の無音とする
+    query.speedScale = 1.0
+    query.pauseLengthScale = 1.0
+    query.pauseLength = 9 / 93.75
+    # Expects
+    expected = tts_engine.synthesize_wave(
+        query, StyleId(1), enable_interrogative_upspeak=True
+    )
+    # Outputs
+    result = tts_engine.synthesize_wave(
+        query,
+        StyleId(1),
+        enable_interrogative_upspeak=True,
+        enable_sentence_pipeline=True,
+    )
+    # Test
+    assert result.shape == expected.shape
+    assert np.allclose(result, expected)
+    # 読点の無音では分割せず、2 文それぞれを 1 区間として波形生成する
+    assert core.decode_forward.call_count == 1 + 2
+
+
+def test_synthesize_wave_with_sentence_pipeline_empty_query() -> None:
+    """全ての区間のフレーム長が 0 のクエリでも、文ごとの区間のパイプライン処理は空の音声波形を生成する。"""
+    # Inputs
+    core = MockCoreWrapper()
+    core.decode_forward = MagicMock(wraps=core.decode_forward)  # type: ignore[method-assign]
+    tts_engine = TTSEngine(core)
+    query = _gen_hello_hiho_query()
+    query.accent_phrases = []
+    query.prePhonemeLength = 0.0
+    query.postPhonemeLength = 0.0
+    # Outputs
+    result = tts_engine.synthesize_wave(
+        query,
+        StyleId(1),
+        enable_interrogative_upspeak=True,
+        enable_sentence_pipeline=True,
+    )
+    # Test
+    assert result.shape == (0, 2)
+    assert core.decode_forward.call_count == 0
+
+
+def test_synthesize_wave_with_synthesis_session() -> None:
+    """合成セッションで変化した区間のみを波形生成し直した音声波形は、一括処理と同じ内容になる。"""
+    # Inputs
+    core = MockCoreWrapper()
+    core.decode_forward = MagicMock(wraps=core.decode_forward)  # type: ignore[method-assign]
+    tts_engine = TTSEngine(core)
+    query = _gen_hello_hiho_query()
+    # NOTE: 1 モーラの音高の変更が他のモーラへ波及しないよう、抑揚スケールを 1 とする
+    query.intonationScale = 1.0
+    tts_engine.synthesize_wave(
+        query, StyleId(1), enable_interrogative_upspeak=True, synthesis_session_id="a"
+    )
+    n_full_frame = core.decode_forward.call_args[1]["length"]
+    query.accent_phrases[1].moras[1].pitch += 0.5
+    # Expects
+    expected = TTSEngine(MockCoreWrapper()).synthesize_wave(
+        query, StyleId(1), enable_interrogative_upspeak=True
+    )
+    # Outputs
+    result = tts_engine.synthesize_wave(
+        query, StyleId(1), enable_interrogative_upspeak=True, synthesis_session_id="a"
+    )
+    # Test
+    assert result.shape == expected.shape
+    assert np.allclose(result, expected)
+    assert core.decode_forward.call_args[1]["length"] < n_full_frame
+
+
 def test_mocked_create_phoneme_and_f0_and_volume_output(
     snapshot_json: SnapshotAssertion,
 ) -> None:
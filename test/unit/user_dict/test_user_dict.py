@@ -1,6 +1,9 @@
 """ユーザー辞書の単体テスト。"""
 
 import json
+import os
+import threading
+import time
 from copy import deepcopy
 from pathlib import Path
 
@@ -10,11 +13,16 @@ from pyopenjtalk import g2p, unset_user_dict
 from voicevox_engine.user_dict.model import (
     USER_DICT_MAX_PRIORITY,
     UserDictWord,
+    UserDictWordOperation,
     WordTypes,
 )
-from voicevox_engine.user_dict.user_dict_manager import UserDictionary
+from voicevox_engine.user_dict.user_dict_manager import (
+    UserDictionary,
+    _DebouncedWorker,
+)
 from voicevox_engine.user_dict.user_dict_word import (
     UserDictInputError,
+    UserDictOperationsError,
     WordProperty,
     create_word,
     part_of_speech_data,
@@ -253,7 +261,7 @@ def test_import_invalid_word(tmp_path: Path) -> None:
         json.dumps(valid_dict_dict_json, ensure_ascii=False), encoding="utf-8"
     )
     user_dict = UserDictionary(user_dict_path=user_dict_path)
-    with pytest.raises(AssertionError):
+    with pytest.raises(UserDictInputError, match="品詞の情報が文脈IDと一致しません"):
         user_dict.import_user_dict(
             {
                 "aab7dda2-0d97-43c8-8cb7-3f440dab9b4e": invalid_accent_associative_rule_word
@@ -266,7 +274,7 @@ def test_import_invalid_word(tmp_path: Path) -> None:
     invalid_pos_word.part_of_speech_detail_1 = "*"
     invalid_pos_word.part_of_speech_detail_2 = "*"
     invalid_pos_word.part_of_speech_detail_3 = "*"
-    with pytest.raises(ValueError, match="対応していない品詞です"):
+    with pytest.raises(UserDictInputError, match="対応していない品詞です"):
         user_dict.import_user_dict(
             {"aab7dda2-0d97-43c8-8cb7-3f440dab9b4e": invalid_pos_word},
             override=True,
@@ -298,3 +306,296 @@ def test_update_dict(tmp_path: Path) -> None:
     user_dict.update_dict()
 
     assert g2p(text=test_text, kana=True) == success_pronunciation
+
+
+def test_update_dict_reuses_compiled_cache(tmp_path: Path) -> None:
+    """辞書の内容が変わっていなければ、コンパイル済み辞書のキャッシュを再利用する。"""
+    user_dict_path = tmp_path / "test_update_dict_reuses_compiled_cache.json"
+    user_dict_path.write_text(
+        json.dumps(valid_dict_dict_json, ensure_ascii=False), encoding="utf-8"
+    )
+    UserDictionary(user_dict_path=user_dict_path)
+    # NOTE: 再利用時は最終更新日時が更新されるため、コンパイルの有無を i-node 番号で判定する
+    caches = {path: path.stat().st_ino for path in tmp_path.glob("*.dict_cache-*.dic")}
+    assert len(caches) != 0
+
+    # 疑似的にエンジンを再起動する
+    unset_user_dict()
+    UserDictionary(user_dict_path=user_dict_path)
+
+    assert {
+        path: path.stat().st_ino for path in tmp_path.glob("*.dict_cache-*.dic")
+    } == caches
+
+
+def test_update_dict_replaces_stale_cache(tmp_path: Path) -> None:
+    """辞書の内容が変わった場合、再コンパイルして使われなくなったキャッシュを削除する。"""
+    user_dict_path = tmp_path / "test_update_dict_replaces_stale_cache.json"
+    user_dict = UserDictionary(user_dict_path=user_dict_path)
+    initial_caches = set(tmp_path.glob("*.dict_cache-*.dic"))
+
+    word_uuid = user_dict.apply_word(
+        WordProperty(surface="test", pronunciation="テスト", accent_type=1)
+    )
+    assert set(tmp_path.glob("*.dict_cache-*.dic")) != initial_caches
+
+    user_dict.delete_word(word_uuid)
+    assert set(tmp_path.glob("*.dict_cache-*.dic")) == initial_caches
+
+
+def test_update_dict_keeps_default_layer(tmp_path: Path) -> None:
+    """単語の編集ではデフォルト辞書を再コンパイルしない。"""
+    user_dict_path = tmp_path / "test_update_dict_keeps_default_layer.json"
+    user_dict = UserDictionary(user_dict_path=user_dict_path)
+    default_caches = {
+        path: path.stat().st_ino for path in tmp_path.glob("default.dict_cache-*.dic")
+    }
+    assert len(default_caches) == 1
+
+    user_dict.apply_word(
+        WordProperty(surface="test", pronunciation="テスト", accent_type=1)
+    )
+
+    assert {
+        path: path.stat().st_ino for path in tmp_path.glob("default.dict_cache-*.dic")
+    } == default_caches
+
+
+def test_update_dict_keeps_foreign_cache(tmp_path: Path) -> None:
+    """他のエンジンが作成したキャッシュは、長期間使われていない場合のみ削除する。"""
+    user_dict_path = tmp_path / "test_update_dict_keeps_foreign_cache.json"
+    recent_cache = tmp_path / "user.dict_cache-recent.dic"
+    recent_cache.write_bytes(b"")
+    old_cache = tmp_path / "user.dict_cache-old.dic"
+    old_cache.write_bytes(b"")
+    old_time = time.time() - 60 * 24 * 60 * 60
+    os.utime(old_cache, (old_time, old_time))
+
+    UserDictionary(user_dict_path=user_dict_path)
+
+    assert recent_cache.exists()
+    assert not old_cache.exists()
+
+
+def test_apply_operations(tmp_path: Path) -> None:
+    """追加・更新・削除を一括で適用できる。"""
+    user_dict_path = tmp_path / "test_apply_operations.json"
+    user_dict_path.write_text(
+        json.dumps(valid_dict_dict_json, ensure_ascii=False), encoding="utf-8"
+    )
+    user_dict = UserDictionary(user_dict_path=user_dict_path)
+    word_uuids = user_dict.apply_operations(
+        [
+            UserDictWordOperation(
+                type="add", surface="test2", pronunciation="テストツー", accent_type=1
+            ),
+            UserDictWordOperation(
+                type="delete", word_uuid="aab7dda2-0d97-43c8-8cb7-3f440dab9b4e"
+            ),
+        ]
+    )
+    res = user_dict.read_dict()
+    assert list(res.keys()) == [word_uuids[0]]
+    assert res[word_uuids[0]].surface == "ｔｅｓｔ２"
+
+
+def test_apply_operations_invalid(tmp_path: Path) -> None:
+    """不正な操作を含む場合は辞書を変更せず、不正な操作をすべて報告する。"""
+    user_dict_path = tmp_path / "test_apply_operations_invalid.json"
+    user_dict_path.write_text(
+        json.dumps(valid_dict_dict_json, ensure_ascii=False), encoding="utf-8"
+    )
+    user_dict = UserDictionary(user_dict_path=user_dict_path)
+    with pytest.raises(UserDictOperationsError) as e:
+        user_dict.apply_operations(
+            [
+                UserDictWordOperation(
+                    type="delete", word_uuid="aab7dda2-0d97-43c8-8cb7-3f440dab9b4e"
+                ),
+                UserDictWordOperation(type="add", surface="test2"),
+                UserDictWordOperation(
+                    type="update",
+                    word_uuid="c2be4dc5-d07d-4767-8be1-04a1bb3f05a9",
+                    surface="test2",
+                    pronunciation="テストツー",
+                    accent_type=1,
+                ),
+            ]
+        )
+    assert list(e.value.errors.keys()) == [1, 2]
+    assert user_dict.read_dict() == {
+        "aab7dda2-0d97-43c8-8cb7-3f440dab9b4e": UserDictWord(
+            **valid_dict_dict_api["aab7dda2-0d97-43c8-8cb7-3f440dab9b4e"]
+        )
+    }
+
+
+def test_debounced_worker_coalesces_requests() -> None:
+    """連続した要求はまとめて一度だけ処理される。"""
+    # Inputs
+    n_call = 0
+
+    def count_up() -> None:
+        nonlocal n_call
+        n_call += 1
+
+    worker = _DebouncedWorker(count_up, delay=0.1, max_delay=10.0)
+    # Outputs
+    for _ in range(5):
+        worker.request()
+    worker.wait()
+
+    # Test
+    assert n_call == 1
+
+
+def test_debounced_worker_runs_after_max_delay() -> None:
+    """要求が途絶えない場合でも、最初の要求から最大の待機時間が経過すると処理される。"""
+    # Inputs
+    processed = threading.Event()
+    worker = _DebouncedWorker(processed.set, delay=0.2, max_delay=0.5)
+    # Outputs
+    # 待機時間より短い間隔で要求を送り続ける
+    started_at = time.monotonic()
+    while not processed.is_set() and time.monotonic() - started_at < 3.0:
+        worker.request()
+        time.sleep(0.05)
+    elapsed = time.monotonic() - started_at
+
+    # Test
+    assert processed.is_set()
+    assert elapsed < 1.5
+
+
+def test_update_dict_in_background(tmp_path: Path) -> None:
+    """バックグラウンド更新が有効な場合、単語の編集は更新の完了後に辞書へ反映される。"""
+    user_dict_path = tmp_path / "test_update_dict_in_background.json"
+    user_dict = UserDictionary(
+        user_dict_path=user_dict_path, enable_background_update=True
+    )
+    test_text = "テスト用の文字列"
+    success_pronunciation = "デフォルトノジショデハゼッタイニセイセイサレナイヨミ"
+
+    user_dict.apply_word(
+        WordProperty(
+            surface=test_text,
+            pronunciation=success_pronunciation,
+            accent_type=1,
+            priority=10,
+        )
+    )
+    # 編集は即座に保存される
+    assert len(user_dict.read_dict()) == 1
+
+    user_dict.wait_for_update()
+    assert g2p(text=test_text, kana=True) == success_pronunciation
+
+
+def test_read_dict_reflects_external_modification(tmp_path: Path) -> None:
+    """ユーザー辞書ファイルが外部から書き換えられた場合、キャッシュではなく新しい内容を読み出す。"""
+    # Inputs
+    user_dict_path = tmp_path / "test_read_dict_reflects_external_modification.json"
+    user_dict = UserDictionary(user_dict_path=user_dict_path)
+    assert user_dict.read_dict() == {}
+    user_dict_path.write_text(
+        json.dumps(valid_dict_dict_json, ensure_ascii=False), encoding="utf-8"
+    )
+    # Expects
+    true_dict = {
+        "aab7dda2-0d97-43c8-8cb7-3f440dab9b4e": UserDictWord(
+            **valid_dict_dict_api["aab7dda2-0d97-43c8-8cb7-3f440dab9b4e"]
+        )
+    }
+    # Outputs
+    result = user_dict.read_dict()
+
+    # Test
+    assert result == true_dict
+
+
+def test_read_dict_json(tmp_path: Path) -> None:
+    """シリアライズ済みのユーザー辞書は `read_dict()` の内容と一致する。"""
+    # Inputs
+    user_dict_path = tmp_path / "test_read_dict_json.json"
+    user_dict_path.write_text(
+        json.dumps(valid_dict_dict_json, ensure_ascii=False), encoding="utf-8"
+    )
+    user_dict = UserDictionary(user_dict_path=user_dict_path)
+    user_dict.apply_word(
+        WordProperty(surface="test2", pronunciation="テストツー", accent_type=3)
+    )
+    # Expects
+    true_json = {
+        word_uuid: word.model_dump(mode="json")
+        for word_uuid, word in user_dict.read_dict().items()
+    }
+    # Outputs
+    result = json.loads(user_dict.read_dict_json())
+
+    # Test
+    assert result == true_json
+
+
+def test_import_user_dict_lines_csv(tmp_path: Path) -> None:
+    """CSV 形式のインポートは同じ単語を再インポートしても重複させない。"""
+    # Inputs
+    user_dict_path = tmp_path / "test_import_user_dict_lines_csv.json"
+    user_dict = UserDictionary(user_dict_path=user_dict_path)
+    lines = [
+        "ｔｅｓｔ２,1348,1348,8609,名詞,固有名詞,一般,*,*,*,*,テストツー,テストツー,1/5,*\n"
+    ]
+    # Expects
+    true_word = UserDictWord(
+        surface="ｔｅｓｔ２",
+        priority=5,
+        context_id=1348,
+        part_of_speech="名詞",
+        part_of_speech_detail_1="固有名詞",
+        part_of_speech_detail_2="一般",
+        part_of_speech_detail_3="*",
+        inflectional_type="*",
+        inflectional_form="*",
+        stem="*",
+        yomi="テストツー",
+        pronunciation="テストツー",
+        accent_type=1,
+        mora_count=5,
+        accent_associative_rule="*",
+    )
+    # Outputs
+    user_dict.import_user_dict_lines(lines, "csv")
+    user_dict.import_user_dict_lines(lines, "csv")
+    result = user_dict.read_dict()
+
+    # Test
+    assert list(result.values()) == [true_word]
+
+
+def test_import_user_dict_lines_invalid(tmp_path: Path) -> None:
+    """不正な行を含む場合はその行番号を報告し、辞書を変更しない。"""
+    # Inputs
+    user_dict_path = tmp_path / "test_import_user_dict_lines_invalid.json"
+    user_dict_path.write_text(
+        json.dumps(valid_dict_dict_json, ensure_ascii=False), encoding="utf-8"
+    )
+    user_dict = UserDictionary(user_dict_path=user_dict_path)
+    invalid_pos_word = import_word.model_dump()
+    invalid_pos_word["context_id"] = 2
+    lines = [
+        json.dumps(
+            {"a89596ad-caa8-4f4e-8eb3-3d2261c798fd": import_word.model_dump()},
+            ensure_ascii=False,
+        ),
+        "",
+        json.dumps(
+            {"b89596ad-caa8-4f4e-8eb3-3d2261c798fd": invalid_pos_word},
+            ensure_ascii=False,
+        ),
+    ]
+    # Expects
+    true_dict = user_dict.read_dict()
+
+    # Test
+    with pytest.raises(UserDictInputError, match="3行目: 対応していない品詞です"):
+        user_dict.import_user_dict_lines(lines, "ndjson", override=True)
+    assert user_dict.read_dict() == true_dict
@@ -0,0 +1,340 @@
+"""
+ベンチマークを実行し、結果をベースラインと比較して性能の劣化を検出する。
+
+計測結果は JSON として出力される。
+レイテンシは逐次実行の平均処理時間、スループットは複数スレッドから一定時間並行実行した際の 1 秒あたりの処理回数であり、それぞれ独立に計測する。
+スループットは並行実行に意味のあるベンチマークのみで計測する。
+ベースラインよりもレイテンシが許容幅を超えて増加した場合、またはスループットが許容幅を超えて減少した場合、終了コード 1 で終了する。
+ベースラインに存在しないベンチマークがある場合も、比較できないため終了コード 1 で終了する。
+計測結果には計測環境（Python のバージョン・CPU 数等）が記録され、ベースラインと計測環境が異なる場合は警告を表示する。
+
+例
+$ uv run python -m tools.run_benchmarks --output bench_output.json
+$ uv run python -m tools.run_benchmarks --only text_analysis user_dict_compile
+$ uv run python -m tools.run_benchmarks --update_baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from pydantic import TypeAdapter
+
+_DEFAULT_BASELINE_PATH = Path(__file__).parents[1] / "test/benchmark/baseline.json"
+
+
+@dataclass(frozen=True)
+class _BenchmarkResult:
+    """ベンチマーク 1 種の計測結果"""
+
+    latency: float  # 1 回あたりの平均処理時間 [sec]
+    # 並行実行時の 1 秒あたりの処理回数 [1/sec]。計測しない場合は None
+    throughput: float | None = None
+
+
+@dataclass(frozen=True)
+class _BenchmarkEnvironment:
+    """ベンチマークの計測環境"""
+
+    python_version: str  # Python のバージョン
+    python_implementation: str  # Python の実装名
+    gil_enabled: bool  # GIL が有効か否か
+    platform: str  # OS とそのバージョン
+    machine: str  # CPU アーキテクチャ
+    cpu_count: int  # このプロセスが利用可能な CPU 数
+
+
+@dataclass(frozen=True)
+class _BenchmarkReport:
+    """計測環境と、ベンチマーク名ごとの計測結果"""
+
+    environment: _BenchmarkEnvironment
+    results: dict[str, _BenchmarkResult]
+
+
+@dataclass(frozen=True)
+class _BenchmarkTarget:
+    """ベンチマーク 1 種の計測方法"""
+
+    latency: Callable[[], float]  # 平均処理時間 [sec] を返す関数
+    throughput: Callable[[], float] | None = None  # 1 秒あたりの処理回数を返す関数
+
+
+_report_adapter = TypeAdapter(_BenchmarkReport)
+
+# ベースラインとの比較で差異を警告する計測環境の項目
+# NOTE: OS のバージョン等の細かな差異は性能への影響が小さいため比較しない
+_COMPARED_ENVIRONMENT_FIELDS = (
+    "python_version",
+    "python_implementation",
+    "gil_enabled",
+    "machine",
+    "cpu_count",
+)
+
+
+def _current_environment() -> _BenchmarkEnvironment:
+    """現在の計測環境を取得する。"""
+    # NOTE: free-threaded ビルド以外では `sys._is_gil_enabled` が存在しない場合がある
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    return _BenchmarkEnvironment(
+        python_version=platform.python_version(),
+        python_implementation=platform.python_implementation(),
+        gil_enabled=is_gil_enabled(),
+        platform=platform.platform(),
+        machine=platform.machine(),
+        cpu_count=os.process_cpu_count() or 1,
+    )
+
+
+def _benchmark_targets(voicevox_dir: Path | None) -> dict[str, _BenchmarkTarget]:
+    """ベンチマーク名と、その計測方法の対応を生成する。"""
+    # NOTE: ベンチマーク対象のモジュールは重いため、実行時に読み込む
+    from test.benchmark.speed.character import (
+        benchmark_get_speaker_info_all,
+        benchmark_get_speakers,
+        benchmark_post_morphable_targets_all,
+    )
+    from test.benchmark.speed.kana_parser import benchmark_parse_kana
+    from test.benchmark.speed.morphing import benchmark_morphing_parameter
+    from test.benchmark.speed.request import benchmark_request
+    from test.benchmark.speed.startup import benchmark_startup
+    from test.benchmark.speed.synthesis import (
+        benchmark_decoder_feature,
+        benchmark_decoder_feature_throughput,
+        benchmark_query_preparation,
+        benchmark_wave_encoding,
+        benchmark_wave_encoding_throughput,
+    )
+    from test.benchmark.speed.text_analysis import (
+        benchmark_text_analysis,
+        benchmark_text_analysis_throughput,
+    )
+    from test.benchmark.speed.user_dict import (
+        benchmark_user_dict_compile,
+        benchmark_user_dict_load_cached,
+    )
+    from voicevox_engine.morphing.model import MorphingAnalysisMode
+
+    targets: dict[str, _BenchmarkTarget] = {
+        "text_analysis": _BenchmarkTarget(
+            benchmark_text_analysis, benchmark_text_analysis_throughput
+        ),
+        "parse_kana": _BenchmarkTarget(benchmark_parse_kana),
+        "decoder_feature": _BenchmarkTarget(
+            benchmark_decoder_feature, benchmark_decoder_feature_throughput
+        ),
+        "query_preparation": _BenchmarkTarget(benchmark_query_preparation),
+        "wave_encoding": _BenchmarkTarget(
+            benchmark_wave_encoding, benchmark_wave_encoding_throughput
+        ),
+        "morphing_parameter": _BenchmarkTarget(benchmark_morphing_parameter),
+        "morphing_parameter_fast": _BenchmarkTarget(
+            lambda: benchmark_morphing_parameter(
+                analysis_mode=MorphingAnalysisMode.fast
+            )
+        ),
+        "user_dict_compile": _BenchmarkTarget(benchmark_user_dict_compile),
+        "user_dict_load_cached": _BenchmarkTarget(benchmark_user_dict_load_cached),
+        "startup": _BenchmarkTarget(benchmark_startup),
+    }
+    # 製品版コアを必要とするベンチマークは VOICEVOX ディレクトリ指定時のみ実行する
+    if voicevox_dir is not None:
+        targets |= {
+            "request": _BenchmarkTarget(
+                lambda: benchmark_request("fake", voicevox_dir)
+            ),
+            "get_speakers": _BenchmarkTarget(
+                lambda: benchmark_get_speakers("fake", voicevox_dir)
+            ),
+            "get_speaker_info_all": _BenchmarkTarget(
+                lambda: benchmark_get_speaker_info_all("fake", voicevox_dir)
+            ),
+            "post_morphable_targets_all": _BenchmarkTarget(
+                lambda: benchmark_post_morphable_targets_all("fake", voicevox_dir)
+            ),
+        }
+    return targets
+
+
+def _run_benchmarks(
+    targets: dict[str, _BenchmarkTarget],
+) -> dict[str, _BenchmarkResult]:
+    """ベンチマークを実行し、計測結果を返す。"""
+    results: dict[str, _BenchmarkResult] = {}
+    for name, target in targets.items():
+        print(f"Running benchmark: {name}", file=sys.stderr)
+        latency = target.latency()
+        throughput = target.throughput() if target.throughput is not None else None
+        results[name] = _BenchmarkResult(latency=latency, throughput=throughput)
+    return results
+
+
+def _detect_regressions(
+    results: dict[str, _BenchmarkResult],
+    baseline: dict[str, _BenchmarkResult],
+    latency_tolerance: float,
+    throughput_tolerance: float,
+) -> list[str]:
+    """
+    計測結果をベースラインと比較し、性能の劣化を説明するメッセージの一覧を返す。
+
+    Parameters
+    ----------
+    results : dict[str, _BenchmarkResult]
+        計測結果
+    baseline : dict[str, _BenchmarkResult]
+        ベースラインの計測結果。計測結果に対応するエントリが無いベンチマークは比較しない。
+        スループットは計測結果とベースラインの双方にある場合のみ比較する。
+    latency_tolerance : float
+        レイテンシ増加の許容比率。0.2 であればベースラインの 1.2 倍まで許容する。
+    throughput_tolerance : float
+        スループット減少の許容比率。0.2 であればベースラインの 0.8 倍まで許容する。
+
+    Returns
+    -------
+    list[str]
+        性能劣化の説明。劣化が無い場合は空リスト。
+    """
+    regressions: list[str] = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        base = baseline[name]
+        latency_limit = base.latency * (1.0 + latency_tolerance)
+        if result.latency > latency_limit:
+            regressions.append(
+                f"{name}: latency {result.latency:.5f} sec > {latency_limit:.5f} sec "
+                f"(baseline {base.latency:.5f} sec)"
+            )
+        if result.throughput is None or base.throughput is None:
+            continue
+        throughput_limit = base.throughput * (1.0 - throughput_tolerance)
+        if result.throughput < throughput_limit:
+            regressions.append(
+                f"{name}: throughput {result.throughput:.3f} /sec < {throughput_limit:.3f} /sec "
+                f"(baseline {base.throughput:.3f} /sec)"
+            )
+    return regressions
+
+
+def _missing_baselines(
+    results: dict[str, _BenchmarkResult],
+    baseline: dict[str, _BenchmarkResult],
+) -> list[str]:
+    """ベースラインに対応するエントリが無いベンチマーク名の一覧を返す。"""
+    return sorted(results.keys() - baseline.keys())
+
+
+def _environment_differences(
+    environment: _BenchmarkEnvironment, baseline_environment: _BenchmarkEnvironment
+) -> list[str]:
+    """計測環境とベースラインの計測環境の差異の説明を返す。差異が無い場合は空リスト。"""
+    differences: list[str] = []
+    for field_name in _COMPARED_ENVIRONMENT_FIELDS:
+        value = getattr(environment, field_name)
+        baseline_value = getattr(baseline_environment, field_name)
+        if value != baseline_value:
+            differences.append(f"{field_name}: {value} (baseline {baseline_value})")
+    return differences
+
+
+def _load_report(path: Path) -> _BenchmarkReport:
+    """JSON ファイルから計測環境と計測結果を読み込む。"""
+    return _report_adapter.validate_json(path.read_bytes())
+
+
+def _dump_report(report: _BenchmarkReport) -> str:
+    """計測環境と計測結果を JSON 文字列へ変換する。"""
+    return json.dumps(_report_adapter.dump_python(report), indent=2) + "\n"
+
+
+def main() -> None:
+    """ベンチマークを実行し、ベースラインと比較する。"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--voicevox_dir",
+        type=Path,
+        default=None,
+        help="製品版コアを用いるベンチマークを実行する場合に指定する VOICEVOX ディレクトリのパス",
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        default=None,
+        help="実行するベンチマーク名。未指定の場合は全て実行する",
+    )
+    parser.add_argument("--baseline", type=Path, default=_DEFAULT_BASELINE_PATH)
+    parser.add_argument(
+        "--output", type=Path, default=None, help="計測結果 JSON の出力先"
+    )
+    parser.add_argument("--latency_tolerance", type=float, default=0.2)
+    parser.add_argument("--throughput_tolerance", type=float, default=0.2)
+    parser.add_argument(
+        "--update_baseline",
+        action="store_true",
+        help="計測結果でベースラインを更新する",
+    )
+    args = parser.parse_args()
+
+    targets = _benchmark_targets(args.voicevox_dir)
+    if args.only is not None:
+        unknown_names = set(args.only) - set(targets)
+        if unknown_names:
+            parser.error(f"unknown benchmark: {', '.join(sorted(unknown_names))}")
+        targets = {name: targets[name] for name in args.only}
+
+    environment = _current_environment()
+    results = _run_benchmarks(targets)
+    report_json = _dump_report(_BenchmarkReport(environment, results))
+    if args.output is None:
+        print(report_json, end="")
+    else:
+        args.output.write_text(report_json, encoding="utf-8")
+
+    baseline_report = _load_report(args.baseline) if args.baseline.is_file() else None
+
+    if args.update_baseline:
+        # NOTE: 計測環境が異なる結果を混在させないよう、計測環境が同じ場合のみ既存の結果を引き継ぐ
+        kept_results: dict[str, _BenchmarkResult] = {}
+        if baseline_report is not None and not _environment_differences(
+            environment, baseline_report.environment
+        ):
+            kept_results = baseline_report.results
+        args.baseline.write_text(
+            _dump_report(_BenchmarkReport(environment, kept_results | results)),
+            encoding="utf-8",
+        )
+        return
+
+    baseline: dict[str, _BenchmarkResult] = {}
+    if baseline_report is not None:
+        baseline = baseline_report.results
+        for difference in _environment_differences(
+            environment, baseline_report.environment
+        ):
+            print(f"Environment differs from baseline: {difference}", file=sys.stderr)
+
+    missing_names = _missing_baselines(results, baseline)
+    for name in missing_names:
+        print(
+            f"Baseline missing: {name} is not in {args.baseline} "
+            "(run with --update_baseline to add it)",
+            file=sys.stderr,
+        )
+    regressions = _detect_regressions(
+        results, baseline, args.latency_tolerance, args.throughput_tolerance
+    )
+    for regression in regressions:
+        print(f"Regression detected: {regression}", file=sys.stderr)
+    if missing_names or regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
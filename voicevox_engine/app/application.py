@@ -13,8 +13,10 @@ from voicevox_engine.app.openapi_schema import (
     simplify_operation_ids,
 )
 from voicevox_engine.app.routers.character import generate_character_router
+from voicevox_engine.app.routers.editing_session import (
+    generate_editing_session_router,
+)
 from voicevox_engine.app.routers.engine_info import generate_engine_info_router
-from voicevox_engine.app.routers.library import generate_library_router
 from voicevox_engine.app.routers.morphing import generate_morphing_router
 from voicevox_engine.app.routers.portal_page import generate_portal_page_router
 from voicevox_engine.app.routers.preset import generate_preset_router
@@ -24,9 +26,15 @@ from voicevox_engine.app.routers.user_dict import generate_user_dict_router
 from voicevox_engine.cancellable_engine import CancellableEngine
 from voicevox_engine.core.core_adapter import CoreCharacter
 from voicevox_engine.core.core_initializer import CoreManager
+from voicevox_engine.editing_session.editing_session_manager import (
+    EditingSessionManager,
+)
 from voicevox_engine.engine_manifest import EngineManifest
 from voicevox_engine.library.library_manager import LibraryManager
 from voicevox_engine.metas.metas_store import MetasStore
+from voicevox_engine.morphing.model import MorphingAnalysisMode
+from voicevox_engine.morphing.morphing import MorphabilityIndexStore
+from voicevox_engine.morphing.parameter_cache import MorphingParameterCache
 from voicevox_engine.preset.preset_manager import PresetManager
 from voicevox_engine.resource_manager import ResourceManager
 from voicevox_engine.setting.model import CorsPolicyMode
@@ -52,6 +60,7 @@ def generate_app(
     cors_policy_mode: CorsPolicyMode = CorsPolicyMode.localapps,
     allow_origin: list[str] | None = None,
     disable_mutable_api: bool = False,
+    morphing_analysis_mode: MorphingAnalysisMode = MorphingAnalysisMode.quality,
 ) -> FastAPI:
     """ASGI 'application' 仕様に準拠した VOICEVOX ENGINE アプリケーションインスタンスを生成する。"""
     if character_info_dir is None:
@@ -86,20 +95,43 @@ def generate_app(
         _get_core_characters,
         resource_manager,
     )
+    morphability_indexes = MorphabilityIndexStore(metas_store.characters)
+    morphing_parameters = MorphingParameterCache()
+
+    def _on_libraries_changed() -> None:
+        # 音声ライブラリに依存するキャッシュを破棄する
+        metas_store.clear_cache()
+        morphability_indexes.clear()
+        morphing_parameters.clear()
 
     app.include_router(
         generate_tts_pipeline_router(
             tts_engines, song_engines, preset_manager, cancellable_engine
         )
     )
-    app.include_router(generate_morphing_router(tts_engines, metas_store))
+    app.include_router(
+        generate_editing_session_router(EditingSessionManager(), tts_engines)
+    )
+    app.include_router(
+        generate_morphing_router(
+            tts_engines,
+            morphability_indexes,
+            morphing_parameters,
+            default_analysis_mode=morphing_analysis_mode,
+        )
+    )
     app.include_router(
         generate_preset_router(preset_manager, verify_mutability_allowed)
     )
     app.include_router(generate_character_router(resource_manager, metas_store))
     if engine_manifest.supported_features.manage_library:
+        # NOTE: 音声ライブラリ機能は製品版では無効なため、有効な場合のみ読み込む
+        from voicevox_engine.app.routers.library import generate_library_router
+
         app.include_router(
-            generate_library_router(library_manager, verify_mutability_allowed)
+            generate_library_router(
+                library_manager, verify_mutability_allowed, _on_libraries_changed
+            )
         )
     app.include_router(generate_user_dict_router(user_dict, verify_mutability_allowed))
     app.include_router(generate_engine_info_router(core_version_list, engine_manifest))
@@ -3,12 +3,11 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from pydantic.json_schema import SkipJsonSchema
 
 from voicevox_engine.metas.metas import Speaker, SpeakerInfo
 from voicevox_engine.metas.metas_store import (
-    Character,
     CharacterInfoNotFoundError,
     CharacterNotFoundError,
     MetasStore,
@@ -29,33 +28,18 @@ async def _get_resource_baseurl(request: Request) -> str:
     return f"{request.url.scheme}://{request.url.netloc}/{RESOURCE_ENDPOINT}"
 
 
-def _characters_to_speakers(characters: list[Character]) -> list[Speaker]:
-    """キャラクターのリストを `Speaker` のリストへキャストする。"""
-    return list(
-        map(
-            lambda character: Speaker(
-                name=character.name,
-                speaker_uuid=character.uuid,
-                styles=character.talk_styles + character.sing_styles,
-                version=character.version,
-                supported_features=character.supported_features,
-            ),
-            characters,
-        )
-    )
-
-
 def generate_character_router(
     resource_manager: ResourceManager, metas_store: MetasStore
 ) -> APIRouter:
     """キャラクター情報 API Router を生成する"""
     router = APIRouter(tags=["その他"])
 
-    @router.get("/speakers")
-    def speakers(core_version: str | SkipJsonSchema[None] = None) -> list[Speaker]:
+    @router.get("/speakers", response_model=list[Speaker])
+    def speakers(core_version: str | SkipJsonSchema[None] = None) -> Response:
         """喋れるキャラクターの情報の一覧を返します。"""
-        characters = metas_store.talk_characters(core_version)
-        return _characters_to_speakers(characters)
+        # NOTE: キャラクター情報の一覧はキャッシュされたスナップショットからシリアライズ済みの JSON を返す
+        speakers_json = metas_store.catalogue(core_version).talk_speakers_json
+        return Response(content=speakers_json, media_type="application/json")
 
     @router.get("/speaker_info")
     def speaker_info(
@@ -82,11 +66,11 @@ def generate_character_router(
         except CharacterInfoNotFoundError as e:
             raise HTTPException(status_code=500, detail=str(e)) from e
 
-    @router.get("/singers")
-    def singers(core_version: str | SkipJsonSchema[None] = None) -> list[Speaker]:
+    @router.get("/singers", response_model=list[Speaker])
+    def singers(core_version: str | SkipJsonSchema[None] = None) -> Response:
         """歌えるキャラクターの情報の一覧を返します。"""
-        characters = metas_store.sing_characters(core_version)
-        return _characters_to_speakers(characters)
+        singers_json = metas_store.catalogue(core_version).sing_speakers_json
+        return Response(content=singers_json, media_type="application/json")
 
     @router.get("/singer_info")
     def singer_info(
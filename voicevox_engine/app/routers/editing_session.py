@@ -0,0 +1,153 @@
+"""編集セッション機能を提供する API Router"""
+
+from collections.abc import Callable
+from functools import partial
+from tempfile import NamedTemporaryFile
+from typing import Annotated
+
+import numpy as np
+import soundfile
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Path, Query
+from fastapi.responses import FileResponse, Response
+from numpy.typing import NDArray
+from pydantic.json_schema import SkipJsonSchema
+
+from voicevox_engine.editing_session.editing_session_manager import (
+    EditingSessionInputError,
+    EditingSessionManager,
+    EditingSessionNotFoundError,
+)
+from voicevox_engine.editing_session.model import AudioQueryDelta
+from voicevox_engine.metas.metas import StyleId
+from voicevox_engine.model import AudioQuery
+from voicevox_engine.tts_pipeline.model import AccentPhrase
+from voicevox_engine.tts_pipeline.tts_engine import LATEST_VERSION, TTSEngineManager
+from voicevox_engine.utility.file_utility import try_delete_file
+
+
+def generate_editing_session_router(
+    editing_sessions: EditingSessionManager, tts_engines: TTSEngineManager
+) -> APIRouter:
+    """編集セッション API Router を生成する"""
+    router = APIRouter(tags=["クエリ編集"])
+
+    @router.post(
+        "/editing_sessions",
+        response_description="作成した編集セッションのID",
+        summary="音声合成用のクエリから編集セッションを作成する",
+    )
+    def create_editing_session(query: AudioQuery) -> str:
+        """音声合成用のクエリをエンジンで保持し、値ごとの変更を受け付ける編集セッションを作成します。一定時間操作の無い編集セッションは破棄されます。"""
+        return editing_sessions.create_session(query)
+
+    @router.get(
+        "/editing_sessions/{session_id}",
+        response_model=AudioQuery,
+        summary="編集セッションの音声合成用のクエリを得る",
+    )
+    def get_editing_session_query(
+        session_id: Annotated[str, Path(description="編集セッションのID")],
+    ) -> Response:
+        try:
+            # NOTE: クエリを複製せず、他の操作と排他した状態で直接シリアライズする
+            query_json = editing_sessions.read_query(
+                session_id, lambda query: query.model_dump_json()
+            )
+        except EditingSessionNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e)) from e
+        return Response(content=query_json, media_type="application/json")
+
+    @router.patch(
+        "/editing_sessions/{session_id}",
+        response_description="変化した値の一覧",
+        summary="編集セッションの音声合成用のクエリを変更する",
+    )
+    def update_editing_session_query(
+        session_id: Annotated[str, Path(description="編集セッションのID")],
+        deltas: list[AudioQueryDelta],
+        style_id: Annotated[
+            StyleId | SkipJsonSchema[None],
+            Query(
+                alias="speaker",
+                description="指定した場合、アクセント位置の変更に合わせてこのスタイルでモーラの音高を生成し直す",
+            ),
+        ] = None,
+        core_version: str | SkipJsonSchema[None] = None,
+    ) -> list[AudioQueryDelta]:
+        """変更を順に適用し、実際に変化した値のみを返します。いずれかの変更が不正な場合、どの変更も適用されません。"""
+        update_pitch: Callable[[list[AccentPhrase]], list[AccentPhrase]] | None = None
+        if style_id is not None:
+            engine = tts_engines.get_tts_engine(core_version or LATEST_VERSION)
+            update_pitch = partial(engine.update_pitch, style_id=style_id)
+
+        try:
+            return editing_sessions.apply_deltas(session_id, deltas, update_pitch)
+        except EditingSessionNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e)) from e
+        except EditingSessionInputError as e:
+            raise HTTPException(status_code=422, detail=str(e)) from e
+
+    @router.delete(
+        "/editing_sessions/{session_id}",
+        status_code=204,
+        summary="編集セッションを破棄する",
+    )
+    def delete_editing_session(
+        session_id: Annotated[str, Path(description="編集セッションのID")],
+    ) -> None:
+        try:
+            editing_sessions.delete_session(session_id)
+        except EditingSessionNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e)) from e
+
+    @router.post(
+        "/editing_sessions/{session_id}/synthesis",
+        response_class=FileResponse,
+        responses={
+            200: {
+                "content": {
+                    "audio/wav": {"schema": {"type": "string", "format": "binary"}}
+                },
+            }
+        },
+        tags=["音声合成"],
+        summary="編集セッションの音声合成用のクエリで音声合成する",
+    )
+    def editing_session_synthesis(
+        session_id: Annotated[str, Path(description="編集セッションのID")],
+        style_id: Annotated[StyleId, Query(alias="speaker")],
+        background_tasks: BackgroundTasks,
+        enable_interrogative_upspeak: Annotated[
+            bool,
+            Query(
+                description="疑問系のテキストが与えられたら語尾を自動調整する",
+            ),
+        ] = True,
+        core_version: str | SkipJsonSchema[None] = None,
+    ) -> FileResponse:
+        """前回の合成結果から変化した区間のみを波形生成し直します。"""
+        engine = tts_engines.get_tts_engine(core_version or LATEST_VERSION)
+
+        def synthesize(query: AudioQuery) -> tuple[NDArray[np.float32], int]:
+            """音声波形と出力サンプリングレートを得る。`synthesize_wave()` はクエリを変更しない。"""
+            wave = engine.synthesize_wave(
+                query,
+                style_id,
+                enable_interrogative_upspeak=enable_interrogative_upspeak,
+                synthesis_session_id=session_id,
+            )
+            return wave, query.outputSamplingRate
+
+        try:
+            # NOTE: クエリを複製せず、他の操作と排他した状態で直接合成に用いる
+            wave, sampling_rate = editing_sessions.read_query(session_id, synthesize)
+        except EditingSessionNotFoundError as e:
+            raise HTTPException(status_code=404, detail=str(e)) from e
+
+        with NamedTemporaryFile(delete=False) as f:
+            soundfile.write(file=f, data=wave, samplerate=sampling_rate, format="WAV")
+
+        background_tasks.add_task(try_delete_file, f.name)
+        return FileResponse(f.name, media_type="audio/wav")
+
+    return router
@@ -1,6 +1,7 @@
 """音声ライブラリ機能を提供する API Router"""
 
 import asyncio
+from collections.abc import Callable
 from io import BytesIO
 from traceback import print_exception
 from typing import Annotated
@@ -21,11 +22,15 @@ from ..dependencies import VerifyMutabilityAllowed
 
 
 def generate_library_router(
-    library_manager: LibraryManager, verify_mutability: VerifyMutabilityAllowed
+    library_manager: LibraryManager,
+    verify_mutability: VerifyMutabilityAllowed,
+    on_libraries_changed: Callable[[], None],
 ) -> APIRouter:
     """
     音声ライブラリ API Router を生成する
 
+    `on_libraries_changed` は音声ライブラリのインストール・アンインストールが成功した後に呼ばれる。
+
     NOTE: 製品版 VOICEVOX ENGINE では音声ライブラリ機能をオフにしている
     """
     router = APIRouter(tags=["音声ライブラリ管理"])
@@ -77,6 +82,7 @@ def generate_library_router(
         except LibraryInternalError as e:
             print_exception(e)
             raise HTTPException(status_code=500) from e
+        on_libraries_changed()
 
     @router.post(
         "/uninstall_library/{library_uuid}",
@@ -100,5 +106,6 @@ def generate_library_router(
         except LibraryInternalError as e:
             print_exception(e)
             raise HTTPException(status_code=500) from e
+        on_libraries_changed()
 
     return router
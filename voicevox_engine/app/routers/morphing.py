@@ -1,38 +1,46 @@
 """モーフィング機能を提供する API Router"""
 
-from functools import lru_cache
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from tempfile import NamedTemporaryFile
-from typing import Annotated
+from typing import Annotated, Final
 
 import soundfile
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
 from fastapi.responses import FileResponse
+from pydantic import Field
 from pydantic.json_schema import SkipJsonSchema
 
 from voicevox_engine.metas.metas import StyleId
-from voicevox_engine.metas.metas_store import MetasStore
 from voicevox_engine.model import AudioQuery
-from voicevox_engine.morphing.model import MorphableTargetInfo
+from voicevox_engine.morphing.model import MorphableTargetInfo, MorphingAnalysisMode
 from voicevox_engine.morphing.morphing import (
+    MorphabilityIndexStore,
     StyleIdNotFoundError,
-    get_morphable_targets,
-    is_morphable,
+    _MorphingParameter,
+    synthesis_morphing_parameter,
     synthesize_morphed_wave,
+    synthesize_morphed_wave_chunks,
 )
-from voicevox_engine.morphing.morphing import (
-    synthesis_morphing_parameter as _synthesis_morphing_parameter,
+from voicevox_engine.morphing.parameter_cache import (
+    MorphingParameterCache,
+    digest_query,
 )
 from voicevox_engine.tts_pipeline.tts_engine import LATEST_VERSION, TTSEngineManager
 from voicevox_engine.utility.file_utility import try_delete_file
 
-# キャッシュを有効化
-# モジュール側でlru_cacheを指定するとキャッシュを制御しにくいため、HTTPサーバ側で指定する
-# TODO: キャッシュを管理するモジュール側API・HTTP側APIを用意する
-synthesis_morphing_parameter = lru_cache(maxsize=4)(_synthesis_morphing_parameter)
+# 一度にまとめて合成できるモーフィングの割合の最大数
+_MAX_MORPH_RATES: Final = 32
+# 複数の割合のモーフィングを並行して合成するスレッドの最大数
+_MAX_MORPHING_WORKERS: Final = 2
 
 
 def generate_morphing_router(
-    tts_engines: TTSEngineManager, metas_store: MetasStore
+    tts_engines: TTSEngineManager,
+    morphability_indexes: MorphabilityIndexStore,
+    morphing_parameter_cache: MorphingParameterCache,
+    default_analysis_mode: MorphingAnalysisMode = MorphingAnalysisMode.quality,
 ) -> APIRouter:
     """モーフィング API Router を生成する"""
     router = APIRouter(tags=["音声合成"])
@@ -51,9 +59,9 @@ def generate_morphing_router(
         プロパティが存在しない場合は、モーフィングが許可されているとみなします。
         返り値のスタイルIDはstring型なので注意。
         """
-        characters = metas_store.characters(core_version)
+        morphability_index = morphability_indexes.get(core_version)
         try:
-            morphable_targets = get_morphable_targets(characters, base_style_ids)
+            morphable_targets = morphability_index.morphable_targets(base_style_ids)
         except StyleIdNotFoundError as e:
             msg = f"該当するスタイル(style_id={e.style_id})が見つかりません"
             raise HTTPException(status_code=404, detail=msg) from e
@@ -63,6 +71,50 @@ def generate_morphing_router(
             for morphable_target in morphable_targets
         ]
 
+    def get_morphing_parameter(
+        query: AudioQuery,
+        base_style_id: StyleId,
+        target_style_id: StyleId,
+        enable_interrogative_upspeak: bool,
+        analysis_mode: MorphingAnalysisMode | None,
+        core_version: str | None,
+    ) -> _MorphingParameter:
+        """モーフィングの可否を確認し、モーフィング用パラメータを得る。"""
+        version = core_version or LATEST_VERSION
+        resolved_analysis_mode = analysis_mode or default_analysis_mode
+        engine = tts_engines.get_tts_engine(version)
+
+        # モーフィングが許可されないキャラクターペアを拒否する
+        morphability_index = morphability_indexes.get(core_version)
+        try:
+            morphable = morphability_index.is_morphable(base_style_id, target_style_id)
+        except StyleIdNotFoundError as e:
+            msg = f"該当するスタイル(style_id={e.style_id})が見つかりません"
+            raise HTTPException(status_code=404, detail=msg) from e
+        if not morphable:
+            msg = "指定されたスタイルペアでのモーフィングはできません"
+            raise HTTPException(status_code=400, detail=msg)
+
+        # 生成したパラメータはキャッシュされ、モーフィングの割合のみが異なる要求では再利用される
+        return morphing_parameter_cache.get_or_create(
+            (
+                digest_query(query),
+                base_style_id,
+                target_style_id,
+                enable_interrogative_upspeak,
+                version,
+                resolved_analysis_mode,
+            ),
+            lambda: synthesis_morphing_parameter(
+                engine=engine,
+                query=query,
+                base_style_id=base_style_id,
+                target_style_id=target_style_id,
+                enable_interrogative_upspeak=enable_interrogative_upspeak,
+                analysis_mode=resolved_analysis_mode,
+            ),
+        )
+
     @router.post(
         "/synthesis_morphing",
         response_class=FileResponse,
@@ -87,6 +139,12 @@ def generate_morphing_router(
                 description="疑問系のテキストが与えられたら語尾を自動調整する",
             ),
         ] = True,
+        analysis_mode: Annotated[
+            MorphingAnalysisMode | SkipJsonSchema[None],
+            Query(
+                description="音声分析の方式。qualityは高品質・低速、fastは低品質・高速。指定しない場合はエンジンの設定に従う",
+            ),
+        ] = None,
         core_version: str | SkipJsonSchema[None] = None,
     ) -> FileResponse:
         """
@@ -94,45 +152,118 @@ def generate_morphing_router(
 
         モーフィングの割合は`morph_rate`で指定でき、0.0でベースのスタイル、1.0でターゲットのスタイルに近づきます。
         """
-        version = core_version or LATEST_VERSION
-        engine = tts_engines.get_tts_engine(version)
-
-        # モーフィングが許可されないキャラクターペアを拒否する
-        characters = metas_store.characters(core_version)
-        try:
-            morphable = is_morphable(characters, base_style_id, target_style_id)
-        except StyleIdNotFoundError as e:
-            msg = f"該当するスタイル(style_id={e.style_id})が見つかりません"
-            raise HTTPException(status_code=404, detail=msg) from e
-        if not morphable:
-            msg = "指定されたスタイルペアでのモーフィングはできません"
-            raise HTTPException(status_code=400, detail=msg)
-
-        # 生成したパラメータはキャッシュされる
-        morph_param = synthesis_morphing_parameter(
-            engine=engine,
-            query=query,
-            base_style_id=base_style_id,
-            target_style_id=target_style_id,
-            enable_interrogative_upspeak=enable_interrogative_upspeak,
-        )
-
-        morph_wave = synthesize_morphed_wave(
-            morph_param=morph_param,
-            morph_rate=morph_rate,
-            output_fs=query.outputSamplingRate,
-            output_stereo=query.outputStereo,
+        morph_param = get_morphing_parameter(
+            query,
+            base_style_id,
+            target_style_id,
+            enable_interrogative_upspeak,
+            analysis_mode,
+            core_version,
         )
 
+        # NOTE: 長い音声でもメモリを抑えられるよう、区間ごとに生成してファイルへ書き込む
         with NamedTemporaryFile(delete=False) as f:
-            soundfile.write(
-                file=f,
-                data=morph_wave,
+            with soundfile.SoundFile(
+                f,
+                mode="w",
                 samplerate=query.outputSamplingRate,
+                channels=2 if query.outputStereo else 1,
                 format="WAV",
-            )
+            ) as wav_file:
+                for morph_wave in synthesize_morphed_wave_chunks(
+                    morph_param=morph_param,
+                    morph_rate=morph_rate,
+                    output_fs=query.outputSamplingRate,
+                    output_stereo=query.outputStereo,
+                ):
+                    wav_file.write(morph_wave)
 
         background_tasks.add_task(try_delete_file, f.name)
         return FileResponse(f.name, media_type="audio/wav")
 
+    @router.post(
+        "/multi_synthesis_morphing",
+        response_class=FileResponse,
+        responses={
+            200: {
+                "content": {
+                    "application/zip": {
+                        "schema": {"type": "string", "format": "binary"}
+                    }
+                },
+            }
+        },
+        summary="2種類のスタイルで複数の割合でモーフィングした音声をまとめて合成する",
+    )
+    def multi_synthesis_morphing(
+        query: AudioQuery,
+        base_style_id: Annotated[StyleId, Query(alias="base_speaker")],
+        target_style_id: Annotated[StyleId, Query(alias="target_speaker")],
+        morph_rates: Annotated[
+            list[Annotated[float, Field(ge=0.0, le=1.0)]],
+            Query(description="モーフィングの割合の一覧", max_length=_MAX_MORPH_RATES),
+        ],
+        background_tasks: BackgroundTasks,
+        enable_interrogative_upspeak: Annotated[
+            bool,
+            Query(
+                description="疑問系のテキストが与えられたら語尾を自動調整する",
+            ),
+        ] = True,
+        analysis_mode: Annotated[
+            MorphingAnalysisMode | SkipJsonSchema[None],
+            Query(
+                description="音声分析の方式。qualityは高品質・低速、fastは低品質・高速。指定しない場合はエンジンの設定に従う",
+            ),
+        ] = None,
+        core_version: str | SkipJsonSchema[None] = None,
+    ) -> FileResponse:
+        """
+        指定された2種類のスタイルで音声を合成し、指定した割合それぞれでモーフィングした音声をzipでまとめて得ます。
+
+        音声の合成と分析は一度だけおこなわれます。zip内のファイルは`morph_rates`の順に`001.wav`から連番で名付けられます。
+        """
+        morph_param = get_morphing_parameter(
+            query,
+            base_style_id,
+            target_style_id,
+            enable_interrogative_upspeak,
+            analysis_mode,
+            core_version,
+        )
+
+        def synthesize(morph_rate: float) -> bytes:
+            """指定した割合でモーフィングした音声を WAV 形式で得る。"""
+            morph_wave = synthesize_morphed_wave(
+                morph_param=morph_param,
+                morph_rate=morph_rate,
+                output_fs=query.outputSamplingRate,
+                output_stereo=query.outputStereo,
+            )
+            with BytesIO() as wav_file:
+                soundfile.write(
+                    file=wav_file,
+                    data=morph_wave,
+                    samplerate=query.outputSamplingRate,
+                    format="WAV",
+                )
+                return wav_file.getvalue()
+
+        with NamedTemporaryFile(delete=False) as f:
+            try:
+                # NOTE: 全音声の合成を待たず、合成の完了した音声から `morph_rates` の順に zip へ書き込む
+                with (
+                    ThreadPoolExecutor(max_workers=_MAX_MORPHING_WORKERS) as executor,
+                    zipfile.ZipFile(f, mode="a") as zip_file,
+                ):
+                    for i, wav in enumerate(executor.map(synthesize, morph_rates)):
+                        zip_file.writestr(f"{str(i + 1).zfill(3)}.wav", wav)
+            except Exception:
+                f.close()
+                try_delete_file(f.name)
+                raise
+
+        background_tasks.add_task(try_delete_file, f.name)
+        return FileResponse(f.name, media_type="application/zip")
+
     return router
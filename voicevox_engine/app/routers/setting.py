@@ -8,6 +8,7 @@ from jinja2 import Environment, FileSystemLoader
 from pydantic.json_schema import SkipJsonSchema
 
 from voicevox_engine.engine_manifest import BrandName
+from voicevox_engine.morphing.model import MorphingAnalysisMode
 from voicevox_engine.setting.model import CorsPolicyMode
 from voicevox_engine.setting.setting_manager import Setting, SettingHandler
 from voicevox_engine.utility.path_utility import resource_root
@@ -38,6 +39,7 @@ def generate_setting_router(
 
         cors_policy_mode = settings.cors_policy_mode
         allow_origin = settings.allow_origin
+        morphing_analysis_mode = settings.morphing_analysis_mode
 
         if allow_origin is None:
             allow_origin = ""
@@ -49,6 +51,7 @@ def generate_setting_router(
                 "brand_name": brand_name,
                 "cors_policy_mode": cors_policy_mode.value,
                 "allow_origin": allow_origin,
+                "morphing_analysis_mode": morphing_analysis_mode.value,
             },
         )
 
@@ -56,11 +59,15 @@ def generate_setting_router(
     def setting_post(
         cors_policy_mode: Annotated[CorsPolicyMode, Form()],
         allow_origin: Annotated[str | SkipJsonSchema[None], Form()] = None,
+        morphing_analysis_mode: Annotated[
+            MorphingAnalysisMode, Form()
+        ] = MorphingAnalysisMode.quality,
     ) -> None:
         """設定を更新します。"""
         settings = Setting(
             cors_policy_mode=cors_policy_mode,
             allow_origin=allow_origin,
+            morphing_analysis_mode=morphing_analysis_mode,
         )
 
         # 更新した設定へ上書き
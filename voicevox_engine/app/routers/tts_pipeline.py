@@ -99,13 +99,22 @@ def generate_tts_pipeline_router(
         text: str,
         style_id: Annotated[StyleId, Query(alias="speaker")],
         enable_katakana_english: bool = True,
+        enable_sentence_pipeline: Annotated[
+            bool,
+            Query(
+                description="長いテキスト向けに、文ごとにテキスト解析と音素長・音高の生成を並行して処理する",
+            ),
+        ] = False,
         core_version: str | SkipJsonSchema[None] = None,
     ) -> AudioQuery:
         """音声合成用のクエリの初期値を得ます。ここで得られたクエリはそのまま音声合成に利用できます。各値の意味は`Schemas`を参照してください。"""
         version = core_version or LATEST_VERSION
         engine = tts_engines.get_tts_engine(version)
         accent_phrases = engine.create_accent_phrases(
-            text, style_id, enable_katakana_english
+            text,
+            style_id,
+            enable_katakana_english,
+            enable_sentence_pipeline=enable_sentence_pipeline,
         )
         return AudioQuery(
             accent_phrases=accent_phrases,
@@ -186,6 +195,12 @@ def generate_tts_pipeline_router(
         style_id: Annotated[StyleId, Query(alias="speaker")],
         is_kana: bool = False,
         enable_katakana_english: bool = True,
+        enable_sentence_pipeline: Annotated[
+            bool,
+            Query(
+                description="長いテキスト向けに、文ごとにテキスト解析と音素長・音高の生成を並行して処理する。is_kanaが`true`のときは無視される",
+            ),
+        ] = False,
         core_version: str | SkipJsonSchema[None] = None,
     ) -> list[AccentPhrase]:
         """
@@ -210,7 +225,12 @@ def generate_tts_pipeline_router(
                     status_code=400, detail=ParseKanaBadRequest(e).model_dump()
                 ) from e
         else:
-            return engine.create_accent_phrases(text, style_id, enable_katakana_english)
+            return engine.create_accent_phrases(
+                text,
+                style_id,
+                enable_katakana_english,
+                enable_sentence_pipeline=enable_sentence_pipeline,
+            )
 
     @router.post(
         "/mora_data",
@@ -277,12 +297,28 @@ def generate_tts_pipeline_router(
                 description="疑問系のテキストが与えられたら語尾を自動調整する",
             ),
         ] = True,
+        enable_sentence_pipeline: Annotated[
+            bool,
+            Query(
+                description="長いクエリ向けに、無音で区切られた区間ごとに特徴量生成と波形生成を並行して処理する",
+            ),
+        ] = False,
+        synthesis_session_id: Annotated[
+            str | SkipJsonSchema[None],
+            Query(
+                description="同じIDで続けて音声合成すると、前回の合成結果から変化した区間のみを波形生成し直す。指定した場合、enable_sentence_pipelineは無視される",
+            ),
+        ] = None,
         core_version: str | SkipJsonSchema[None] = None,
     ) -> FileResponse:
         version = core_version or LATEST_VERSION
         engine = tts_engines.get_tts_engine(version)
         wave = engine.synthesize_wave(
-            query, style_id, enable_interrogative_upspeak=enable_interrogative_upspeak
+            query,
+            style_id,
+            enable_interrogative_upspeak=enable_interrogative_upspeak,
+            enable_sentence_pipeline=enable_sentence_pipeline,
+            synthesis_session_id=synthesis_session_id,
         )
 
         with NamedTemporaryFile(delete=False) as f:
@@ -1,8 +1,20 @@
 """ユーザー辞書機能を提供する API Router"""
 
-from typing import Annotated
+import asyncio
+from io import TextIOWrapper
+from tempfile import SpooledTemporaryFile
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Path, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+)
 from pydantic import ValidationError
 from pydantic.json_schema import SkipJsonSchema
 
@@ -10,13 +22,21 @@ from voicevox_engine.user_dict.model import (
     USER_DICT_MAX_PRIORITY,
     USER_DICT_MIN_PRIORITY,
     UserDictWord,
+    UserDictWordOperation,
     WordTypes,
 )
 from voicevox_engine.user_dict.user_dict_manager import UserDictionary
-from voicevox_engine.user_dict.user_dict_word import UserDictInputError, WordProperty
+from voicevox_engine.user_dict.user_dict_word import (
+    UserDictInputError,
+    UserDictOperationsError,
+    WordProperty,
+)
 
 from ..dependencies import VerifyMutabilityAllowed
 
+# インポートするユーザー辞書をメモリ上に保持する上限サイズ。超えた分は一時ファイルへ書き出す。
+_IMPORT_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
 
 def generate_user_dict_router(
     user_dict: UserDictionary, verify_mutability: VerifyMutabilityAllowed
@@ -26,16 +46,20 @@ def generate_user_dict_router(
 
     @router.get(
         "/user_dict",
+        response_model=dict[str, UserDictWord],
         response_description="単語のUUIDとその詳細",
     )
-    def get_user_dict_words() -> dict[str, UserDictWord]:
+    def get_user_dict_words() -> Response:
         """
         ユーザー辞書に登録されている単語の一覧を返します。
 
         単語の表層形(surface)は正規化済みの物を返します。
         """
         try:
-            return user_dict.read_dict()
+            # NOTE: 単語数が多い場合に備え、シリアライズ済みの JSON をそのまま返す
+            return Response(
+                content=user_dict.read_dict_json(), media_type="application/json"
+            )
         except UserDictInputError as e:
             raise HTTPException(status_code=422, detail=str(e)) from e
         except Exception as e:
@@ -195,4 +219,84 @@ def generate_user_dict_router(
                 status_code=500, detail="ユーザー辞書のインポートに失敗しました。"
             ) from e
 
+    @router.post(
+        "/import_user_dict_file",
+        status_code=204,
+        dependencies=[Depends(verify_mutability)],
+    )
+    async def import_user_dict_file(
+        request: Request,
+        file_format: Annotated[
+            Literal["csv", "ndjson"],
+            Query(
+                description="ユーザー辞書の形式。csv（MeCab の辞書 CSV 形式）、ndjson（各行が単語のUUIDとその詳細からなる JSON）のいずれか"
+            ),
+        ],
+        override: Annotated[
+            bool, Query(description="重複したエントリがあった場合、上書きするかどうか")
+        ],
+    ) -> None:
+        """
+        CSV または NDJSON 形式のユーザー辞書をインポートします。
+
+        UTF-8 のユーザー辞書ファイルをリクエストボディとして送信してください。
+        ファイルは 1 行ずつ検証され、誤りがある場合は辞書を変更せずに誤りのある行を返します。
+        CSV の言葉には内容から決まる UUID が割り当てられます。
+        """
+        loop = asyncio.get_event_loop()
+        with SpooledTemporaryFile(max_size=_IMPORT_SPOOL_MAX_SIZE) as body:
+            # NOTE: 巨大な辞書でもメモリを圧迫しないよう、リクエストボディを逐次書き出す
+            # NOTE: 上限を超えるとディスクへ書き出されるため、イベントループを塞がないよう別スレッドで書き込む
+            async for chunk in request.stream():
+                await loop.run_in_executor(None, body.write, chunk)
+            body.seek(0)
+            lines = TextIOWrapper(body, encoding="utf-8-sig", newline="")
+            try:
+                await loop.run_in_executor(
+                    None,
+                    user_dict.import_user_dict_lines,
+                    lines,
+                    file_format,
+                    override,
+                )
+            except UnicodeDecodeError as e:
+                raise HTTPException(
+                    status_code=422, detail="UTF-8 のテキストを送信してください。"
+                ) from e
+            except UserDictInputError as e:
+                raise HTTPException(status_code=422, detail=str(e)) from e
+            except Exception as e:
+                raise HTTPException(
+                    status_code=500, detail="ユーザー辞書のインポートに失敗しました。"
+                ) from e
+            finally:
+                lines.detach()
+
+    @router.post(
+        "/user_dict_operations",
+        response_description="各操作の対象となった言葉のUUID",
+        dependencies=[Depends(verify_mutability)],
+    )
+    def apply_user_dict_operations(
+        operations: Annotated[
+            list[UserDictWordOperation],
+            Body(description="先頭から順に適用する、言葉の追加・更新・削除の一覧"),
+        ],
+    ) -> list[str]:
+        """
+        ユーザー辞書に対する言葉の追加・更新・削除を一括で行います。
+
+        全ての操作に誤りがない場合のみ辞書へ反映され、辞書の更新は一度だけ行われます。
+        誤りがある場合は辞書を変更せず、誤りのある操作のインデックスとエラー内容を返します。
+        """
+        try:
+            return user_dict.apply_operations(operations)
+        except UserDictOperationsError as e:
+            detail = [{"index": index, "msg": msg} for index, msg in e.errors.items()]
+            raise HTTPException(status_code=422, detail=detail) from e
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail="ユーザー辞書の更新に失敗しました。"
+            ) from e
+
     return router
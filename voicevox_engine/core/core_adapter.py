@@ -74,14 +74,14 @@ class CoreAdapter:
         """デフォルトのサンプリングレート。"""
         return self.core.default_sampling_rate
 
-    @property
+    @cached_property
     def characters(self) -> list[CoreCharacter]:
-        """キャラクター情報"""
+        """キャラクター情報（読み込み済みのコアでは変化しないため、初回のみ解析し、以降は同じインスタンスを返す）"""
         return _core_characters_adapter.validate_json(self.core.metas())
 
-    @property
+    @cached_property
     def supported_devices(self) -> DeviceSupport | None:
-        """デバイスサポート情報（None: 情報無し）"""
+        """デバイスサポート情報（None: 情報無し）（初回のみ解析する）"""
         try:
             supported_devices = json.loads(self.core.supported_devices())
             assert isinstance(supported_devices, dict)
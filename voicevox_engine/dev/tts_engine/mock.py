@@ -1,6 +1,5 @@
 """TTSEngine のモック"""
 
-import copy
 from typing import Final
 
 import numpy as np
@@ -10,6 +9,7 @@ from pyopenjtalk import tts
 from ...metas.metas import StyleId
 from ...model import AudioQuery
 from ...tts_pipeline.audio_postprocessing import raw_wave_to_output_wave
+from ...tts_pipeline.frontend_pool import TextFrontendPool
 from ...tts_pipeline.tts_engine import (
     TTSEngine,
     to_flatten_moras,
@@ -20,21 +20,26 @@ from ..core.mock import MockCoreWrapper
 class MockTTSEngine(TTSEngine):
     """製品版コア無しに音声合成が可能なモック版TTSEngine"""
 
-    def __init__(self) -> None:
-        super().__init__(MockCoreWrapper())
+    def __init__(
+        self,
+        text_frontend_pool: TextFrontendPool | None = None,
+        prediction_cache_size: int = 0,
+    ) -> None:
+        super().__init__(MockCoreWrapper(), text_frontend_pool, prediction_cache_size)
 
     def synthesize_wave(
         self,
         query: AudioQuery,
         style_id: StyleId,
         enable_interrogative_upspeak: bool,
+        enable_sentence_pipeline: bool = False,
+        synthesis_session_id: str | None = None,
     ) -> NDArray[np.float32]:
-        """音声合成用のクエリに含まれる読み仮名に基づいてOpenJTalkで音声波形を生成する。モーラごとの調整は反映されない。"""
+        """音声合成用のクエリに含まれる読み仮名に基づいてOpenJTalkで音声波形を生成する。モーラごとの調整・文ごとのパイプライン処理・差分合成は反映されない。"""
         # 不正なスタイルIDが渡されたときの動作を製品版に揃えるため、スタイルの存在チェックをする
         self._core._assert_style_supports_feature(style_id, "talk")
 
-        # モーフィング時などに同一参照のqueryで複数回呼ばれる可能性があるので、元の引数のqueryに破壊的変更を行わない
-        query = copy.deepcopy(query)
+        # NOTE: モーフィング時などに同一参照のqueryで複数回呼ばれる可能性があるが、以降の処理はqueryを読み取るのみで変更しない
 
         # recall text in katakana
         flatten_moras = to_flatten_moras(query.accent_phrases)
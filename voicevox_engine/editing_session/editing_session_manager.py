@@ -0,0 +1,291 @@
+"""編集セッションの管理"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Final
+from uuid import uuid4
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from ..model import AudioQuery
+from ..tts_pipeline.model import AccentPhrase
+from .model import AudioQueryDelta
+
+# 最後の操作からこの秒数が経過した編集セッションは破棄される
+_SESSION_TTL_SEC: Final = 30 * 60
+# 同時に保持する編集セッションの最大数。超えた場合は最も長く使われていないものから破棄される
+_MAX_SESSIONS: Final = 64
+
+_MORA_VALUE_PATTERN = re.compile(
+    r"/accent_phrases/(\d+)/moras/(\d+)/(pitch|vowel_length|consonant_length)"
+)
+_PAUSE_MORA_VALUE_PATTERN = re.compile(r"/accent_phrases/(\d+)/pause_mora/vowel_length")
+_ACCENT_PHRASE_VALUE_PATTERN = re.compile(
+    r"/accent_phrases/(\d+)/(accent|is_interrogative)"
+)
+_QUERY_VALUE_PATTERN = re.compile(
+    r"/(speedScale|pitchScale|intonationScale|volumeScale|prePhonemeLength"
+    r"|postPhonemeLength|pauseLength|pauseLengthScale|outputSamplingRate|outputStereo)"
+)
+
+# 変更可能な値の名前から、値の検証器への対応
+_value_adapters: dict[str, TypeAdapter[Any]] = {
+    "pitch": TypeAdapter(float),
+    "vowel_length": TypeAdapter(float),
+    "consonant_length": TypeAdapter(float),
+    "accent": TypeAdapter(int),
+    "is_interrogative": TypeAdapter(bool),
+    "speedScale": TypeAdapter(float),
+    "pitchScale": TypeAdapter(float),
+    "intonationScale": TypeAdapter(float),
+    "volumeScale": TypeAdapter(float),
+    "prePhonemeLength": TypeAdapter(float),
+    "postPhonemeLength": TypeAdapter(float),
+    "pauseLength": TypeAdapter(float | None),
+    "pauseLengthScale": TypeAdapter(float),
+    "outputSamplingRate": TypeAdapter(int),
+    "outputStereo": TypeAdapter(bool),
+}
+
+
+class EditingSessionNotFoundError(Exception):
+    """編集セッションが存在しない（期限切れを含む）エラー"""
+
+    pass
+
+
+class EditingSessionInputError(Exception):
+    """受け入れ不可能な変更に起因するエラー"""
+
+    pass
+
+
+@dataclass
+class _EditingSession:
+    query: AudioQuery
+    last_accessed_at: float
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _resolve_target(query: AudioQuery, path: str) -> tuple[BaseModel, str]:
+    """JSON Pointer が指す値をもつモデルと、その値の名前を得る。"""
+    try:
+        if match := _MORA_VALUE_PATTERN.fullmatch(path):
+            phrase_index, mora_index, name = match.groups()
+            mora = query.accent_phrases[int(phrase_index)].moras[int(mora_index)]
+            if name == "consonant_length" and mora.consonant is None:
+                raise EditingSessionInputError(
+                    f"{path}: 子音の無いモーラの子音長は変更できません"
+                )
+            return mora, name
+        if match := _PAUSE_MORA_VALUE_PATTERN.fullmatch(path):
+            pause_mora = query.accent_phrases[int(match.group(1))].pause_mora
+            if pause_mora is None:
+                raise EditingSessionInputError(f"{path}: 無音モーラが存在しません")
+            return pause_mora, "vowel_length"
+        if match := _ACCENT_PHRASE_VALUE_PATTERN.fullmatch(path):
+            phrase_index, name = match.groups()
+            return query.accent_phrases[int(phrase_index)], name
+    except IndexError as e:
+        raise EditingSessionInputError(f"{path}: 範囲外の位置です") from e
+    if match := _QUERY_VALUE_PATTERN.fullmatch(path):
+        return query, match.group(1)
+    raise EditingSessionInputError(f"{path}: 変更できない位置です")
+
+
+def _validate_delta(
+    query: AudioQuery, delta: AudioQueryDelta
+) -> tuple[BaseModel, str, Any]:
+    """変更を検証し、変更対象のモデル・値の名前・検証済みの新しい値を得る。"""
+    target, name = _resolve_target(query, delta.path)
+    try:
+        value = _value_adapters[name].validate_python(delta.value)
+    except ValidationError as e:
+        raise EditingSessionInputError(f"{delta.path}: 値が不正です") from e
+    if isinstance(target, AccentPhrase) and name == "accent":
+        if not 1 <= value <= len(target.moras):
+            raise EditingSessionInputError(
+                f"{delta.path}: アクセント位置はモーラ数以下の正の整数でなければなりません"
+            )
+    return target, name, value
+
+
+def _regenerate_pitches(
+    accent_phrases: list[AccentPhrase],
+    indices: set[int],
+    update_pitch: Callable[[list[AccentPhrase]], list[AccentPhrase]],
+) -> list[AudioQueryDelta]:
+    """
+    アクセント句系列全体からモーラの音高を生成し、指定したアクセント句へのみ書き戻して、変化した音高を返す。
+
+    `update_pitch` がアクセント句を直接書き換えても、指定外のアクセント句の音高は元に戻される。
+    """
+    # NOTE: モデルを複製せず、書き戻しと失敗時の復元に必要な音高の値のみを控える
+    previous_pitches = [
+        (mora, mora.pitch)
+        for accent_phrase in accent_phrases
+        for mora in accent_phrase.moras
+        + ([accent_phrase.pause_mora] if accent_phrase.pause_mora else [])
+    ]
+    try:
+        predicted_accent_phrases = update_pitch(accent_phrases)
+        predicted_pitches = {
+            i: [mora.pitch for mora in predicted_accent_phrases[i].moras]
+            for i in indices
+        }
+    finally:
+        for mora, pitch in previous_pitches:
+            mora.pitch = pitch
+
+    changes: list[AudioQueryDelta] = []
+    for i in sorted(indices):
+        for j, (mora, pitch) in enumerate(
+            zip(accent_phrases[i].moras, predicted_pitches[i], strict=True)
+        ):
+            if mora.pitch == pitch:
+                continue
+            mora.pitch = pitch
+            changes.append(
+                AudioQueryDelta(
+                    path=f"/accent_phrases/{i}/moras/{j}/pitch", value=float(pitch)
+                )
+            )
+    return changes
+
+
+class EditingSessionManager:
+    """
+    編集セッションの管理。
+
+    編集セッションは音声合成用のクエリをサーバー側で保持し、値ごとの小さな変更を受け付ける。
+    一定時間操作の無い編集セッションは破棄される。
+    """
+
+    def __init__(
+        self, ttl: float = _SESSION_TTL_SEC, max_sessions: int = _MAX_SESSIONS
+    ) -> None:
+        self._ttl = ttl
+        self._max_sessions = max_sessions
+        self._sessions: OrderedDict[str, _EditingSession] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _expire_sessions(self, now: float) -> None:
+        """期限切れの編集セッションと、最大数を超えた編集セッションを破棄する。"""
+        while len(self._sessions) != 0:
+            oldest = next(iter(self._sessions.values()))
+            if (
+                now - oldest.last_accessed_at <= self._ttl
+                and len(self._sessions) <= self._max_sessions
+            ):
+                break
+            self._sessions.popitem(last=False)
+
+    def _get_session(self, session_id: str) -> _EditingSession:
+        """編集セッションを取得し、最終操作時刻を更新する。"""
+        now = time.monotonic()
+        with self._lock:
+            self._expire_sessions(now)
+            session = self._sessions.get(session_id)
+            if session is None:
+                raise EditingSessionNotFoundError(
+                    f"編集セッション {session_id} が見つかりません"
+                )
+            session.last_accessed_at = now
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def create_session(self, query: AudioQuery) -> str:
+        """音声合成用のクエリから編集セッションを作成し、編集セッション ID を返す。"""
+        session_id = str(uuid4())
+        now = time.monotonic()
+        with self._lock:
+            self._sessions[session_id] = _EditingSession(query, now)
+            self._expire_sessions(now)
+        return session_id
+
+    def get_query(self, session_id: str) -> AudioQuery:
+        """編集セッションが保持する音声合成用のクエリの複製を取得する。複製は変更してよい。"""
+        return self.read_query(session_id, lambda query: query.model_copy(deep=True))
+
+    def read_query[T](self, session_id: str, read: Callable[[AudioQuery], T]) -> T:
+        """
+        編集セッションが保持する音声合成用のクエリを、他の操作と排他して関数で読み取る。
+
+        クエリは複製されずに渡されるため、`read` はクエリを変更してはならず、呼び出しの外へクエリを持ち出してはならない。
+        """
+        session = self._get_session(session_id)
+        with session.lock:
+            return read(session.query)
+
+    def apply_deltas(
+        self,
+        session_id: str,
+        deltas: list[AudioQueryDelta],
+        update_pitch: Callable[[list[AccentPhrase]], list[AccentPhrase]] | None = None,
+    ) -> list[AudioQueryDelta]:
+        """
+        編集セッションが保持する音声合成用のクエリへ変更を順に適用し、実際に変化した値の一覧を返す。
+
+        いずれかの変更が受け入れ不可能な場合や音高の生成に失敗した場合、どの変更も適用されない。
+
+        Parameters
+        ----------
+        session_id : str
+            編集セッション ID
+        deltas : list[AudioQueryDelta]
+            変更の一覧
+        update_pitch : Callable[[list[AccentPhrase]], list[AccentPhrase]] | None
+            アクセント位置が変化した場合にモーラの音高を生成し直す関数。None の場合は生成し直さない。
+            音高は系列全体から生成するが、書き戻すのはアクセント位置が変化したアクセント句のみである。
+
+        Returns
+        -------
+        changes : list[AudioQueryDelta]
+            変化した値の一覧。音高を生成し直した場合、変化したモーラの音高を含む。
+        """
+        session = self._get_session(session_id)
+        with session.lock:
+            query = session.query
+            # NOTE: 全ての変更を適用前に検証し、受け入れ不可能な変更があればクエリを変更せずに失敗する
+            validated = [
+                (delta.path, *_validate_delta(query, delta)) for delta in deltas
+            ]
+
+            changes: list[AudioQueryDelta] = []
+            # 音高の生成に失敗した場合に変更を取り消すための、変更前の値の一覧
+            undo_log: list[tuple[BaseModel, str, Any]] = []
+            accent_changed_indices: set[int] = set()
+            for path, target, name, value in validated:
+                previous_value = getattr(target, name)
+                if previous_value == value:
+                    continue
+                setattr(target, name, value)
+                undo_log.append((target, name, previous_value))
+                changes.append(AudioQueryDelta(path=path, value=value))
+                if name == "accent":
+                    match = _ACCENT_PHRASE_VALUE_PATTERN.fullmatch(path)
+                    assert match is not None
+                    accent_changed_indices.add(int(match.group(1)))
+
+            if update_pitch is not None and len(accent_changed_indices) != 0:
+                try:
+                    changes += _regenerate_pitches(
+                        query.accent_phrases, accent_changed_indices, update_pitch
+                    )
+                except BaseException:
+                    for target, name, previous_value in reversed(undo_log):
+                        setattr(target, name, previous_value)
+                    raise
+            return changes
+
+    def delete_session(self, session_id: str) -> None:
+        """編集セッションを破棄する。"""
+        with self._lock:
+            if self._sessions.pop(session_id, None) is None:
+                raise EditingSessionNotFoundError(
+                    f"編集セッション {session_id} が見つかりません"
+                )
@@ -0,0 +1,20 @@
+"""
+編集セッション機能を提供する API Router と編集セッションマネージャーが共有するモデル
+
+このモジュールで定義されるモデルは API スキーマとして使われるため、ユーザー向けに丁寧に書く。
+"""
+
+from pydantic import BaseModel, Field
+
+
+class AudioQueryDelta(BaseModel):
+    """音声合成用のクエリの値ひとつに対する変更。JSON Patch の replace 操作に相当する。"""
+
+    path: str = Field(
+        description="変更する値の位置を表す JSON Pointer。"
+        "/accent_phrases/{i}/moras/{j}/pitch・vowel_length・consonant_length、"
+        "/accent_phrases/{i}/pause_mora/vowel_length、"
+        "/accent_phrases/{i}/accent・is_interrogative、"
+        "および /speedScale などのクエリ全体の設定値を指定できる"
+    )
+    value: int | float | bool | None = Field(description="新しい値")
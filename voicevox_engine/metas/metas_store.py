@@ -1,14 +1,16 @@
 """キャラクター情報とキャラクターメタ情報の管理"""
 
+import threading
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Final, Literal, assert_never
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from voicevox_engine.core.core_adapter import CoreCharacter, CoreCharacterStyle
 from voicevox_engine.metas.metas import (
+    Speaker,
     SpeakerInfo,
     SpeakerStyle,
     SpeakerSupportedFeatures,
@@ -27,7 +29,7 @@ def cast_styles(cores: list[CoreCharacterStyle]) -> list[SpeakerStyle]:
     ]
 
 
-@dataclass
+@dataclass(frozen=True)
 class Character:
     """キャラクター"""
 
@@ -51,8 +53,62 @@ class _EngineCharacter(BaseModel):
     )
 
 
+@dataclass(frozen=True)
+class _CharacterDirectory:
+    """エンジンに含まれるキャラクター情報ディレクトリの索引。"""
+
+    # policy.md の内容（存在しない場合は None）
+    policy: str | None
+    # portraits/ に立ち絵が存在するスタイルの ID
+    portrait_style_ids: frozenset[StyleId]
+
+
+def _index_character_directory(character_path: Path) -> _CharacterDirectory:
+    """キャラクター情報ディレクトリの索引を生成する。"""
+    policy_path = character_path / "policy.md"
+    policy = policy_path.read_text("utf-8") if policy_path.is_file() else None
+    portrait_style_ids = frozenset(
+        StyleId(int(portrait_path.stem))
+        for portrait_path in (character_path / "portraits").glob("*.png")
+        if portrait_path.stem.isdecimal()
+    )
+    return _CharacterDirectory(policy=policy, portrait_style_ids=portrait_style_ids)
+
+
 type GetCoreCharacters = Callable[[str | None], list[CoreCharacter]]
 
+_speakers_adapter = TypeAdapter(list[Speaker])
+
+
+def _characters_to_speakers(characters: tuple[Character, ...]) -> list[Speaker]:
+    """キャラクターの一覧を `Speaker` のリストへキャストする。"""
+    return [
+        Speaker(
+            name=character.name,
+            speaker_uuid=character.uuid,
+            styles=character.talk_styles + character.sing_styles,
+            version=character.version,
+            supported_features=character.supported_features,
+        )
+        for character in characters
+    ]
+
+
+@dataclass(frozen=True)
+class CharacterCatalogue:
+    """
+    あるコアバージョンにおけるキャラクター情報の一覧のスナップショット。
+
+    キャッシュされ複数のリクエストで共有されるため、保持する値を変更してはならない。
+    """
+
+    characters: tuple[Character, ...]
+    talk_characters: tuple[Character, ...]
+    sing_characters: tuple[Character, ...]
+    # 喋れる・歌えるキャラクターそれぞれの `list[Speaker]` をシリアライズした JSON
+    talk_speakers_json: bytes
+    sing_speakers_json: bytes
+
 
 class CharacterNotFoundError(Exception):
     """指定されたキャラクターが見つからない。"""
@@ -84,17 +140,41 @@ class MetasStore:
         self._characters_path = engine_characters_path
         self._get_core_characters = get_core_characters
         self._resource_manager = resource_manager
-        # エンジンに含まれる各キャラクターのメタ情報
-        self._loaded_metas: dict[str, _EngineCharacter] = {
-            folder.name: _EngineCharacter.model_validate_json(
+        # コアバージョンごとのキャラクター情報の一覧のスナップショット
+        self._catalogues: dict[str | None, CharacterCatalogue] = {}
+        self._catalogues_lock = threading.Lock()
+        # エンジンに含まれる各キャラクターのメタ情報と、情報ディレクトリの索引
+        # NOTE: キャラクター情報の取得のたびにファイルの存在を確認しないよう、起動時に索引を生成する
+        self._loaded_metas: dict[str, _EngineCharacter] = {}
+        self._character_dirs: dict[str, _CharacterDirectory] = {}
+        for folder in engine_characters_path.iterdir():
+            if not folder.is_dir():
+                continue
+            self._loaded_metas[folder.name] = _EngineCharacter.model_validate_json(
                 (folder / "metas.json").read_text(encoding="utf-8")
             )
-            for folder in engine_characters_path.iterdir()
-            if folder.is_dir()
-        }
+            self._character_dirs[folder.name] = _index_character_directory(folder)
 
-    def characters(self, core_version: str | None) -> list[Character]:
-        """キャラクターの情報の一覧を取得する。"""
+    def catalogue(self, core_version: str | None) -> CharacterCatalogue:
+        """
+        キャラクター情報の一覧のスナップショットを取得する。
+
+        スナップショットはコアバージョンごとに初回のみ生成し、`clear_cache()` が呼ばれるまで使い回す。
+        """
+        with self._catalogues_lock:
+            catalogue = self._catalogues.get(core_version)
+            if catalogue is None:
+                catalogue = self._generate_catalogue(core_version)
+                self._catalogues[core_version] = catalogue
+            return catalogue
+
+    def clear_cache(self) -> None:
+        """キャラクター情報の一覧のスナップショットをすべて破棄する。"""
+        with self._catalogues_lock:
+            self._catalogues.clear()
+
+    def _generate_catalogue(self, core_version: str | None) -> CharacterCatalogue:
+        """キャラクター情報の一覧のスナップショットを生成する。"""
         # エンジンとコアのキャラクター情報を統合する
         characters: list[Character] = []
         for core_character in self._get_core_characters(core_version):
@@ -117,7 +197,24 @@ class MetasStore:
                     supported_features=engine_character.supported_features,
                 )
             )
-        return characters
+
+        talk_characters = tuple(filter_characters_and_styles(characters, "talk"))
+        sing_characters = tuple(filter_characters_and_styles(characters, "sing"))
+        return CharacterCatalogue(
+            characters=tuple(characters),
+            talk_characters=talk_characters,
+            sing_characters=sing_characters,
+            talk_speakers_json=_speakers_adapter.dump_json(
+                _characters_to_speakers(talk_characters)
+            ),
+            sing_speakers_json=_speakers_adapter.dump_json(
+                _characters_to_speakers(sing_characters)
+            ),
+        )
+
+    def characters(self, core_version: str | None) -> list[Character]:
+        """キャラクターの情報の一覧を取得する。"""
+        return list(self.catalogue(core_version).characters)
 
     def character_info(
         self,
@@ -171,8 +268,13 @@ class MetasStore:
         #         ...
 
         # 該当キャラクターを検索する
-        characters = self.characters(core_version)
-        characters = filter_characters_and_styles(characters, talk_or_sing)
+        catalogue = self.catalogue(core_version)
+        if talk_or_sing == "talk":
+            characters = catalogue.talk_characters
+        elif talk_or_sing == "sing":
+            characters = catalogue.sing_characters
+        else:
+            assert_never(talk_or_sing)
         character = next(
             filter(lambda character: character.uuid == character_uuid, characters), None
         )
@@ -180,13 +282,14 @@ class MetasStore:
             raise CharacterNotFoundError("該当するキャラクターが見つかりません")
 
         # キャラクター情報を取得する
+        # NOTE: リソースの base64 文字列は ResourceManager にキャッシュされるため、繰り返しの取得ではディスクを読まない
+        character_dir = self._character_dirs.get(character_uuid)
+        if character_dir is None or character_dir.policy is None:
+            raise CharacterInfoNotFoundError("キャラクター情報が見つかりません")
+        policy = character_dir.policy
         try:
             character_path = self._characters_path / character_uuid
 
-            # character policy
-            policy_path = character_path / "policy.md"
-            policy = policy_path.read_text("utf-8")
-
             def _resource_str(path: Path) -> str:
                 resource_str = self._resource_manager.resource_str(
                     path, "hash" if resource_format == "url" else "base64"
@@ -211,7 +314,7 @@ class MetasStore:
                 # style portrait
                 style_portrait_path = character_path / "portraits" / f"{id}.png"
                 style_portrait = None
-                if style_portrait_path.exists():
+                if id in character_dir.portrait_style_ids:
                     style_portrait = _resource_str(style_portrait_path)
 
                 # voice samples
@@ -239,35 +342,35 @@ class MetasStore:
 
     def talk_characters(self, core_version: str | None) -> list[Character]:
         """話せるキャラクターの情報の一覧を取得する。"""
-        return filter_characters_and_styles(self.characters(core_version), "talk")
+        return list(self.catalogue(core_version).talk_characters)
 
     def sing_characters(self, core_version: str | None) -> list[Character]:
         """歌えるキャラクターの情報の一覧を取得する。"""
-        return filter_characters_and_styles(self.characters(core_version), "sing")
+        return list(self.catalogue(core_version).sing_characters)
 
 
 def filter_characters_and_styles(
     characters: list[Character],
     talk_or_sing: Literal["talk", "sing"],
 ) -> list[Character]:
-    """キャラクター内のスタイルをtalk系・sing系のみにする。スタイル数が0になったキャラクターは除外する。"""
+    """
+    キャラクター内のスタイルをtalk系・sing系のみにする。スタイル数が0になったキャラクターは除外する。
+
+    引数のキャラクターは変更せず、スタイルを絞り込んだ複製を返す。
+    """
     if talk_or_sing == "talk":
-        # talk 系スタイルを持たないキャラクターを除外する
-        talk_characters = list(
-            filter(lambda character: len(character.talk_styles) > 0, characters)
-        )
-        # sing 系スタイルを除外する
-        for talk_character in talk_characters:
-            talk_character.sing_styles = []
-        return talk_characters
+        # talk 系スタイルを持たないキャラクターを除外し、sing 系スタイルを除外する
+        return [
+            replace(character, sing_styles=[])
+            for character in characters
+            if len(character.talk_styles) > 0
+        ]
     elif talk_or_sing == "sing":
-        # sing 系スタイルを持たないキャラクターを除外する
-        sing_characters = list(
-            filter(lambda character: len(character.sing_styles) > 0, characters)
-        )
-        # talk 系スタイルを除外する
-        for sing_character in sing_characters:
-            sing_character.talk_styles = []
-        return sing_characters
+        # sing 系スタイルを持たないキャラクターを除外し、talk 系スタイルを除外する
+        return [
+            replace(character, talk_styles=[])
+            for character in characters
+            if len(character.sing_styles) > 0
+        ]
     else:
         assert_never(talk_or_sing)
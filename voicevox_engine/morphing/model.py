@@ -4,6 +4,8 @@
 モデルの注意点は `voicevox_engine/model.py` の module docstring を確認すること。
 """
 
+from enum import StrEnum
+
 from pydantic import BaseModel, Field
 
 
@@ -15,3 +17,12 @@ class MorphableTargetInfo(BaseModel):
     )
     # FIXME: add reason property
     # reason: str | None = Field(description="is_morphableがfalseである場合、その理由")
+
+
+class MorphingAnalysisMode(StrEnum):
+    """モーフィング用の音声分析の方式。"""
+
+    quality = (
+        "quality"  # harvest で基本周波数を推定し、1 ms 間隔で分析する。高品質だが低速
+    )
+    fast = "fast"  # dio と stonemask で基本周波数を推定し、5 ms 間隔で分析する。高速だが低品質
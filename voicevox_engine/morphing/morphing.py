@@ -2,19 +2,24 @@
 WORLDを使ってモーフィングする。
 
 pyworldの入出力はnp.doubleやnp.float64なので注意。
+モーフィングは利用頻度が低いため、起動時間短縮のためにpyworldは初回利用時に読み込む。
 """
 
-from copy import deepcopy
+import math
+import os
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from itertools import chain
+from typing import Final, Literal
 
 import numpy as np
-import pyworld as pw
 from numpy.typing import NDArray
-from soxr import resample
+from soxr import ResampleStream, resample
 
 from voicevox_engine.metas.metas_store import Character
-from voicevox_engine.morphing.model import MorphableTargetInfo
+from voicevox_engine.morphing.model import MorphableTargetInfo, MorphingAnalysisMode
 
 from ..metas.metas import StyleId
 from ..model import AudioQuery
@@ -33,12 +38,138 @@ class StyleIdNotFoundError(LookupError):
 
 @dataclass(frozen=True)
 class _MorphingParameter:
+    """
+    モーフィング用パラメータ。
+
+    スペクトル包絡と非周期性指標はキャッシュ時のメモリを抑えるため float32 で保持し、WORLD による合成の直前に float64 へ戻す。
+    """
+
     fs: int
     frame_period: float
     base_f0: NDArray[np.float64]
-    base_aperiodicity: NDArray[np.float64]
-    base_spectrogram: NDArray[np.float64]
-    target_spectrogram: NDArray[np.float64]
+    base_aperiodicity: NDArray[np.float32]
+    base_spectrogram: NDArray[np.float32]
+    target_spectrogram: NDArray[np.float32]
+
+
+@dataclass(frozen=True)
+class _MorphableStyle:
+    """モーフィング可否の判定に必要なスタイルの情報"""
+
+    character_uuid: str
+    permitted_synthesis_morphing: Literal["ALL", "SELF_ONLY", "NOTHING"]
+    is_sing: bool
+
+
+class MorphabilityIndex:
+    """
+    スタイル ID の組がモーフィング可能か判定するための索引。
+
+    キャラクター一覧から一度だけ構築し、以降の判定はスタイル ID の組ごとに定数時間でおこなう。
+    """
+
+    def __init__(self, characters: list[Character]) -> None:
+        # スタイル ID にモーフィング可否の判定に必要な情報を紐付ける。
+        # NOTE: 同じスタイル ID が複数ある場合は後に現れたものを採用する
+        self._styles: dict[StyleId, _MorphableStyle] = {}
+        for character in characters:
+            permission = character.supported_features.permitted_synthesis_morphing
+            for style in character.talk_styles:
+                self._styles[style.id] = _MorphableStyle(
+                    character.uuid, permission, False
+                )
+            for style in character.sing_styles:
+                self._styles[style.id] = _MorphableStyle(
+                    character.uuid, permission, True
+                )
+        # 判定結果を返す順序はキャラクター一覧に初めて現れた順とする
+        self._style_ids = list(
+            dict.fromkeys(
+                style.id
+                for style in chain.from_iterable(
+                    character.talk_styles + character.sing_styles
+                    for character in characters
+                )
+            )
+        )
+
+    def is_morphable(self, style_id_1: StyleId, style_id_2: StyleId) -> bool:
+        """指定された２つのスタイル ID がモーフィング可能か判定する。"""
+        try:
+            style_1 = self._styles[style_id_1]
+        except KeyError as e:
+            raise StyleIdNotFoundError(style_id_1) from e
+        try:
+            style_2 = self._styles[style_id_2]
+        except KeyError as e:
+            raise StyleIdNotFoundError(style_id_2) from e
+
+        # モーフィング機能はソングに対応していない
+        if style_1.is_sing or style_2.is_sing:
+            return False
+
+        morphable_1 = style_1.permitted_synthesis_morphing
+        morphable_2 = style_2.permitted_synthesis_morphing
+
+        # 禁止されている場合はFalse
+        if morphable_1 == "NOTHING" or morphable_2 == "NOTHING":
+            return False
+
+        # 同一キャラクターのみの場合は同一キャラクター判定
+        if morphable_1 == "SELF_ONLY" or morphable_2 == "SELF_ONLY":
+            return style_1.character_uuid == style_2.character_uuid
+
+        # 念のため許可されているかチェック
+        return morphable_1 == "ALL" and morphable_2 == "ALL"
+
+    def morphable_targets(
+        self, base_style_ids: list[StyleId]
+    ) -> list[dict[StyleId, MorphableTargetInfo]]:
+        """指定されたベーススタイルそれぞれに対し、全スタイルのモーフィング可否の一覧を生成する。"""
+        return [
+            {
+                style_id: MorphableTargetInfo(
+                    is_morphable=self.is_morphable(base_style_id, style_id)
+                )
+                for style_id in self._style_ids
+            }
+            for base_style_id in base_style_ids
+        ]
+
+
+class MorphabilityIndexStore:
+    """
+    コアバージョンごとのモーフィング可否の索引を保持する。
+
+    索引は初回利用時に構築する。音声ライブラリの変更などでキャラクター一覧が変わった場合は `clear()` で破棄する。
+    """
+
+    def __init__(self, get_characters: Callable[[str | None], list[Character]]):
+        """
+        インスタンスを生成する。
+
+        Parameters
+        ----------
+        get_characters:
+            コアのバージョンを受け取り、キャラクター情報の一覧を返す関数
+        """
+        self._get_characters = get_characters
+        self._indexes: dict[str | None, MorphabilityIndex] = {}
+        self._lock = threading.Lock()
+
+    def get(self, core_version: str | None) -> MorphabilityIndex:
+        """指定されたコアバージョンのモーフィング可否の索引を取得する。"""
+        with self._lock:
+            index = self._indexes.get(core_version)
+            if index is None:
+                index = MorphabilityIndex(self._get_characters(core_version))
+                self._indexes[core_version] = index
+            return index
+
+    def clear(self) -> None:
+        """保持している索引をすべて破棄する。"""
+        with self._lock:
+            self._indexes.clear()
 
 
 def get_morphable_targets(
@@ -50,59 +181,69 @@ def get_morphable_targets(
 
     指定されたベースキャラクターそれぞれに対し、引数のキャラクターリスト全体をチェックする。
     """
-    morphable_targets_arr = []
-    for base_style_id in base_style_ids:
-        morphable_targets: dict[StyleId, MorphableTargetInfo] = {}
-        for style in chain.from_iterable(
-            character.talk_styles + character.sing_styles for character in characters
-        ):
-            morphable_targets[style.id] = MorphableTargetInfo(
-                is_morphable=is_morphable(characters, base_style_id, style.id)
-            )
-        morphable_targets_arr.append(morphable_targets)
-
-    return morphable_targets_arr
+    return MorphabilityIndex(characters).morphable_targets(base_style_ids)
 
 
 def is_morphable(
     characters: list[Character], style_id_1: StyleId, style_id_2: StyleId
 ) -> bool:
     """指定された２つのスタイル ID がモーフィング可能か判定する。"""
-    # スタイル ID にキャラクターを紐付ける対応表を生成する。
-    style_id_to_character: dict[StyleId, Character] = {}
-    for character in characters:
-        for style in character.talk_styles + character.sing_styles:
-            style_id_to_character[style.id] = character
+    return MorphabilityIndex(characters).is_morphable(style_id_1, style_id_2)
 
-    try:
-        character_1 = style_id_to_character[style_id_1]
-    except KeyError as e:
-        raise StyleIdNotFoundError(style_id_1) from e
-    try:
-        character_2 = style_id_to_character[style_id_2]
-    except KeyError as e:
-        raise StyleIdNotFoundError(style_id_2) from e
 
-    sing_style_ids_1 = [sing_style.id for sing_style in character_1.sing_styles]
-    sing_style_ids_2 = [sing_style.id for sing_style in character_2.sing_styles]
+# 区間ごとにモーフィングした音声を生成する際の、区間の長さと後続の区間との重なりの長さ [sec]
+_CHUNK_SEC: Final = 2.0
+_CHUNK_OVERLAP_SEC: Final = 0.05
 
-    # モーフィング機能はソングに対応していない
-    if style_id_1 in sing_style_ids_1 or style_id_2 in sing_style_ids_2:
-        return False
+# 分析方式ごとの分析のフレーム間隔 [ms]
+_FRAME_PERIODS: Final[dict[MorphingAnalysisMode, float]] = {
+    MorphingAnalysisMode.quality: 1.0,
+    MorphingAnalysisMode.fast: 5.0,
+}
 
-    morphable_1 = character_1.supported_features.permitted_synthesis_morphing
-    morphable_2 = character_2.supported_features.permitted_synthesis_morphing
+# ベースとターゲットの分析を並行しておこなうか否か
+# NOTE: pyworld は分析中に GIL を解放するが、CPU が 1 つの場合は並行させてもスレッドの分だけ遅くなる
+_ENABLE_CONCURRENT_ANALYSIS: Final = (os.process_cpu_count() or 1) > 1
 
-    # 禁止されている場合はFalse
-    if morphable_1 == "NOTHING" or morphable_2 == "NOTHING":
-        return False
 
-    # 同一キャラクターのみの場合は同一キャラクター判定
-    if morphable_1 == "SELF_ONLY" or morphable_2 == "SELF_ONLY":
-        return character_1.uuid == character_2.uuid
+def _estimate_f0(
+    wave: NDArray[np.float64],
+    fs: int,
+    analysis_mode: MorphingAnalysisMode,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """分析方式に応じて音声の基本周波数を推定し、基本周波数と時間軸を得る。"""
+    import pyworld as pw
 
-    # 念のため許可されているかチェック
-    return morphable_1 == "ALL" and morphable_2 == "ALL"
+    frame_period = _FRAME_PERIODS[analysis_mode]
+    match analysis_mode:
+        case MorphingAnalysisMode.quality:
+            return pw.harvest(wave, fs, frame_period=frame_period)
+        case MorphingAnalysisMode.fast:
+            coarse_f0, time_axis = pw.dio(wave, fs, frame_period=frame_period)
+            f0 = pw.stonemask(wave, coarse_f0, time_axis, fs)
+            return f0, time_axis
+
+
+def _synthesize_and_analyze(
+    engine: TTSEngine,
+    query: AudioQuery,
+    style_id: StyleId,
+    enable_interrogative_upspeak: bool,
+    analysis_mode: MorphingAnalysisMode,
+) -> tuple[
+    NDArray[np.float64], NDArray[np.float64], NDArray[np.float64], NDArray[np.float32]
+]:
+    """音声を合成し、合成した音声と WORLD で分析した基本周波数・時間軸・スペクトル包絡 (float32) を得る。"""
+    import pyworld as pw
+
+    wave = engine.synthesize_wave(
+        query, style_id, enable_interrogative_upspeak=enable_interrogative_upspeak
+    ).astype(np.double)
+
+    fs = query.outputSamplingRate
+    f0, time_axis = _estimate_f0(wave, fs, analysis_mode)
+    spectrogram = pw.cheaptrick(wave, f0, time_axis, fs).astype(np.float32)
+    return wave, f0, time_axis, spectrogram
 
 
 def synthesis_morphing_parameter(
@@ -111,34 +252,60 @@ def synthesis_morphing_parameter(
     base_style_id: StyleId,
     target_style_id: StyleId,
     enable_interrogative_upspeak: bool,
+    analysis_mode: MorphingAnalysisMode = MorphingAnalysisMode.quality,
 ) -> _MorphingParameter:
-    """音声を合成しモーフィング用パラメータへ変換する。"""
-    query = deepcopy(query)
-
-    # 不具合回避のためデフォルトのサンプリングレートでWORLDに掛けた後に指定のサンプリングレートに変換する
-    query.outputSamplingRate = engine.default_sampling_rate
-
-    # WORLDに掛けるため合成はモノラルで行う
-    query.outputStereo = False
+    """
+    音声を合成しモーフィング用パラメータへ変換する。
 
-    base_wave = engine.synthesize_wave(
-        query, base_style_id, enable_interrogative_upspeak=enable_interrogative_upspeak
-    ).astype(np.double)
-    target_wave = engine.synthesize_wave(
-        query,
-        target_style_id,
-        enable_interrogative_upspeak=enable_interrogative_upspeak,
-    ).astype(np.double)
+    基本周波数の推定方法と分析のフレーム間隔は `analysis_mode` で選択する。
+    CPU が複数ある場合、ベースとターゲットの合成・分析は並行しておこなう。
+    コアによる合成はコア内で排他されるが、一方の WORLD 分析は他方の合成・分析と重なって実行される。
+    """
+    import pyworld as pw
+
+    # NOTE: 引数のクエリは変更せず、出力設定のみを差し替えた浅い複製を合成に用いる
+    query = query.model_copy(
+        update={
+            # 不具合回避のためデフォルトのサンプリングレートでWORLDに掛けた後に指定のサンプリングレートに変換する
+            "outputSamplingRate": engine.default_sampling_rate,
+            # WORLDに掛けるため合成はモノラルで行う
+            "outputStereo": False,
+        }
+    )
 
     fs = query.outputSamplingRate
-    frame_period = 1.0
-    base_f0, base_time_axis = pw.harvest(base_wave, fs, frame_period=frame_period)
-    base_spectrogram = pw.cheaptrick(base_wave, base_f0, base_time_axis, fs)
-    base_aperiodicity = pw.d4c(base_wave, base_f0, base_time_axis, fs)
-
-    target_f0, morph_time_axis = pw.harvest(target_wave, fs, frame_period=frame_period)
-    target_spectrogram = pw.cheaptrick(target_wave, target_f0, morph_time_axis, fs)
-    target_spectrogram.resize(base_spectrogram.shape)
+    frame_period = _FRAME_PERIODS[analysis_mode]
+
+    def analyze_base() -> tuple[
+        NDArray[np.float64], NDArray[np.float32], NDArray[np.float32]
+    ]:
+        """ベースの音声を合成し、基本周波数・スペクトル包絡・非周期性指標を得る。"""
+        wave, f0, time_axis, spectrogram = _synthesize_and_analyze(
+            engine, query, base_style_id, enable_interrogative_upspeak, analysis_mode
+        )
+        aperiodicity = pw.d4c(wave, f0, time_axis, fs).astype(np.float32)
+        return f0, spectrogram, aperiodicity
+
+    def analyze_target() -> NDArray[np.float32]:
+        """ターゲットの音声を合成し、スペクトル包絡を得る。"""
+        _, _, _, spectrogram = _synthesize_and_analyze(
+            engine, query, target_style_id, enable_interrogative_upspeak, analysis_mode
+        )
+        return spectrogram
+
+    if _ENABLE_CONCURRENT_ANALYSIS:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            target_future = executor.submit(analyze_target)
+            base_f0, base_spectrogram, base_aperiodicity = analyze_base()
+            target_spectrogram = target_future.result()
+    else:
+        base_f0, base_spectrogram, base_aperiodicity = analyze_base()
+        target_spectrogram = analyze_target()
+
+    # ターゲットのフレーム長をベースに揃える。不足するフレームは 0 で埋める
+    n_frame = min(len(base_spectrogram), len(target_spectrogram))
+    fitted_target_spectrogram = np.zeros_like(base_spectrogram)
+    fitted_target_spectrogram[:n_frame] = target_spectrogram[:n_frame]
 
     return _MorphingParameter(
         fs=fs,
@@ -146,8 +313,29 @@ def synthesis_morphing_parameter(
         base_f0=base_f0,
         base_aperiodicity=base_aperiodicity,
         base_spectrogram=base_spectrogram,
-        target_spectrogram=target_spectrogram,
+        target_spectrogram=fitted_target_spectrogram,
+    )
+
+
+def _synthesize_morphed_frames(
+    morph_param: _MorphingParameter, morph_rate: float, start: int, end: int
+) -> NDArray[np.float64]:
+    """パラメータの [start, end) フレームを指定した割合でモーフィングし、WORLD で音声を合成する。"""
+    import pyworld as pw
+
+    # NOTE: pyworld は float64 の入力を要求するため、合成の直前に float64 へ変換する
+    morph_spectrogram = morph_param.base_spectrogram[start:end].astype(np.float64)
+    morph_spectrogram *= 1.0 - morph_rate
+    morph_spectrogram += morph_param.target_spectrogram[start:end] * morph_rate
+
+    wave: NDArray[np.float64] = pw.synthesize(
+        morph_param.base_f0[start:end],
+        morph_spectrogram,
+        morph_param.base_aperiodicity[start:end].astype(np.float64),
+        morph_param.fs,
+        morph_param.frame_period,
     )
+    return wave
 
 
 def synthesize_morphed_wave(
@@ -181,17 +369,8 @@ def synthesize_morphed_wave(
     if morph_rate < 0.0 or morph_rate > 1.0:
         raise ValueError("morph_rateは0.0から1.0の範囲で指定してください")
 
-    morph_spectrogram = (
-        morph_param.base_spectrogram * (1.0 - morph_rate)
-        + morph_param.target_spectrogram * morph_rate
-    )
-
-    _y_h: NDArray[np.float64] = pw.synthesize(
-        morph_param.base_f0,
-        morph_spectrogram,
-        morph_param.base_aperiodicity,
-        morph_param.fs,
-        morph_param.frame_period,
+    _y_h = _synthesize_morphed_frames(
+        morph_param, morph_rate, 0, len(morph_param.base_f0)
     )
     y_h = _y_h.astype(np.float32)
 
@@ -203,3 +382,87 @@ def synthesize_morphed_wave(
         y_h = np.array([y_h, y_h]).T
 
     return y_h
+
+
+def synthesize_morphed_wave_chunks(
+    morph_param: _MorphingParameter,
+    morph_rate: float,
+    output_fs: int,
+    output_stereo: bool = False,
+    chunk_frames: int | None = None,
+) -> Iterator[NDArray[np.float32]]:
+    """
+    指定した割合で、パラメータをもとにモーフィングした音声をフレーム区間ごとに生成します。
+
+    区間ごとに合成するため、長い音声でも一度に確保するメモリが区間の長さに抑えられます。
+    各区間は後続の区間と重なるように合成し、重なった部分をクロスフェードして継ぎ目を滑らかにします。
+    そのため全体を一括で合成した `synthesize_morphed_wave` と長さは一致しますが、継ぎ目付近の値はわずかに異なります。
+
+    Parameters
+    ----------
+    morph_param : MorphingParameter
+        `synthesis_morphing_parameter`で作成したパラメータ
+    morph_rate : float
+        モーフィングの割合
+        0.0でベースの音声、1.0でターゲットの音声に近づきます。
+    chunk_frames : int | None
+        区間のフレーム長。None の場合は約 2 秒とします。
+
+    Returns
+    -------
+    chunks : Iterator[NDArray[np.float32]]
+        モーフィングした音声の区間。順に連結すると音声全体となります。
+
+    Raises
+    ------
+    ValueError
+        morph_rate ∈ [0, 1]
+    """
+    if morph_rate < 0.0 or morph_rate > 1.0:
+        raise ValueError("morph_rateは0.0から1.0の範囲で指定してください")
+
+    if chunk_frames is None:
+        chunk_frames = round(_CHUNK_SEC * 1000 / morph_param.frame_period)
+    overlap_frames = math.ceil(_CHUNK_OVERLAP_SEC * 1000 / morph_param.frame_period)
+    n_frame = len(morph_param.base_f0)
+
+    def to_sample(frame: int) -> int:
+        """フレーム位置を合成音声のサンプル位置へ変換する。"""
+        return int(frame * morph_param.frame_period / 1000 * morph_param.fs)
+
+    stream = (
+        ResampleStream(morph_param.fs, output_fs, 1, dtype="float32")
+        if output_fs != morph_param.fs
+        else None
+    )
+
+    def to_output(wave: NDArray[np.float64], last: bool) -> NDArray[np.float32]:
+        """合成音声の区間を出力形式へ変換する。"""
+        y_h = wave.astype(np.float32)
+        # TODO: tts_engine.py でのリサンプル処理と共通化する
+        if stream is not None:
+            y_h = stream.resample_chunk(y_h, last=last)
+        if output_stereo:
+            y_h = np.array([y_h, y_h]).T
+        return y_h
+
+    # 前の区間の末尾のうち、次の区間の先頭と重なる部分
+    tail: NDArray[np.float64] = np.zeros(0)
+    for start in range(0, n_frame, chunk_frames):
+        next_start = start + chunk_frames
+        last = next_start >= n_frame
+        end = n_frame if last else min(n_frame, next_start + overlap_frames)
+        wave = _synthesize_morphed_frames(morph_param, morph_rate, start, end)
+
+        n_crossfade = min(len(tail), len(wave))
+        weight = np.linspace(0.0, 1.0, n_crossfade)
+        wave[:n_crossfade] = (
+            tail[:n_crossfade] * (1 - weight) + wave[:n_crossfade] * weight
+        )
+
+        if last:
+            yield to_output(wave, last=True)
+        else:
+            n_emit = to_sample(next_start) - to_sample(start)
+            tail = wave[n_emit:]
+            yield to_output(wave[:n_emit], last=False)
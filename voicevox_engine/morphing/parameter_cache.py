@@ -0,0 +1,122 @@
+"""モーフィング用パラメータのキャッシュ"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import Final
+
+from ..metas.metas import StyleId
+from ..model import AudioQuery
+from .model import MorphingAnalysisMode
+from .morphing import _MorphingParameter
+
+# キャッシュが保持するパラメータの合計サイズの既定の上限 [byte]
+# NOTE: スペクトログラムは 1 秒あたり約 2 MB (float32・1 ms 間隔) と大きいため、個数ではなくサイズで上限を設ける
+_MAX_CACHE_BYTES: Final = 256 * 1024 * 1024
+
+type MorphingParameterKey = tuple[
+    str, StyleId, StyleId, bool, str, MorphingAnalysisMode
+]
+
+
+def digest_query(query: AudioQuery) -> str:
+    """音声合成用のクエリのうち、モーフィング用パラメータに影響する値のみからダイジェストを得る。"""
+    # NOTE: 出力サンプリングレートとステレオ出力はパラメータ生成時に上書きされ、kana は合成に使われないため除外する
+    payload = query.model_dump_json(
+        exclude={"outputSamplingRate", "outputStereo", "kana"}
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _count_parameter_bytes(param: _MorphingParameter) -> int:
+    """モーフィング用パラメータが保持する配列の合計サイズ [byte] を得る。"""
+    return (
+        param.base_f0.nbytes
+        + param.base_aperiodicity.nbytes
+        + param.base_spectrogram.nbytes
+        + param.target_spectrogram.nbytes
+    )
+
+
+class MorphingParameterCache:
+    """
+    モーフィング用パラメータの LRU キャッシュ。
+
+    保持するパラメータの合計サイズが上限を超える場合、最も長く使われていないものから破棄する。
+    上限を単独で超えるパラメータは保持しない。
+    同一キーの生成が並行して要求された場合、生成は 1 度だけおこない、後着はその結果を待つ。
+    """
+
+    def __init__(self, max_bytes: int = _MAX_CACHE_BYTES) -> None:
+        self._max_bytes = max_bytes
+        self._params: OrderedDict[
+            MorphingParameterKey, tuple[_MorphingParameter, int]
+        ] = OrderedDict()
+        self._nbytes = 0
+        # 生成中のキーから、生成結果を受け取る Future への対応
+        self._creating: dict[MorphingParameterKey, Future[_MorphingParameter]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """保持しているパラメータの合計サイズ [byte]"""
+        return self._nbytes
+
+    def get_or_create(
+        self,
+        key: MorphingParameterKey,
+        create: Callable[[], _MorphingParameter],
+    ) -> _MorphingParameter:
+        """
+        キーに対応するモーフィング用パラメータを取得する。キャッシュに無い場合は生成して保持する。
+
+        Parameters
+        ----------
+        key : MorphingParameterKey
+            クエリのダイジェスト・ベーススタイル ID・ターゲットスタイル ID・疑問文語尾自動調整フラグ・コアバージョン・分析方式の組
+        create : Callable[[], _MorphingParameter]
+            モーフィング用パラメータを生成する関数。ロック外で呼ばれる。
+        """
+        with self._lock:
+            cached = self._params.get(key)
+            if cached is not None:
+                self._params.move_to_end(key)
+                return cached[0]
+            creating = self._creating.get(key)
+            if creating is None:
+                future: Future[_MorphingParameter] = Future()
+                self._creating[key] = future
+        if creating is not None:
+            return creating.result()
+
+        try:
+            param = create()
+        except BaseException as e:
+            with self._lock:
+                if self._creating.get(key) is future:
+                    del self._creating[key]
+            future.set_exception(e)
+            raise
+        nbytes = _count_parameter_bytes(param)
+
+        with self._lock:
+            # NOTE: 生成中に `clear()` された場合、古い生成結果は保持しない
+            if self._creating.get(key) is future:
+                del self._creating[key]
+                if nbytes <= self._max_bytes:
+                    while self._nbytes + nbytes > self._max_bytes:
+                        _, (_, evicted_nbytes) = self._params.popitem(last=False)
+                        self._nbytes -= evicted_nbytes
+                    self._params[key] = (param, nbytes)
+                    self._nbytes += nbytes
+        future.set_result(param)
+        return param
+
+    def clear(self) -> None:
+        """保持しているパラメータをすべて破棄する。"""
+        with self._lock:
+            self._params.clear()
+            self._creating.clear()
+            self._nbytes = 0
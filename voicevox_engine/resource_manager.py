@@ -2,9 +2,14 @@
 
 import base64
 import json
+import threading
+from collections import OrderedDict
 from hashlib import sha256
 from pathlib import Path
-from typing import Literal
+from typing import Final, Literal
+
+# base64 文字列のキャッシュが保持する文字列の合計サイズの既定の上限 [byte]
+_MAX_BASE64_CACHE_BYTES: Final = 128 * 1024 * 1024
 
 
 class ResourceManagerError(Exception):
@@ -26,7 +31,11 @@ class ResourceManager:
     ついでにファイルをbase64文字列に変換することもできる。
     """
 
-    def __init__(self, create_filemap_if_not_exist: bool) -> None:
+    def __init__(
+        self,
+        create_filemap_if_not_exist: bool,
+        max_base64_cache_bytes: int = _MAX_BASE64_CACHE_BYTES,
+    ) -> None:
         """
         リソースマネージャーインスタンスを作る。
 
@@ -34,10 +43,18 @@ class ResourceManager:
         ----------
         create_filemap_if_not_exist : bool
             `filemap.json`がない場合でも登録時にfilemapを生成するか(開発時を想定)
+        max_base64_cache_bytes : int
+            base64 文字列のキャッシュが保持する文字列の合計サイズの上限 [byte]
         """
         self._create_filemap_if_not_exist = create_filemap_if_not_exist
         self._path_to_hash: dict[Path, str] = {}
         self._hash_to_path: dict[str, Path] = {}
+        # ハッシュ値をキーとする base64 文字列の LRU キャッシュ
+        # NOTE: ハッシュ値はファイルの中身から計算されるため、同じ中身のファイルは同じ文字列を共有する
+        self._max_base64_cache_bytes = max_base64_cache_bytes
+        self._base64_cache: OrderedDict[str, str] = OrderedDict()
+        self._base64_cache_bytes = 0
+        self._base64_cache_lock = threading.Lock()
 
     def register_dir(self, resource_dir: Path) -> None:
         """ディレクトリをfilemapに登録する"""
@@ -68,9 +85,32 @@ class ResourceManager:
             raise ResourceManagerError(f"{resource_path}がfilemapに登録されていません")
 
         if resource_format == "base64":
-            return _b64encode_str(resource_path.read_bytes())
+            return self._base64_str(resource_path, filehash)
         return filehash
 
+    def _base64_str(self, resource_path: Path, filehash: str) -> str:
+        """リソースファイルの base64 文字列を返す。キャッシュに無い場合はファイルを読み込んで保持する。"""
+        with self._base64_cache_lock:
+            cached = self._base64_cache.get(filehash)
+            if cached is not None:
+                self._base64_cache.move_to_end(filehash)
+                return cached
+
+        resource_str = _b64encode_str(resource_path.read_bytes())
+        # NOTE: base64 文字列は ASCII のみからなるため、文字数をサイズとみなす
+        nbytes = len(resource_str)
+        if nbytes > self._max_base64_cache_bytes:
+            return resource_str
+
+        with self._base64_cache_lock:
+            if filehash not in self._base64_cache:
+                while self._base64_cache_bytes + nbytes > self._max_base64_cache_bytes:
+                    _, evicted = self._base64_cache.popitem(last=False)
+                    self._base64_cache_bytes -= len(evicted)
+                self._base64_cache[filehash] = resource_str
+                self._base64_cache_bytes += nbytes
+        return resource_str
+
     def resource_path(self, filehash: str) -> Path:
         """指定したハッシュ値を持つリソースファイルのパスを返す。"""
         resource_path = self._hash_to_path.get(filehash)
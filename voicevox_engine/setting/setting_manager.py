@@ -8,6 +8,7 @@ from typing import Any
 import yaml
 from pydantic import TypeAdapter
 
+from ..morphing.model import MorphingAnalysisMode
 from ..utility.path_utility import get_save_dir
 from .model import CorsPolicyMode
 
@@ -18,6 +19,8 @@ class Setting:
 
     cors_policy_mode: CorsPolicyMode  # リソース共有ポリシー
     allow_origin: str | None = None  # 許可するオリジン
+    # モーフィング用の音声分析の方式
+    morphing_analysis_mode: MorphingAnalysisMode = MorphingAnalysisMode.quality
 
 
 _setting_adapter = TypeAdapter(Setting)
@@ -46,7 +49,11 @@ class SettingHandler:
         """設定値をファイルから読み込む。"""
         if not self.setting_file_path.is_file():
             # 設定ファイルが存在しないためデフォルト値を取得
-            setting = {"allow_origin": None, "cors_policy_mode": "localapps"}
+            setting = {
+                "allow_origin": None,
+                "cors_policy_mode": "localapps",
+                "morphing_analysis_mode": "quality",
+            }
         else:
             # 指定された設定ファイルから値を取得
             # FIXME: 例外処理を追加する
@@ -58,8 +65,9 @@ class SettingHandler:
         """設定値をファイルへ書き込む。"""
         settings_dict: dict[str, Any] = _setting_adapter.dump_python(settings)
 
-        if isinstance(settings_dict["cors_policy_mode"], Enum):
-            settings_dict["cors_policy_mode"] = settings_dict["cors_policy_mode"].value
+        for key in ["cors_policy_mode", "morphing_analysis_mode"]:
+            if isinstance(settings_dict[key], Enum):
+                settings_dict[key] = settings_dict[key].value
 
         with open(self.setting_file_path, mode="w", encoding="utf-8") as f:
             yaml.safe_dump(settings_dict, f)
@@ -0,0 +1,170 @@
+"""テキスト解析（OpenJTalk フロントエンド）をワーカープロセスでおこなうプール"""
+
+import multiprocessing
+import sys
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from traceback import print_exception
+
+import pyopenjtalk
+
+from ..user_dict.user_dict_manager import UserDictionary
+from .katakana_english import preload_english_words
+from .model import AccentPhrase, Mora
+from .njd_feature_processor import text_to_full_context_labels
+from .text_analyzer import full_context_labels_to_accent_phrases
+
+# プロセス間でやり取りするモーラ。フィールドを `Mora` の定義順に並べたタプル。
+type _CompactMora = tuple[str, str | None, float | None, str, float, float]
+# プロセス間でやり取りするアクセント句。モーラ系列・アクセント位置・無音モーラ・疑問形か否か。
+type _CompactAccentPhrase = tuple[
+    tuple[_CompactMora, ...], int, _CompactMora | None, bool
+]
+
+# ワーカープロセスが読み込んでいるコンパイル済み辞書のパス。読み込みに失敗し状態が不明な場合は None
+_worker_dict_paths: tuple[str, ...] | None = ()
+
+
+class _WorkerDictLoadError(Exception):
+    """ワーカープロセスがユーザー辞書を読み込めなかったことを示すエラー"""
+
+    pass
+
+
+def _to_compact_mora(mora: Mora) -> _CompactMora:
+    return (
+        mora.text,
+        mora.consonant,
+        mora.consonant_length,
+        mora.vowel,
+        mora.vowel_length,
+        mora.pitch,
+    )
+
+
+def _from_compact_mora(compact_mora: _CompactMora) -> Mora:
+    text, consonant, consonant_length, vowel, vowel_length, pitch = compact_mora
+    return Mora(
+        text=text,
+        consonant=consonant,
+        consonant_length=consonant_length,
+        vowel=vowel,
+        vowel_length=vowel_length,
+        pitch=pitch,
+    )
+
+
+def _to_compact_accent_phrase(accent_phrase: AccentPhrase) -> _CompactAccentPhrase:
+    pause_mora = accent_phrase.pause_mora
+    return (
+        tuple(_to_compact_mora(mora) for mora in accent_phrase.moras),
+        accent_phrase.accent,
+        _to_compact_mora(pause_mora) if pause_mora is not None else None,
+        accent_phrase.is_interrogative,
+    )
+
+
+def _from_compact_accent_phrase(
+    compact_accent_phrase: _CompactAccentPhrase,
+) -> AccentPhrase:
+    compact_moras, accent, compact_pause_mora, is_interrogative = compact_accent_phrase
+    return AccentPhrase(
+        moras=[_from_compact_mora(compact_mora) for compact_mora in compact_moras],
+        accent=accent,
+        pause_mora=(
+            _from_compact_mora(compact_pause_mora)
+            if compact_pause_mora is not None
+            else None
+        ),
+        is_interrogative=is_interrogative,
+    )
+
+
+def _initialize_worker(english_words: Sequence[str]) -> None:
+    """ワーカープロセスで、英単語のカタカナ読みを事前に生成してキャッシュする。"""
+    preload_english_words(english_words)
+
+
+def _sync_worker_dict(dict_paths: tuple[str, ...]) -> None:
+    """ワーカープロセスの辞書を、親プロセスが読み込んでいるコンパイル済み辞書に合わせる。"""
+    global _worker_dict_paths
+    if dict_paths == _worker_dict_paths:
+        return
+    try:
+        if len(dict_paths) == 0:
+            pyopenjtalk.unset_user_dict()
+        else:
+            # NOTE: MeCab はカンマ区切りで複数のユーザー辞書を受け付ける
+            pyopenjtalk.update_global_jtalk_with_user_dict(",".join(dict_paths))
+    except Exception as e:
+        # NOTE: 古い辞書のまま解析しないよう、呼び出し元へ失敗を伝えて次の解析時に読み込み直す
+        _worker_dict_paths = None
+        raise _WorkerDictLoadError(f"ユーザー辞書の読み込みに失敗しました: {e}") from e
+    _worker_dict_paths = dict_paths
+
+
+def _analyze_text(
+    text: str, enable_katakana_english: bool, dict_paths: tuple[str, ...]
+) -> list[_CompactAccentPhrase]:
+    """ワーカープロセスでテキストからアクセント句系列を生成する。"""
+    _sync_worker_dict(dict_paths)
+    full_context_labels = text_to_full_context_labels(
+        text, enable_katakana_english=enable_katakana_english
+    )
+    accent_phrases = full_context_labels_to_accent_phrases(full_context_labels)
+    return [_to_compact_accent_phrase(ap) for ap in accent_phrases]
+
+
+class TextFrontendPool:
+    """テキストからアクセント句系列を生成するテキスト解析を、GIL を共有しないワーカープロセスでおこなうプール"""
+
+    def __init__(
+        self,
+        n_processes: int,
+        user_dict: UserDictionary,
+        english_words: Sequence[str] = (),
+    ) -> None:
+        """
+        ワーカープロセスのプールを生成する。
+
+        Parameters
+        ----------
+        n_processes : int
+            ワーカープロセス数
+        user_dict : UserDictionary
+            ワーカープロセスへ反映するユーザー辞書。更新された場合、次のテキスト解析時に各ワーカーが読み込み直す。
+        english_words : Sequence[str]
+            各ワーカープロセスの起動時にカタカナ読みを事前生成する英単語
+        """
+        self._user_dict = user_dict
+        self._executor = ProcessPoolExecutor(
+            max_workers=n_processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(tuple(english_words),),
+        )
+
+    def text_to_accent_phrases(
+        self, text: str, enable_katakana_english: bool
+    ) -> list[AccentPhrase]:
+        """テキストからアクセント句系列を生成する。音素長と音高は 0 で初期化される。"""
+        dict_paths = tuple(
+            str(path.resolve()) for path in self._user_dict.loaded_dict_paths
+        )
+        try:
+            compact_accent_phrases = self._executor.submit(
+                _analyze_text, text, enable_katakana_english, dict_paths
+            ).result()
+        except (BrokenProcessPool, _WorkerDictLoadError) as e:
+            # ワーカープロセスが異常終了した場合や、ユーザー辞書を読み込めなかった場合は、このプロセスで解析する
+            print_exception(e, file=sys.stderr)
+            full_context_labels = text_to_full_context_labels(
+                text, enable_katakana_english=enable_katakana_english
+            )
+            return full_context_labels_to_accent_phrases(full_context_labels)
+        return [_from_compact_accent_phrase(ap) for ap in compact_accent_phrases]
+
+    def shutdown(self) -> None:
+        """ワーカープロセスを終了する。"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,199 @@
+"""前回の合成結果を再利用し、変化した区間のみを波形生成し直す差分合成"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ..metas.metas import StyleId
+
+# 波形生成し直す区間の前後に付加する、デコーダーの文脈としてのフレーム数
+_DECODER_CONTEXT_FRAMES = 16
+# 再利用する波形と新しく生成した波形をつなぐクロスフェードのフレーム数
+_CROSSFADE_FRAMES = 2
+# 変化した区間がこの割合を超える場合は全体を波形生成し直す
+_MAX_PARTIAL_DECODE_RATIO = 0.5
+
+
+@dataclass(frozen=True)
+class DecodedWave:
+    """デコーダーの入力特徴量と、それから生成された生音声波形"""
+
+    style_id: StyleId
+    phoneme: NDArray[np.float32]  # shape=(フレーム長, 音素数)
+    f0: NDArray[np.float32]  # shape=(フレーム長,)
+    raw_wave: NDArray[np.float32]  # shape=(フレーム長 * フレームあたりのサンプル数,)
+    sampling_rate: int
+
+
+class DecodedWaveStore:
+    """合成セッション ID ごとに直近の合成結果を保持する LRU ストア"""
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._decoded_waves: OrderedDict[str, DecodedWave] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> DecodedWave | None:
+        """合成セッションの直近の合成結果を取得する。"""
+        with self._lock:
+            decoded_wave = self._decoded_waves.get(session_id)
+            if decoded_wave is not None:
+                self._decoded_waves.move_to_end(session_id)
+            return decoded_wave
+
+    def put(self, session_id: str, decoded_wave: DecodedWave) -> None:
+        """合成セッションの直近の合成結果を保存する。"""
+        with self._lock:
+            self._decoded_waves[session_id] = decoded_wave
+            self._decoded_waves.move_to_end(session_id)
+            while len(self._decoded_waves) > self._max_size:
+                self._decoded_waves.popitem(last=False)
+
+
+def _find_changed_frames(
+    previous: DecodedWave, phoneme: NDArray[np.float32], f0: NDArray[np.float32]
+) -> tuple[int, int, int]:
+    """
+    前回の特徴量と新しい特徴量を比較し、共通の先頭フレーム数と、変化した区間の終端を前回・今回それぞれについて求める。
+
+    Returns
+    -------
+    start : int
+        先頭から一致するフレーム数。変化した区間の始端。
+    previous_end : int
+        前回の特徴量における、変化した区間の終端
+    end : int
+        新しい特徴量における、変化した区間の終端
+    """
+    n_previous, n_frame = previous.f0.shape[0], f0.shape[0]
+    n_common = min(n_previous, n_frame)
+    is_same = (previous.f0[:n_common] == f0[:n_common]) & np.all(
+        previous.phoneme[:n_common] == phoneme[:n_common], axis=1
+    )
+    start = int(np.argmin(is_same)) if not np.all(is_same) else n_common
+
+    n_tail = n_common - start
+    is_same_tail = (
+        previous.f0[n_previous - n_tail :][::-1] == f0[n_frame - n_tail :][::-1]
+    ) & np.all(
+        previous.phoneme[n_previous - n_tail :][::-1]
+        == phoneme[n_frame - n_tail :][::-1],
+        axis=1,
+    )
+    n_same_tail = int(np.argmin(is_same_tail)) if not np.all(is_same_tail) else n_tail
+    return start, n_previous - n_same_tail, n_frame - n_same_tail
+
+
+def _crossfade(
+    fade_out: NDArray[np.float32], fade_in: NDArray[np.float32]
+) -> NDArray[np.float32]:
+    """2 つの同じ長さの波形を線形にクロスフェードする。"""
+    weight = np.linspace(0.0, 1.0, fade_out.shape[0], endpoint=False, dtype=np.float32)
+    # NOTE: モックコアはチャンネル軸付きの波形 (shape=(サンプル数, 1)) を返すため、時間軸に沿って重みを掛ける
+    weight = weight.reshape((-1,) + (1,) * (fade_out.ndim - 1))
+    return fade_out * (1 - weight) + fade_in * weight
+
+
+def decode_incrementally(
+    previous: DecodedWave | None,
+    phoneme: NDArray[np.float32],
+    f0: NDArray[np.float32],
+    style_id: StyleId,
+    decode: Callable[
+        [NDArray[np.float32], NDArray[np.float32]], tuple[NDArray[np.float32], int]
+    ],
+) -> DecodedWave:
+    """
+    前回の合成結果のうち変化していない区間を再利用して、特徴量から生音声波形を生成する。
+
+    変化した区間の前後に文脈となるフレームを付加して `decode` で波形生成し、その区間を前回の波形へ短いクロスフェードでつなぎ込む。
+    前回の合成結果が無い場合やスタイルが異なる場合、変化した区間が長い場合は全体を波形生成する。
+    デコーダーの受容野が付加する文脈より広い場合、全体を波形生成した結果とは一致しない。
+
+    Parameters
+    ----------
+    previous : DecodedWave | None
+        前回の合成結果
+    phoneme : NDArray[np.float32]
+        フレームごとの音素。shape=(フレーム長, 音素数)
+    f0 : NDArray[np.float32]
+        フレームごとの音高。shape=(フレーム長,)
+    style_id : StyleId
+        スタイル ID
+    decode : Callable[[NDArray[np.float32], NDArray[np.float32]], tuple[NDArray[np.float32], int]]
+        フレームごとの音素・音高から生音声波形とそのサンプリングレートを生成する関数
+
+    Returns
+    -------
+    decoded_wave : DecodedWave
+        今回の合成結果
+    """
+    n_frame = f0.shape[0]
+    if (
+        previous is None
+        or previous.style_id != style_id
+        or previous.phoneme.shape[1:] != phoneme.shape[1:]
+        or n_frame == 0
+    ):
+        raw_wave, sampling_rate = decode(phoneme, f0)
+        return DecodedWave(style_id, phoneme, f0, raw_wave, sampling_rate)
+
+    start, previous_end, end = _find_changed_frames(previous, phoneme, f0)
+    if start == end and previous_end == start:
+        # 変化無し
+        return DecodedWave(
+            style_id, phoneme, f0, previous.raw_wave, previous.sampling_rate
+        )
+    if end - start > n_frame * _MAX_PARTIAL_DECODE_RATIO:
+        raw_wave, sampling_rate = decode(phoneme, f0)
+        return DecodedWave(style_id, phoneme, f0, raw_wave, sampling_rate)
+
+    # 変化した区間の前後に文脈を付加して波形生成する
+    decode_start = max(start - _DECODER_CONTEXT_FRAMES, 0)
+    decode_end = min(end + _DECODER_CONTEXT_FRAMES, n_frame)
+    partial_wave, sampling_rate = decode(
+        phoneme[decode_start:decode_end], f0[decode_start:decode_end]
+    )
+    n_sample_per_frame = partial_wave.shape[0] // (decode_end - decode_start)
+    if sampling_rate != previous.sampling_rate or previous.raw_wave.shape[0] != (
+        previous.f0.shape[0] * n_sample_per_frame
+    ):
+        raw_wave, sampling_rate = decode(phoneme, f0)
+        return DecodedWave(style_id, phoneme, f0, raw_wave, sampling_rate)
+
+    previous_wave = previous.raw_wave
+
+    def previous_samples(begin: int, stop: int) -> NDArray[np.float32]:
+        """前回の生音声波形のうち、フレーム区間 [begin, stop) に相当するサンプルを得る。"""
+        return previous_wave[begin * n_sample_per_frame : stop * n_sample_per_frame]
+
+    def partial_samples(begin: int, stop: int) -> NDArray[np.float32]:
+        """新しく生成した生音声波形のうち、フレーム区間 [begin, stop) に相当するサンプルを得る。"""
+        return partial_wave[
+            (begin - decode_start) * n_sample_per_frame : (stop - decode_start)
+            * n_sample_per_frame
+        ]
+
+    # 変化した区間の前後でクロスフェードしてつなぎ込む
+    n_head_fade = min(_CROSSFADE_FRAMES, start)
+    n_tail_fade = min(_CROSSFADE_FRAMES, n_frame - end)
+    raw_wave = np.concatenate(
+        [
+            previous_samples(0, start - n_head_fade),
+            _crossfade(
+                previous_samples(start - n_head_fade, start),
+                partial_samples(start - n_head_fade, start),
+            ),
+            partial_samples(start, end),
+            _crossfade(
+                partial_samples(end, end + n_tail_fade),
+                previous_samples(previous_end, previous_end + n_tail_fade),
+            ),
+            previous_samples(previous_end + n_tail_fade, previous.f0.shape[0]),
+        ]
+    )
+    return DecodedWave(style_id, phoneme, f0, raw_wave, sampling_rate)
@@ -14,14 +14,13 @@
 NOTE: ユーザー向け案内 `https://github.com/VOICEVOX/voicevox_engine/blob/master/README.md#aquestalk-風記法`
 """
 
+from dataclasses import dataclass, field
 from typing import Any
 
 from .model import AccentPhrase, Mora, ParseKanaErrorCode
 from .mora_mapping import mora_kana_to_mora_phonemes
 from .phoneme import Vowel
 
-_LOOP_LIMIT = 300
-
 # AquesTalk 風記法特殊文字
 _UNVOICE_SYMBOL = "_"  # 無声化
 _ACCENT_SYMBOL = "'"  # アクセント位置
@@ -55,6 +54,44 @@ for kana, (consonant, vowel) in mora_kana_to_mora_phonemes.items():
         )
 
 
+@dataclass
+class _KanaTrieNode:
+    """AquesTalk 風記法のモーラ表記を格納するトライ木のノード"""
+
+    children: dict[str, _KanaTrieNode] = field(default_factory=dict)
+    mora: Mora | None = None  # 根からこのノードまでの文字列に対応するモーラ
+
+
+# `_kana2mora` の表記を格納したトライ木。最長一致によるモーラ化を入力長に比例する計算量でおこなうために用いる。
+_kana_trie = _KanaTrieNode()
+for kana, mora in _kana2mora.items():
+    node = _kana_trie
+    for char in kana:
+        node = node.children.setdefault(char, _KanaTrieNode())
+    node.mora = mora
+
+
+def _match_longest_mora(phrase: str, start: int) -> tuple[Mora, int] | None:
+    """
+    `phrase` の `start` 文字目から始まる最長のモーラ表記を探す。
+
+    Returns
+    -------
+    tuple[Mora, int] | None
+        モーラのひな形とその表記の文字数。該当するモーラが無い場合は None。
+    """
+    node = _kana_trie
+    matched: tuple[Mora, int] | None = None
+    for index in range(start, len(phrase)):
+        child = node.children.get(phrase[index])
+        if child is None:
+            break
+        node = child
+        if node.mora is not None:
+            matched = (node.mora, index - start + 1)
+    return matched
+
+
 class ParseKanaError(Exception):
     """AquesTalk 風記法のパースが失敗した。"""
 
@@ -72,20 +109,14 @@ def _text_to_accent_phrase(phrase: str) -> AccentPhrase:
 
     音素長と音高は0で初期化する。
     """
-    # NOTE: longest matchによりモーラ化。入力長Nに対し計算量O(N^2)。
+    # NOTE: トライ木を用いた longest match によりモーラ化。モーラ表記は高々数文字のため、入力長Nに対し計算量O(N)。
     # NOTE: ポーズと疑問形はこの関数内で処理しない
 
     accent_index: int | None = None
     moras: list[Mora] = []
 
-    base_index = 0  # パース開始位置。ここから右の文字列をstackに詰めていく。
-    stack = ""  # 保留中の文字列
-    matched_text: str | None = None  # 保留中の文字列内で最後にマッチした仮名
-
-    outer_loop = 0
+    base_index = 0  # パース開始位置
     while base_index < len(phrase):
-        outer_loop += 1
-
         # 「`'` でアクセント位置」の実装
         if phrase[base_index] == _ACCENT_SYMBOL:
             # 「アクセント位置はちょうど１つ」の実装
@@ -99,25 +130,21 @@ def _text_to_accent_phrase(phrase: str) -> AccentPhrase:
             continue
 
         # モーラ探索
-        # より長い要素からなるモーラが見つかれば上書き（longest match）
+        # より長い要素からなるモーラを優先する（longest match）
         # 例: phrase "キャ" -> "キ" 検出 -> "キャ" 検出/上書き -> Mora("キャ")
-        for watch_index in range(base_index, len(phrase)):
-            # アクセント位置特殊文字が来たら探索打ち切り
-            if phrase[watch_index] == _ACCENT_SYMBOL:
-                break
-            stack += phrase[watch_index]
-            if stack in _kana2mora:
-                matched_text = stack
-        if matched_text is None:
-            raise ParseKanaError(ParseKanaErrorCode.UNKNOWN_TEXT, text=stack)
+        matched = _match_longest_mora(phrase, base_index)
+        if matched is None:
+            # 次のアクセント位置特殊文字までを判別できない文字列として報告する
+            accent_symbol_index = phrase.find(_ACCENT_SYMBOL, base_index)
+            if accent_symbol_index == -1:
+                accent_symbol_index = len(phrase)
+            unknown_text = phrase[base_index:accent_symbol_index]
+            raise ParseKanaError(ParseKanaErrorCode.UNKNOWN_TEXT, text=unknown_text)
         # push mora
-        else:
-            moras.append(_kana2mora[matched_text].model_copy(deep=True))
-            base_index += len(matched_text)
-            stack = ""
-            matched_text = None
-        if outer_loop > _LOOP_LIMIT:
-            raise ParseKanaError(ParseKanaErrorCode.INFINITE_LOOP)
+        mora, matched_length = matched
+        # NOTE: モーラのフィールドは全て不変値のため、浅いコピーで十分
+        moras.append(mora.model_copy())
+        base_index += matched_length
     if accent_index is None:
         raise ParseKanaError(ParseKanaErrorCode.ACCENT_NOTFOUND, text=phrase)
     else:
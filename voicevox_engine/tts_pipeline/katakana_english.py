@@ -1,13 +1,26 @@
 """英単語をカタカナ読みにする処理"""
 
 import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import NewType, TypeGuard
 
-import kanalizer
-
 # 半角アルファベット文字列を示す型
 HankakuAlphabet = NewType("HankakuAlphabet", str)
 
+# 半角アルファベットのみからなる文字列のパターン
+_HANKAKU_ALPHABET_PATTERN = re.compile("[a-zA-Z]+")
+# アルファベット列を単語へ分割するパターン
+_WORD_PATTERN = re.compile("[a-zA-Z][a-z]*")
+
+# カタカナ読みのキャッシュに保持する英単語の最大数
+_CONVERSION_CACHE_MAX_SIZE = 4096
+
+# 事前生成によるキャッシュのヒット数・ミス数。利用状況の集計から除外する
+_preload_hits = 0
+_preload_misses = 0
+
 
 # OpenJTalkで使っているアルファベット→カタカナの対応表
 # https://github.com/VOICEVOX/open_jtalk/blob/b9b1bf6a0cba6bc9550b4521913b20334a218dfc/src/njd_set_pronunciation/njd_set_pronunciation_rule_utf_8.h#L397
@@ -43,7 +56,7 @@ ojt_alphabet_kana_mapping = {
 
 def is_hankaku_alphabet(text: str) -> TypeGuard[HankakuAlphabet]:
     """文字列が半角アルファベットのみで構成されているかを判定する"""
-    return bool(re.fullmatch("[a-zA-Z]+", text))
+    return bool(_HANKAKU_ALPHABET_PATTERN.fullmatch(text))
 
 
 def _split_into_words(string: HankakuAlphabet) -> list[HankakuAlphabet]:
@@ -57,7 +70,7 @@ def _split_into_words(string: HankakuAlphabet) -> list[HankakuAlphabet]:
     """
     # TODO: 「全て大文字で書かれた英単語は、バラバラの文字へ分割される」という動作がユーザーにとって最適か検討 (ref: https://github.com/VOICEVOX/voicevox_engine/issues/1524#issuecomment-2849254324)
     # NOTE: キャメルケース的な単語に対応させるため、大文字で分割する
-    return list(map(HankakuAlphabet, re.findall("[a-zA-Z][a-z]*", string)))
+    return list(map(HankakuAlphabet, _WORD_PATTERN.findall(string)))
 
 
 def _should_convert_english_to_katakana(string: HankakuAlphabet) -> bool:
@@ -88,8 +101,13 @@ def _convert_as_char_wise_katakana(alphabets: HankakuAlphabet) -> str:
     return yomi
 
 
+# NOTE: 同じ英単語は繰り返し現れやすいため、kanalizer による推論結果を含む読みをキャッシュする
+@lru_cache(maxsize=_CONVERSION_CACHE_MAX_SIZE)
 def convert_english_to_katakana(string: HankakuAlphabet) -> str:
     """英単語をカタカナ読みに変換する。"""
+    # NOTE: 英単語のカタカナ化は利用頻度が低いため、起動時間短縮のために kanalizer は初回利用時に読み込む
+    import kanalizer
+
     kana = ""
     for word in _split_into_words(string):
         if _should_convert_english_to_katakana(word):
@@ -98,3 +116,60 @@ def convert_english_to_katakana(string: HankakuAlphabet) -> str:
         else:
             kana += _convert_as_char_wise_katakana(word)
     return kana
+
+
+@dataclass(frozen=True)
+class ConversionCacheInfo:
+    """英単語のカタカナ読みのキャッシュの利用状況"""
+
+    hits: int  # キャッシュから読みを返した回数（事前生成を除く）
+    misses: int  # 読みを新たに生成した回数（事前生成を除く）
+    size: int  # キャッシュされている英単語の数
+    max_size: int  # キャッシュに保持する英単語の最大数
+
+    @property
+    def hit_rate(self) -> float:
+        """キャッシュのヒット率。変換が一度もおこなわれていない場合は 0 とする。"""
+        n_call = self.hits + self.misses
+        return self.hits / n_call if n_call != 0 else 0.0
+
+
+def get_conversion_cache_info() -> ConversionCacheInfo:
+    """英単語のカタカナ読みのキャッシュの利用状況を取得する。事前生成による変換は回数に含めない。"""
+    info = convert_english_to_katakana.cache_info()
+    assert info.maxsize is not None
+    return ConversionCacheInfo(
+        hits=info.hits - _preload_hits,
+        misses=info.misses - _preload_misses,
+        size=info.currsize,
+        max_size=info.maxsize,
+    )
+
+
+def clear_conversion_cache() -> None:
+    """英単語のカタカナ読みのキャッシュとその利用状況を破棄する。"""
+    global _preload_hits, _preload_misses
+    convert_english_to_katakana.cache_clear()
+    _preload_hits = 0
+    _preload_misses = 0
+
+
+def preload_english_words(words: Iterable[str]) -> int:
+    """
+    英単語のカタカナ読みを事前に生成してキャッシュし、キャッシュした英単語の数を返す。
+
+    半角アルファベット以外を含む単語は無視する。
+    事前生成による変換はキャッシュの利用状況の集計から除外される。
+    """
+    global _preload_hits, _preload_misses
+    info_before = convert_english_to_katakana.cache_info()
+    n_word = 0
+    for line in words:
+        word = line.strip()
+        if is_hankaku_alphabet(word):
+            convert_english_to_katakana(word)
+            n_word += 1
+    info_after = convert_english_to_katakana.cache_info()
+    _preload_hits += info_after.hits - info_before.hits
+    _preload_misses += info_after.misses - info_before.misses
+    return n_word
@@ -105,4 +105,3 @@ class ParseKanaErrorCode(Enum):
     ACCENT_NOTFOUND = "アクセントを指定していないアクセント句があります: {text}"
     EMPTY_PHRASE = "{position}番目のアクセント句が空白です"
     INTERROGATION_MARK_NOT_AT_END = "アクセント句末以外に「？」は置けません: {text}"
-    INFINITE_LOOP = "処理時に無限ループになってしまいました...バグ報告をお願いします。"
@@ -0,0 +1,114 @@
+"""アクセント句ごとの音素長・音高の推論結果のキャッシュ"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+from ..metas.metas import StyleId
+
+# 推論結果が依存するとみなす前後のアクセント句数
+_CONTEXT_PHRASES = 2
+
+
+class PhrasePredictionCache[S, V]:
+    """
+    アクセント句ごとの推論結果を保持する LRU キャッシュ。
+
+    推論結果は、スタイルと前後 `context_phrases` 個のアクセント句を含む特徴 `S` の窓をキーとして保持される。
+    これにより一部のアクセント句が編集された場合、そのアクセント句と前後の文脈のみが推論し直される。
+    推論がこの窓より広い文脈に依存する場合、系列全体を推論した結果とは一致しない。
+    """
+
+    def __init__(self, max_size: int, context_phrases: int = _CONTEXT_PHRASES) -> None:
+        """
+        空のキャッシュを生成する。
+
+        Parameters
+        ----------
+        max_size : int
+            保持するアクセント句の最大数
+        context_phrases : int
+            推論結果が依存するとみなす前後のアクセント句数
+        """
+        self._max_size = max_size
+        self._context_phrases = context_phrases
+        self._entries: OrderedDict[
+            tuple[StyleId, tuple[S | None, ...]], tuple[V, ...]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: tuple[StyleId, tuple[S | None, ...]]) -> tuple[V, ...] | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def _put(
+        self, key: tuple[StyleId, tuple[S | None, ...]], value: tuple[V, ...]
+    ) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def predict(
+        self,
+        signatures: list[S],
+        style_id: StyleId,
+        predict: Callable[[int, int], list[tuple[V, ...]]],
+    ) -> list[tuple[V, ...]]:
+        """
+        各アクセント句に対する推論結果を得る。
+
+        キャッシュに無いアクセント句について、前後 `context_phrases` 個のアクセント句を含む区間ごとに推論する。
+
+        Parameters
+        ----------
+        signatures : list[S]
+            アクセント句ごとの、推論結果を決める特徴
+        style_id : StyleId
+            スタイル ID
+        predict : Callable[[int, int], list[tuple[V, ...]]]
+            アクセント句系列の区間 `[start, end)` を推論し、区間内の各アクセント句に対する推論結果を返す関数
+
+        Returns
+        -------
+        results : list[tuple[V, ...]]
+            アクセント句ごとの推論結果
+        """
+        n_phrase = len(signatures)
+        width = self._context_phrases
+        keys = [
+            (
+                style_id,
+                tuple(
+                    signatures[j] if 0 <= j < n_phrase else None
+                    for j in range(i - width, i + width + 1)
+                ),
+            )
+            for i in range(n_phrase)
+        ]
+        cached_results = [self._get(key) for key in keys]
+
+        # キャッシュに無いアクセント句の前後の文脈を含む区間を、重なりをまとめて列挙する
+        windows: list[tuple[int, int]] = []
+        for i, cached_result in enumerate(cached_results):
+            if cached_result is not None:
+                continue
+            start, end = max(i - width, 0), min(i + width + 1, n_phrase)
+            if len(windows) != 0 and start <= windows[-1][1]:
+                windows[-1] = (windows[-1][0], end)
+            else:
+                windows.append((start, end))
+
+        results = list(cached_results)
+        for start, end in windows:
+            window_results = predict(start, end)
+            for i in range(start, end):
+                if results[i] is None:
+                    results[i] = window_results[i - start]
+                    self._put(keys[i], window_results[i - start])
+
+        return [result for result in results if result is not None]
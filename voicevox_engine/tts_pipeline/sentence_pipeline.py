@@ -0,0 +1,56 @@
+"""長いテキストを文ごとに分割し、処理段を並行に実行するパイプライン"""
+
+import re
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Final
+
+# 文末とみなす位置。文末記号の直後で、後続が文末記号・閉じ括弧でない位置か改行。
+_SENTENCE_BOUNDARY_PATTERN = re.compile(r"(?<=[。．！？!?])(?![。．！？!?」』）)])|\n+")
+
+# 文の境界に置く無音モーラのテキスト。文中の読点による無音（`、`）と区別するために用いる。
+SENTENCE_BOUNDARY_PAUSE_TEXT: Final = "。"
+
+# パイプラインの前段が後段に先行して処理してよい要素数
+_MAX_PENDING = 2
+
+
+def split_into_sentences(text: str) -> list[str]:
+    """
+    テキストを文末記号と改行で文へ分割する。空白のみからなる文は除く。
+
+    Examples
+    --------
+    >>> split_into_sentences("こんにちは。元気ですか？はい！")
+    ['こんにちは。', '元気ですか？', 'はい！']
+    """
+    sentences = _SENTENCE_BOUNDARY_PATTERN.split(text)
+    return [sentence for sentence in sentences if sentence.strip() != ""]
+
+
+def run_two_stage_pipeline[T, U, V](
+    items: Iterable[T],
+    first_stage: Callable[[T], U],
+    second_stage: Callable[[U], V],
+    max_pending: int = _MAX_PENDING,
+) -> list[V]:
+    """
+    各要素へ前段・後段の処理を順に適用し、後段の結果を要素順に返す。
+
+    前段は別スレッドで実行され、後段が要素 N を処理している間に要素 N+1 以降を高々 `max_pending` 個まで先行して処理する。
+    いずれかの段で例外が発生した場合、未着手の前段処理を取り消して例外を送出する。
+    """
+    results: list[V] = []
+    executor = ThreadPoolExecutor(max_workers=1)
+    pending: deque[Future[U]] = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(first_stage, item))
+            if len(pending) > max_pending:
+                results.append(second_stage(pending.popleft().result()))
+        while len(pending) != 0:
+            results.append(second_stage(pending.popleft().result()))
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return results
@@ -1,6 +1,5 @@
 """テキスト音声合成エンジン"""
 
-import copy
 import math
 from typing import Any, Final, Literal
 
@@ -14,6 +13,8 @@ from ..metas.metas import StyleId
 from ..model import AudioQuery
 from ..utility.core_version_utility import MOCK_CORE_VERSION, get_latest_version
 from .audio_postprocessing import raw_wave_to_output_wave
+from .frontend_pool import TextFrontendPool
+from .incremental_synthesis import DecodedWaveStore, decode_incrementally
 from .kana_converter import parse_kana
 from .model import (
     AccentPhrase,
@@ -22,6 +23,12 @@ from .model import (
 from .mora_mapping import mora_phonemes_to_mora_kana
 from .njd_feature_processor import text_to_full_context_labels
 from .phoneme import Phoneme
+from .prediction_cache import PhrasePredictionCache
+from .sentence_pipeline import (
+    SENTENCE_BOUNDARY_PAUSE_TEXT,
+    run_two_stage_pipeline,
+    split_into_sentences,
+)
 from .text_analyzer import full_context_labels_to_accent_phrases
 
 # 疑問文語尾定数
@@ -29,6 +36,12 @@ UPSPEAK_LENGTH = 0.15
 UPSPEAK_PITCH_ADD = 0.3
 UPSPEAK_PITCH_MAX = 6.5
 
+# フレームレート
+_FRAMERATE: Final = 93.75  # 24000 / 256 [frame/sec]
+
+# 直近の合成結果を保持する合成セッションの最大数
+_MAX_SYNTHESIS_SESSIONS = 16
+
 
 class TalkInvalidInputError(Exception):
     """Talk の不正な入力エラー"""
@@ -46,6 +59,30 @@ def to_flatten_moras(accent_phrases: list[AccentPhrase]) -> list[Mora]:
     return moras
 
 
+# アクセント句に含まれるモーラの子音・母音の系列
+type _PhrasePhonemes = tuple[tuple[str | None, str], ...]
+
+
+def _to_phrase_phonemes(accent_phrase: AccentPhrase) -> _PhrasePhonemes:
+    """アクセント句から、無音モーラを含むモーラごとの子音・母音の系列を抽出する。"""
+    return tuple(
+        (mora.consonant, mora.vowel) for mora in to_flatten_moras([accent_phrase])
+    )
+
+
+def _split_by_phrase[T](
+    accent_phrases: list[AccentPhrase], mora_values: list[T]
+) -> list[tuple[T, ...]]:
+    """アクセント句系列のモーラごとの値を、アクセント句ごとに分割する。"""
+    phrase_values: list[tuple[T, ...]] = []
+    start = 0
+    for accent_phrase in accent_phrases:
+        end = start + len(to_flatten_moras([accent_phrase]))
+        phrase_values.append(tuple(mora_values[start:end]))
+        start = end
+    return phrase_values
+
+
 def _to_flatten_phonemes(moras: list[Mora]) -> list[Phoneme]:
     """モーラ系列から音素系列を抽出する"""
     phonemes: list[Phoneme] = []
@@ -81,13 +118,13 @@ def _apply_interrogative_upspeak(
     if not enable_interrogative_upspeak:
         return accent_phrases
 
+    # NOTE: 引数のアクセント句は変更せず、モーラを付与するアクセント句のみを浅く複製する
+    upspoken_accent_phrases: list[AccentPhrase] = []
     for accent_phrase in accent_phrases:
         moras = accent_phrase.moras
-        if len(moras) == 0:
-            continue
         # 疑問形補正条件: 疑問形アクセント句 & 末尾有声モーラ
-        if accent_phrase.is_interrogative and moras[-1].pitch > 0:
-            last_mora = copy.deepcopy(moras[-1])
+        if len(moras) != 0 and accent_phrase.is_interrogative and moras[-1].pitch > 0:
+            last_mora = moras[-1]
             upspeak_mora = Mora(
                 text=mora_phonemes_to_mora_kana[last_mora.vowel],
                 consonant=None,
@@ -96,8 +133,11 @@ def _apply_interrogative_upspeak(
                 vowel_length=UPSPEAK_LENGTH,
                 pitch=min(last_mora.pitch + UPSPEAK_PITCH_ADD, UPSPEAK_PITCH_MAX),
             )
-            accent_phrase.moras += [upspeak_mora]
-    return accent_phrases
+            accent_phrase = accent_phrase.model_copy(
+                update={"moras": moras + [upspeak_mora]}
+            )
+        upspoken_accent_phrases.append(accent_phrase)
+    return upspoken_accent_phrases
 
 
 def _apply_prepost_silence(moras: list[Mora], query: AudioQuery) -> list[Mora]:
@@ -158,9 +198,8 @@ def _count_frame_per_unit(
 
 
 def _to_frame(sec: float) -> int:
-    FRAMERATE = 93.75  # 24000 / 256 [frame/sec]
     # NOTE: `round` は偶数丸め。移植時に取扱い注意。詳細は voicevox_engine#552
-    sec_rounded: NDArray[np.float64] = np.round(sec * FRAMERATE)
+    sec_rounded: NDArray[np.float64] = np.round(sec * _FRAMERATE)
     return sec_rounded.astype(np.int32).item()
 
 
@@ -199,11 +238,31 @@ def _apply_intonation_scale(moras: list[Mora], query: AudioQuery) -> list[Mora]:
     return moras
 
 
-def _query_to_decoder_feature(
-    query: AudioQuery,
-) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
-    """音声合成用のクエリからフレームごとの音素 (shape=(フレーム長, 音素数)) と音高 (shape=(フレーム長,)) を得る"""
-    moras = to_flatten_moras(query.accent_phrases)
+def _is_mora_modified_by_query(mora: Mora, query: AudioQuery) -> bool:
+    """クエリの設定の適用によってモーラの値が変更されるか否かを判定する。"""
+    if query.speedScale != 1.0:
+        return True
+    if mora.pitch != 0.0 and query.pitchScale != 0.0:
+        return True
+    if mora.pitch > 0.0 and query.intonationScale != 1.0:
+        return True
+    return mora.vowel == "pau" and (
+        query.pauseLength is not None or query.pauseLengthScale != 1.0
+    )
+
+
+def _query_to_moras(query: AudioQuery) -> list[Mora]:
+    """
+    音声合成用のクエリから、クエリの設定を適用した前後無音付きのモーラ系列を得る。引数のクエリは変更しない。
+
+    返り値のモーラはクエリのモーラと共有される場合があるため、変更してはならない。
+    """
+    # NOTE: 以降の設定の適用はモーラを破壊的に変更するため、値が変更されるモーラのみを複製する。
+    #       モーラの値はすべて不変な型であるため、浅い複製で十分である。
+    moras = [
+        mora.model_copy() if _is_mora_modified_by_query(mora, query) else mora
+        for mora in to_flatten_moras(query.accent_phrases)
+    ]
 
     # 設定を適用する
     moras = _apply_prepost_silence(moras, query)
@@ -212,7 +271,47 @@ def _query_to_decoder_feature(
     moras = _apply_speed_scale(moras, query)
     moras = _apply_pitch_scale(moras, query)
     moras = _apply_intonation_scale(moras, query)
+    return moras
+
+
+def _split_moras_at_sentence_boundaries(moras: list[Mora]) -> list[list[Mora]]:
+    """
+    モーラ系列を文の境界を表す無音モーラの位置で文ごとの区間へ分割する。
+
+    区間の境界が無音の中に来るよう、無音モーラはフレーム長を半分ずつ前後の区間へ割り当てる。
+    前後の区間のフレーム長の和は分割前の無音のフレーム長と一致する。
+    """
+    segments: list[list[Mora]] = [[]]
+    for mora in moras:
+        if mora.vowel == "pau" and mora.text == SENTENCE_BOUNDARY_PAUSE_TEXT:
+            n_frame = _to_frame(mora.vowel_length)
+            n_former_frame = n_frame // 2
+            segments[-1].append(
+                mora.model_copy(update={"vowel_length": n_former_frame / _FRAMERATE})
+            )
+            segments.append(
+                [
+                    mora.model_copy(
+                        update={"vowel_length": (n_frame - n_former_frame) / _FRAMERATE}
+                    )
+                ]
+            )
+        else:
+            segments[-1].append(mora)
+    return segments
+
 
+def _query_to_decoder_feature(
+    query: AudioQuery,
+) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
+    """音声合成用のクエリからフレームごとの音素 (shape=(フレーム長, 音素数)) と音高 (shape=(フレーム長,)) を得る"""
+    return _moras_to_decoder_feature(_query_to_moras(query))
+
+
+def _moras_to_decoder_feature(
+    moras: list[Mora],
+) -> tuple[NDArray[np.float32], NDArray[np.float32]]:
+    """モーラ系列からフレームごとの音素 (shape=(フレーム長, 音素数)) と音高 (shape=(フレーム長,)) を得る"""
     # 表現を変更する（音素クラス → 音素 onehot ベクトル、モーラクラス → 音高スカラ）
     phoneme = np.stack([p.onehot for p in _to_flatten_phonemes(moras)])
     f0 = np.array([mora.pitch for mora in moras], dtype=np.float32)
@@ -228,9 +327,28 @@ def _query_to_decoder_feature(
 class TTSEngine:
     """音声合成器（core）の管理/実行/プロキシと音声合成フロー"""
 
-    def __init__(self, core: CoreWrapper):
+    def __init__(
+        self,
+        core: CoreWrapper,
+        text_frontend_pool: TextFrontendPool | None = None,
+        prediction_cache_size: int = 0,
+    ):
         super().__init__()
         self._core = CoreAdapter(core)
+        self._text_frontend_pool = text_frontend_pool
+        # 合成セッションごとの直近の合成結果
+        self._decoded_waves = DecodedWaveStore(_MAX_SYNTHESIS_SESSIONS)
+
+        # アクセント句ごとの音素長・音高の推論結果のキャッシュ。サイズが 0 の場合は無効。
+        self._length_cache: (
+            PhrasePredictionCache[_PhrasePhonemes, tuple[float | None, float]] | None
+        ) = None
+        self._pitch_cache: (
+            PhrasePredictionCache[tuple[_PhrasePhonemes, int], float] | None
+        ) = None
+        if prediction_cache_size > 0:
+            self._length_cache = PhrasePredictionCache(prediction_cache_size)
+            self._pitch_cache = PhrasePredictionCache(prediction_cache_size)
 
     @property
     def default_sampling_rate(self) -> int:
@@ -246,6 +364,35 @@ class TTSEngine:
         self, accent_phrases: list[AccentPhrase], style_id: StyleId
     ) -> list[AccentPhrase]:
         """アクセント句系列に含まれる音素の長さをスタイルに合わせて更新する。"""
+        # 音素ごとの長さを生成する
+        if self._length_cache is None:
+            mora_lengths = self._predict_mora_lengths(accent_phrases, style_id)
+        else:
+            # 推論済みのアクセント句は、前後の文脈が変わっていなければ推論結果を再利用する
+            phrase_lengths = self._length_cache.predict(
+                [_to_phrase_phonemes(ap) for ap in accent_phrases],
+                style_id,
+                lambda start, end: _split_by_phrase(
+                    accent_phrases[start:end],
+                    self._predict_mora_lengths(accent_phrases[start:end], style_id),
+                ),
+            )
+            mora_lengths = [length for lengths in phrase_lengths for length in lengths]
+
+        # 生成された音素長でモーラの音素長を更新する
+        moras = to_flatten_moras(accent_phrases)
+        for mora, (consonant_length, vowel_length) in zip(
+            moras, mora_lengths, strict=True
+        ):
+            mora.consonant_length = consonant_length
+            mora.vowel_length = vowel_length
+
+        return accent_phrases
+
+    def _predict_mora_lengths(
+        self, accent_phrases: list[AccentPhrase], style_id: StyleId
+    ) -> list[tuple[float | None, float]]:
+        """アクセント句系列に含まれるモーラごとの子音長・母音長を生成する。"""
         # モーラ系列を抽出する
         moras = to_flatten_moras(accent_phrases)
 
@@ -258,16 +405,16 @@ class TTSEngine:
         # 音素ごとの長さを生成する
         phoneme_lengths = self._core.safe_yukarin_s_forward(phoneme_ids, style_id)
 
-        # 生成された音素長でモーラの音素長を更新する
+        # 生成された音素長をモーラごとにまとめる
         vowel_indexes = [i for i, p in enumerate(phonemes) if p.is_mora_tail()]
+        mora_lengths: list[tuple[float | None, float]] = []
         for i, mora in enumerate(moras):
             if mora.consonant is None:
-                mora.consonant_length = None
+                consonant_length = None
             else:
-                mora.consonant_length = phoneme_lengths[vowel_indexes[i] - 1]
-            mora.vowel_length = phoneme_lengths[vowel_indexes[i]]
-
-        return accent_phrases
+                consonant_length = phoneme_lengths[vowel_indexes[i] - 1]
+            mora_lengths.append((consonant_length, phoneme_lengths[vowel_indexes[i]]))
+        return mora_lengths
 
     def update_pitch(
         self, accent_phrases: list[AccentPhrase], style_id: StyleId
@@ -277,6 +424,32 @@ class TTSEngine:
         if len(accent_phrases) == 0:
             return []
 
+        # モーラ音高を生成する
+        if self._pitch_cache is None:
+            mora_pitches = self._predict_mora_pitches(accent_phrases, style_id)
+        else:
+            # 推論済みのアクセント句は、前後の文脈が変わっていなければ推論結果を再利用する
+            phrase_pitches = self._pitch_cache.predict(
+                [(_to_phrase_phonemes(ap), ap.accent) for ap in accent_phrases],
+                style_id,
+                lambda start, end: _split_by_phrase(
+                    accent_phrases[start:end],
+                    self._predict_mora_pitches(accent_phrases[start:end], style_id),
+                ),
+            )
+            mora_pitches = [pitch for pitches in phrase_pitches for pitch in pitches]
+
+        # 更新する
+        moras = to_flatten_moras(accent_phrases)
+        for mora, pitch in zip(moras, mora_pitches, strict=True):
+            mora.pitch = pitch
+
+        return accent_phrases
+
+    def _predict_mora_pitches(
+        self, accent_phrases: list[AccentPhrase], style_id: StyleId
+    ) -> list[float]:
+        """アクセント句系列に含まれるモーラごとの音高を生成する。"""
         # アクセントの開始/終了位置リストを作る
         start_accent_list = np.concatenate(
             [
@@ -330,11 +503,7 @@ class TTSEngine:
             if p.is_unvoiced_mora_tail():
                 f0[i] = 0
 
-        # 更新する
-        for i, mora in enumerate(moras):
-            mora.pitch = f0[i]
-
-        return accent_phrases
+        return list(f0)
 
     def update_length_and_pitch(
         self, accent_phrases: list[AccentPhrase], style_id: StyleId
@@ -349,13 +518,77 @@ class TTSEngine:
         text: str,
         style_id: StyleId,
         enable_katakana_english: bool,
+        enable_sentence_pipeline: bool = False,
     ) -> list[AccentPhrase]:
-        """テキストからアクセント句系列を生成し、スタイルIDに基づいてその音素長・モーラ音高を更新する"""
+        """
+        テキストからアクセント句系列を生成し、スタイルIDに基づいてその音素長・モーラ音高を更新する
+
+        `enable_sentence_pipeline` が True の場合、テキストを文ごとに分割し、ある文の音素長・音高の生成と次の文のテキスト解析を並行しておこなう。
+        文の境界にはテキストが `SENTENCE_BOUNDARY_PAUSE_TEXT` の無音モーラが置かれる。
+        """
+        if enable_sentence_pipeline:
+            sentences = split_into_sentences(text)
+            if len(sentences) > 1:
+                return self._create_accent_phrases_by_sentence(
+                    sentences, style_id, enable_katakana_english
+                )
+
+        accent_phrases = self._text_to_accent_phrases(text, enable_katakana_english)
+        accent_phrases = self.update_length_and_pitch(accent_phrases, style_id)
+        return accent_phrases
+
+    def _text_to_accent_phrases(
+        self, text: str, enable_katakana_english: bool
+    ) -> list[AccentPhrase]:
+        """テキストからアクセント句系列を生成する。テキスト解析プールがある場合はワーカープロセスで解析する。"""
+        if self._text_frontend_pool is not None:
+            return self._text_frontend_pool.text_to_accent_phrases(
+                text, enable_katakana_english
+            )
         full_context_labels = text_to_full_context_labels(
             text, enable_katakana_english=enable_katakana_english
         )
-        accent_phrases = full_context_labels_to_accent_phrases(full_context_labels)
-        accent_phrases = self.update_length_and_pitch(accent_phrases, style_id)
+        return full_context_labels_to_accent_phrases(full_context_labels)
+
+    def _create_accent_phrases_by_sentence(
+        self, sentences: list[str], style_id: StyleId, enable_katakana_english: bool
+    ) -> list[AccentPhrase]:
+        """文ごとにテキスト解析と音素長・モーラ音高の生成をパイプライン処理し、アクセント句系列を連結する"""
+
+        def analyze(indexed_sentence: tuple[int, str]) -> list[AccentPhrase]:
+            """文からアクセント句系列を生成する。最後の文以外は末尾へ文の境界を表す無音モーラを付与する。"""
+            index, sentence = indexed_sentence
+            accent_phrases = self._text_to_accent_phrases(
+                sentence, enable_katakana_english
+            )
+            if len(accent_phrases) != 0 and index != len(sentences) - 1:
+                accent_phrases[-1].pause_mora = Mora(
+                    text=SENTENCE_BOUNDARY_PAUSE_TEXT,
+                    consonant=None,
+                    consonant_length=None,
+                    vowel="pau",
+                    vowel_length=0,
+                    pitch=0,
+                )
+            return accent_phrases
+
+        def predict(accent_phrases: list[AccentPhrase]) -> list[AccentPhrase]:
+            """アクセント句系列の音素長・モーラ音高を更新する。"""
+            if len(accent_phrases) == 0:
+                return []
+            return self.update_length_and_pitch(accent_phrases, style_id)
+
+        accent_phrases_per_sentence = run_two_stage_pipeline(
+            enumerate(sentences), analyze, predict
+        )
+        accent_phrases = [
+            accent_phrase
+            for sentence_accent_phrases in accent_phrases_per_sentence
+            for accent_phrase in sentence_accent_phrases
+        ]
+        # 末尾の文がアクセント句を持たない場合に備え、最後のアクセント句の無音を取り除く
+        if len(accent_phrases) != 0:
+            accent_phrases[-1].pause_mora = None
         return accent_phrases
 
     def create_accent_phrases_from_kana(
@@ -371,19 +604,74 @@ class TTSEngine:
         query: AudioQuery,
         style_id: StyleId,
         enable_interrogative_upspeak: bool,
+        enable_sentence_pipeline: bool = False,
+        synthesis_session_id: str | None = None,
     ) -> NDArray[np.float32]:
-        """音声合成用のクエリ・スタイルID・疑問文語尾自動調整フラグに基づいて音声波形を生成する"""
-        # モーフィング時などに同一参照のqueryで複数回呼ばれる可能性があるので、元の引数のqueryに破壊的変更を行わない
-        query = copy.deepcopy(query)
-        query.accent_phrases = _apply_interrogative_upspeak(
-            query.accent_phrases, enable_interrogative_upspeak
+        """
+        音声合成用のクエリ・スタイルID・疑問文語尾自動調整フラグに基づいて音声波形を生成する
+
+        `enable_sentence_pipeline` が True の場合、文の境界を表す無音モーラの位置で文ごとの区間に分割し、ある区間の波形生成と次の区間の特徴量生成を並行しておこなう。
+        文の境界は `create_accent_phrases()` の文ごとのパイプライン処理が置いた無音モーラで判別する。
+        `synthesis_session_id` が指定された場合、同じ ID での前回の合成結果のうち変化していない区間を再利用し、変化した区間のみを波形生成する。
+        この場合 `enable_sentence_pipeline` は無視される。
+        """
+        # モーフィング時などに同一参照のqueryで複数回呼ばれる可能性があるので、元の引数のqueryに破壊的変更を行わない。
+        # 各処理は引数のクエリを変更せず新しいモーラ系列を生成するため、クエリ全体の深い複製は不要である。
+        query = query.model_copy(
+            update={
+                "accent_phrases": _apply_interrogative_upspeak(
+                    query.accent_phrases, enable_interrogative_upspeak
+                )
+            }
         )
 
-        phoneme, f0 = _query_to_decoder_feature(query)
-        raw_wave, sr_raw_wave = self._core.safe_decode_forward(phoneme, f0, style_id)
+        if synthesis_session_id is not None:
+            phoneme, f0 = _query_to_decoder_feature(query)
+            decoded_wave = decode_incrementally(
+                self._decoded_waves.get(synthesis_session_id),
+                phoneme,
+                f0,
+                style_id,
+                lambda phoneme, f0: self._core.safe_decode_forward(
+                    phoneme, f0, style_id
+                ),
+            )
+            self._decoded_waves.put(synthesis_session_id, decoded_wave)
+            raw_wave, sr_raw_wave = decoded_wave.raw_wave, decoded_wave.sampling_rate
+        elif enable_sentence_pipeline:
+            raw_wave, sr_raw_wave = self._decode_by_segment(query, style_id)
+        else:
+            phoneme, f0 = _query_to_decoder_feature(query)
+            raw_wave, sr_raw_wave = self._core.safe_decode_forward(
+                phoneme, f0, style_id
+            )
         wave = raw_wave_to_output_wave(query, raw_wave, sr_raw_wave)
         return wave
 
+    def _decode_by_segment(
+        self, query: AudioQuery, style_id: StyleId
+    ) -> tuple[NDArray[np.float32], int]:
+        """文ごとの区間について特徴量生成と波形生成をパイプライン処理し、生音声波形を連結する"""
+        # NOTE: 抑揚スケール等はクエリ全体の統計に依存するため、区間へ分割する前に適用する
+        segments = _split_moras_at_sentence_boundaries(_query_to_moras(query))
+
+        def decode(
+            feature: tuple[NDArray[np.float32], NDArray[np.float32]],
+        ) -> NDArray[np.float32] | None:
+            """区間の特徴量から生音声波形を生成する。フレーム長 0 の区間は None とする。"""
+            phoneme, f0 = feature
+            if phoneme.shape[0] == 0:
+                return None
+            raw_wave, _ = self._core.safe_decode_forward(phoneme, f0, style_id)
+            return raw_wave
+
+        raw_waves = run_two_stage_pipeline(segments, _moras_to_decoder_feature, decode)
+        raw_waves = [raw_wave for raw_wave in raw_waves if raw_wave is not None]
+        # 全ての区間のフレーム長が 0 の場合は空の波形とする
+        if len(raw_waves) == 0:
+            return np.zeros(0, dtype=np.float32), self._core.default_sampling_rate
+        return np.concatenate(raw_waves), self._core.default_sampling_rate
+
     def initialize_synthesis(self, style_id: StyleId, skip_reinit: bool) -> None:
         """指定されたスタイル ID に関する合成機能を初期化する。既に初期化されていた場合は引数に応じて再初期化する。"""
         self._core.initialize_style_id_synthesis(style_id, skip_reinit=skip_reinit)
@@ -439,14 +727,22 @@ class TTSEngineManager:
             raise TTSEngineNotFound(version=version)
 
 
-def make_tts_engines_from_cores(core_manager: CoreManager) -> TTSEngineManager:
-    """コア一覧からTTSエンジン一覧を生成する"""
+def make_tts_engines_from_cores(
+    core_manager: CoreManager,
+    text_frontend_pool: TextFrontendPool | None = None,
+    prediction_cache_size: int = 0,
+) -> TTSEngineManager:
+    """コア一覧からTTSエンジン一覧を生成する。`text_frontend_pool` は全エンジンで共有される。"""
     tts_engines = TTSEngineManager()
     for ver, core in core_manager.items():
         if ver == MOCK_CORE_VERSION:
             from ..dev.tts_engine.mock import MockTTSEngine
 
-            tts_engines.register_engine(MockTTSEngine(), ver)
+            tts_engines.register_engine(
+                MockTTSEngine(text_frontend_pool, prediction_cache_size), ver
+            )
         else:
-            tts_engines.register_engine(TTSEngine(core.core), ver)
+            tts_engines.register_engine(
+                TTSEngine(core.core, text_frontend_pool, prediction_cache_size), ver
+            )
     return tts_engines
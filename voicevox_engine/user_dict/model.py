@@ -6,7 +6,7 @@
 
 from enum import StrEnum
 from re import fullmatch
-from typing import Annotated, Self
+from typing import Annotated, Literal, Self
 
 from pydantic import AfterValidator, BaseModel, ConfigDict, Field, model_validator
 from pydantic.json_schema import SkipJsonSchema
@@ -114,3 +114,35 @@ class UserDictWord(BaseModel):
             msg = f"誤ったアクセント型です({self.accent_type})。 expect: 0 <= accent_type <= {self.mora_count}"
             raise ValueError(msg)
         return self
+
+
+class UserDictWordOperation(BaseModel):
+    """ユーザー辞書の一括操作を構成する、言葉ひとつに対する操作。"""
+
+    type: Literal["add", "update", "delete"] = Field(
+        description="操作の種類。add（追加）、update（更新）、delete（削除）のいずれか"
+    )
+    word_uuid: str | SkipJsonSchema[None] = Field(
+        default=None, description="更新・削除する言葉のUUID。update と delete で必須"
+    )
+    surface: str | SkipJsonSchema[None] = Field(
+        default=None, description="言葉の表層形。add と update で必須"
+    )
+    pronunciation: str | SkipJsonSchema[None] = Field(
+        default=None, description="言葉の発音（カタカナ）。add と update で必須"
+    )
+    accent_type: int | SkipJsonSchema[None] = Field(
+        default=None,
+        description="アクセント型（音が下がる場所を指す）。add と update で必須",
+    )
+    word_type: WordTypes | SkipJsonSchema[None] = Field(
+        default=None,
+        description="PROPER_NOUN（固有名詞）、COMMON_NOUN（普通名詞）、VERB（動詞）、ADJECTIVE（形容詞）、SUFFIX（語尾）のいずれか",
+    )
+    priority: (
+        Annotated[int, Field(ge=USER_DICT_MIN_PRIORITY, le=USER_DICT_MAX_PRIORITY)]
+        | SkipJsonSchema[None]
+    ) = Field(
+        default=None,
+        description="単語の優先度（0から10までの整数）。数字が大きいほど優先度が高くなる。1から9までの値を指定することを推奨",
+    )
@@ -1,27 +1,33 @@
 """ユーザー辞書関連の処理"""
 
+import csv
+import hashlib
 import sys
 import threading
+import time
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 from pathlib import Path
-from typing import Any, Final, TypeVar
-from uuid import UUID, uuid4
+from traceback import print_exception
+from typing import Any, Final, Literal, TypeVar
+from uuid import UUID, uuid4, uuid5
 
 import pyopenjtalk
-from pydantic import TypeAdapter
+from pydantic import TypeAdapter, ValidationError
 
 from ..utility.path_utility import get_save_dir, resource_root
-from .model import UserDictWord
+from .model import UserDictWord, UserDictWordOperation
 from .user_dict_word import (
     SaveFormatUserDictWord,
     UserDictInputError,
+    UserDictOperationsError,
     WordProperty,
     convert_from_save_format,
     convert_to_save_format,
     create_word,
-    part_of_speech_data,
+    is_consistent_part_of_speech,
     priority2cost,
+    search_part_of_speech,
 )
 
 F = TypeVar("F", bound=Callable[..., Any])
@@ -51,6 +57,22 @@ if not save_dir.is_dir():
 DEFAULT_DICT_PATH: Final = resource_dir / "default.csv"  # VOICEVOXデフォルト辞書
 _USER_DICT_PATH: Final = save_dir / "user_dict.json"  # ユーザー辞書
 
+# コンパイル済み辞書キャッシュのファイル名。`{layer}` は辞書の層、`{key}` は内容に基づくキー
+_COMPILED_DICT_CACHE_NAME: Final = "{layer}.dict_cache-{key}.dic"
+_COMPILED_DICT_CACHE_GLOB: Final = "*.dict_cache-*.dic"
+# 他のプロセスが作成したコンパイル済み辞書キャッシュを、最後に使われてから削除するまでの期間
+# NOTE: 同じ保存先を共有する他のエンジンが使用中のキャッシュを削除しないよう、十分に長くとる
+_FOREIGN_CACHE_MAX_AGE_SEC: Final = 30 * 24 * 60 * 60
+
+# このプロセスがコンパイルしたコンパイル済み辞書キャッシュのパス
+_created_cache_paths: set[Path] = set()
+
+
+# バックグラウンドでの辞書更新において、最後の更新要求から辞書を更新するまでの待機時間
+_UPDATE_DEBOUNCE_SEC: Final = 0.3
+# バックグラウンドでの辞書更新において、最初の更新要求から辞書を更新するまでの最大の待機時間
+_UPDATE_MAX_DELAY_SEC: Final = 2.0
+
 
 # 同時書き込みの制御
 mutex_user_dict = threading.Lock()
@@ -58,6 +80,7 @@ mutex_openjtalk_dict = threading.Lock()
 
 
 _save_format_dict_adapter = TypeAdapter(dict[str, SaveFormatUserDictWord])
+_user_dict_adapter = TypeAdapter(dict[str, UserDictWord])
 
 
 def _delete_file_on_close(file_path: Path) -> None:
@@ -116,6 +139,378 @@ def _delete_file_on_close(file_path: Path) -> None:
         file_path.unlink()
 
 
+def _to_csv_text(user_dict: dict[str, UserDictWord]) -> str:
+    """ユーザー辞書データを MeCab 辞書.csv 形式の文字列へ変換する。"""
+    csv_text = ""
+    for word in user_dict.values():
+        csv_text += (
+            "{surface},{context_id},{context_id},{cost},{part_of_speech},"
+            + "{part_of_speech_detail_1},{part_of_speech_detail_2},"
+            + "{part_of_speech_detail_3},{inflectional_type},"
+            + "{inflectional_form},{stem},{yomi},{pronunciation},"
+            + "{accent_type}/{mora_count},{accent_associative_rule}\n"
+        ).format(
+            surface=word.surface,
+            context_id=word.context_id,
+            cost=priority2cost(word.context_id, word.priority),
+            part_of_speech=word.part_of_speech,
+            part_of_speech_detail_1=word.part_of_speech_detail_1,
+            part_of_speech_detail_2=word.part_of_speech_detail_2,
+            part_of_speech_detail_3=word.part_of_speech_detail_3,
+            inflectional_type=word.inflectional_type,
+            inflectional_form=word.inflectional_form,
+            stem=word.stem,
+            yomi=word.yomi,
+            pronunciation=word.pronunciation,
+            accent_type=word.accent_type,
+            mora_count=word.mora_count,
+            accent_associative_rule=word.accent_associative_rule,
+        )
+    return csv_text
+
+
+def _compiled_dict_cache_key(csv_text: str) -> str:
+    """辞書.csv の内容と pyopenjtalk のバージョンから、コンパイル済み辞書キャッシュのキーを生成する。"""
+    hasher = hashlib.sha256()
+    hasher.update(pyopenjtalk.__version__.encode("utf-8"))
+    hasher.update(b"\0")
+    hasher.update(csv_text.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _compile_dict_csv(csv_text: str, compiled_path: Path) -> None:
+    """辞書.csv の内容を OpenJTalk 用にコンパイルし、`compiled_path` へ保存する。"""
+    random_string = uuid4()
+    tmp_csv_path = compiled_path.with_name(
+        f"user.dict_csv-{random_string}.tmp"
+    )  # csv形式辞書データの一時保存ファイル
+    tmp_compiled_path = compiled_path.with_name(
+        f"user.dict_compiled-{random_string}.tmp"
+    )  # コンパイル済み辞書データの一時保存ファイル
+
+    try:
+        # 辞書データを辞書.csv へ一時保存
+        tmp_csv_path.write_text(csv_text, encoding="utf-8")
+
+        # 辞書.csvをOpenJTalk用にコンパイル
+        pyopenjtalk.mecab_dict_index(str(tmp_csv_path), str(tmp_compiled_path))
+        if not tmp_compiled_path.is_file():
+            raise RuntimeError("辞書のコンパイル時にエラーが発生しました。")
+
+        # NOTE: コンパイル途中のファイルがキャッシュとして読み込まれないよう、完成後に配置する
+        tmp_compiled_path.replace(compiled_path)
+        _created_cache_paths.add(compiled_path)
+
+    finally:
+        # 後処理
+        if tmp_csv_path.exists():
+            tmp_csv_path.unlink()
+        if tmp_compiled_path.exists():
+            tmp_compiled_path.unlink()
+
+
+def _prepare_compiled_dict(csv_text: str, layer: str, cache_dir: Path) -> Path:
+    """辞書.csv の内容に対応するコンパイル済み辞書を用意し、そのパスを返す。キャッシュがあれば再利用する。"""
+    cache_key = _compiled_dict_cache_key(csv_text)
+    compiled_path = cache_dir / _COMPILED_DICT_CACHE_NAME.format(
+        layer=layer, key=cache_key
+    )
+    if compiled_path.is_file():
+        # NOTE: 最終更新日時を最後に使われた日時として扱い、使用中のキャッシュが他のプロセスに削除されないようにする
+        try:
+            compiled_path.touch()
+        except OSError:
+            pass
+    else:
+        _compile_dict_csv(csv_text, compiled_path)
+    return compiled_path
+
+
+# 複数のコンパイル済み辞書を同時に読み込めるか否か。読み込みに失敗した時点で False とする。
+_is_layered_dict_supported = True
+
+
+def _load_layered_dicts(compiled_paths: list[Path]) -> bool:
+    """
+    複数のコンパイル済み辞書を OpenJTalk へ同時に読み込む。
+
+    MeCab はカンマ区切りで複数のユーザー辞書を受け付けるため、各辞書のパスを結合して渡す。
+    pyopenjtalk がこれを受け付けない場合は False を返し、以降は `_is_layered_dict_supported` を False とする。
+    """
+    global _is_layered_dict_supported
+
+    # NOTE: resolveによりコンパイル実行時でも相対パスを正しく認識できる
+    paths = [str(path.resolve(strict=True)) for path in compiled_paths]
+    # カンマや引用符を含むパスは MeCab の CSV 解釈により分割が壊れるため結合できない
+    if any("," in path or '"' in path for path in paths):
+        return False
+
+    try:
+        pyopenjtalk.update_global_jtalk_with_user_dict(",".join(paths))
+    except FileNotFoundError, RuntimeError:
+        _is_layered_dict_supported = False
+        return False
+    return True
+
+
+def _load_compiled_dict(compiled_path: Path, rebuild: Callable[[], None]) -> None:
+    """コンパイル済み辞書を OpenJTalk へ読み込む。読み込みに失敗した場合は `rebuild` で作り直して読み込む。"""
+    try:
+        pyopenjtalk.update_global_jtalk_with_user_dict(
+            str(compiled_path.resolve(strict=True))
+        )  # NOTE: resolveによりコンパイル実行時でも相対パスを正しく認識できる
+    except Exception:
+        # キャッシュが破損している可能性があるため、コンパイルし直して読み込む
+        # NOTE: 他のエンジンが同じキャッシュを削除している場合がある
+        compiled_path.unlink(missing_ok=True)
+        rebuild()
+        pyopenjtalk.update_global_jtalk_with_user_dict(
+            str(compiled_path.resolve(strict=True))
+        )
+
+
+def _delete_stale_caches(cache_dir: Path, in_use_paths: list[Path]) -> None:
+    """
+    使われていないコンパイル済み辞書キャッシュを削除する。
+
+    このプロセスが作成したキャッシュは使われなくなった時点で削除する。
+    同じ保存先を共有する他のエンジンが作成したキャッシュは使用中の可能性があるため、
+    `_FOREIGN_CACHE_MAX_AGE_SEC` 以上使われていない場合のみ削除する。
+    """
+    now = time.time()
+    for cache_path in cache_dir.glob(_COMPILED_DICT_CACHE_GLOB):
+        if cache_path in in_use_paths:
+            continue
+        try:
+            if cache_path not in _created_cache_paths:
+                if now - cache_path.stat().st_mtime < _FOREIGN_CACHE_MAX_AGE_SEC:
+                    continue
+            _delete_file_on_close(cache_path)
+            _created_cache_paths.discard(cache_path)
+        except OSError, RuntimeError:
+            # 他プロセスが使用中などの理由で削除できない場合は次回以降に削除する
+            pass
+
+
+def _apply_operation(
+    user_dict: dict[str, UserDictWord], operation: UserDictWordOperation
+) -> str:
+    """ユーザー辞書データへ操作を 1 つ適用し、操作対象の単語 UUID を返す。"""
+    if operation.type == "delete":
+        word_uuid = operation.word_uuid
+        if word_uuid is None or word_uuid not in user_dict:
+            raise UserDictInputError("IDに該当するワードが見つかりませんでした")
+        del user_dict[word_uuid]
+        return word_uuid
+
+    if (
+        operation.surface is None
+        or operation.pronunciation is None
+        or operation.accent_type is None
+    ):
+        raise UserDictInputError(
+            "surface、pronunciation、accent_type を指定してください"
+        )
+    word = create_word(
+        WordProperty(
+            surface=operation.surface,
+            pronunciation=operation.pronunciation,
+            accent_type=operation.accent_type,
+            word_type=operation.word_type,
+            priority=operation.priority,
+        )
+    )
+    if operation.type == "add":
+        word_uuid = str(uuid4())
+    elif operation.word_uuid is not None and operation.word_uuid in user_dict:
+        word_uuid = operation.word_uuid
+    else:
+        raise UserDictInputError("UUIDに該当するワードが見つかりませんでした")
+    user_dict[word_uuid] = word
+    return word_uuid
+
+
+# MeCab 辞書.csv 形式の列数
+_MECAB_CSV_COLUMN_COUNT: Final = 15
+# CSV 形式でインポートされた単語の UUID を生成するための名前空間
+_CSV_WORD_UUID_NAMESPACE: Final = UUID("5f0c8f8e-3b9a-4c47-9d0e-2a6f1c7b4e13")
+
+
+def _validate_import_word(word: UserDictWord) -> None:
+    """インポートされた単語の品詞が、文脈IDの示す品詞と整合することを検証する。"""
+    pos_detail = search_part_of_speech(word.context_id)
+    if pos_detail is None:
+        raise UserDictInputError("対応していない品詞です")
+    if not is_consistent_part_of_speech(word, pos_detail):
+        raise UserDictInputError("品詞の情報が文脈IDと一致しません")
+
+
+def _parse_csv_row(row: list[str]) -> tuple[str, UserDictWord]:
+    """MeCab 辞書.csv 形式の 1 行を単語へ変換し、単語 UUID とともに返す。"""
+    if len(row) != _MECAB_CSV_COLUMN_COUNT:
+        raise UserDictInputError(
+            f"列数が不正です({len(row)})。 expect: {_MECAB_CSV_COLUMN_COUNT}"
+        )
+    (
+        surface,
+        left_context_id,
+        right_context_id,
+        cost,
+        part_of_speech,
+        part_of_speech_detail_1,
+        part_of_speech_detail_2,
+        part_of_speech_detail_3,
+        inflectional_type,
+        inflectional_form,
+        stem,
+        yomi,
+        pronunciation,
+        accent_type_and_mora_count,
+        accent_associative_rule,
+    ) = row
+    try:
+        context_id = int(left_context_id)
+        cost_value = int(cost)
+        accent_type, mora_count = map(int, accent_type_and_mora_count.split("/"))
+    except ValueError as e:
+        raise UserDictInputError("文脈ID・コスト・アクセント型が不正です") from e
+    if context_id != int(right_context_id):
+        raise UserDictInputError("左文脈IDと右文脈IDが一致しません")
+    if not -32768 <= cost_value <= 32767:
+        raise UserDictInputError(f"コストが範囲外です({cost_value})")
+    if search_part_of_speech(context_id) is None:
+        raise UserDictInputError("対応していない品詞です")
+
+    word = convert_from_save_format(
+        SaveFormatUserDictWord(
+            surface=surface,
+            cost=cost_value,
+            context_id=context_id,
+            part_of_speech=part_of_speech,
+            part_of_speech_detail_1=part_of_speech_detail_1,
+            part_of_speech_detail_2=part_of_speech_detail_2,
+            part_of_speech_detail_3=part_of_speech_detail_3,
+            inflectional_type=inflectional_type,
+            inflectional_form=inflectional_form,
+            stem=stem,
+            yomi=yomi,
+            pronunciation=pronunciation,
+            accent_type=accent_type,
+            mora_count=mora_count,
+            accent_associative_rule=accent_associative_rule,
+        )
+    )
+    _validate_import_word(word)
+    # NOTE: CSV は UUID を持たないため、同じ単語を再インポートしても重複しないよう内容から決定的に生成する
+    word_key = f"{word.surface},{word.context_id},{word.pronunciation}"
+    return str(uuid5(_CSV_WORD_UUID_NAMESPACE, word_key)), word
+
+
+def _parse_ndjson_line(line: str) -> dict[str, UserDictWord]:
+    """NDJSON 形式の 1 行を、単語 UUID から単語への対応へ変換する。"""
+    words = _user_dict_adapter.validate_json(line)
+    for word_uuid, word in words.items():
+        UUID(word_uuid)
+        _validate_import_word(word)
+    return words
+
+
+def _iter_import_words(
+    lines: Iterable[str], file_format: Literal["csv", "ndjson"]
+) -> Iterator[tuple[str, UserDictWord]]:
+    """インポートするユーザー辞書を 1 行ずつ解析し、単語 UUID と単語の組を順に返す。"""
+    if file_format == "csv":
+        reader = csv.reader(lines)
+        for row in reader:
+            if not row:
+                continue
+            try:
+                word_uuid, word = _parse_csv_row(row)
+            except (UserDictInputError, ValueError) as e:
+                raise UserDictInputError(f"{reader.line_num}行目: {e}") from e
+            yield word_uuid, word
+    else:
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                words = _parse_ndjson_line(line)
+            except (UserDictInputError, ValueError) as e:
+                raise UserDictInputError(f"{line_number}行目: {e}") from e
+            yield from words.items()
+
+
+class _DebouncedWorker:
+    """
+    要求に応じて処理をバックグラウンドで実行するワーカー。
+
+    要求が連続する間は実行を待ち、最後の要求から `delay` 秒が経過した時点で一度だけ実行する。
+    ただし要求が途絶えない場合でも、未処理の最初の要求から `max_delay` 秒が経過した時点で実行する。
+    """
+
+    def __init__(
+        self, target: Callable[[], None], delay: float, max_delay: float
+    ) -> None:
+        self._target = target
+        self._delay = delay
+        self._max_delay = max_delay
+        self._condition = threading.Condition()
+        self._first_requested_at: float | None = (
+            None  # 未処理の要求のうち最初の要求の時刻
+        )
+        self._last_requested_at: float | None = (
+            None  # 未処理の要求のうち最後の要求の時刻
+        )
+        self._is_running = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def request(self) -> None:
+        """処理の実行を要求する。"""
+        with self._condition:
+            now = time.monotonic()
+            if self._first_requested_at is None:
+                self._first_requested_at = now
+            self._last_requested_at = now
+            self._condition.notify_all()
+
+    def wait(self) -> None:
+        """未処理の要求が全て処理されるまで待機する。"""
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._last_requested_at is None and not self._is_running
+            )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._last_requested_at is not None)
+                # 要求が途絶えるか、最初の要求から最大の待機時間が経過するまで待機する
+                while (
+                    self._last_requested_at is not None
+                    and self._first_requested_at is not None
+                ):
+                    deadline = min(
+                        self._last_requested_at + self._delay,
+                        self._first_requested_at + self._max_delay,
+                    )
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                self._first_requested_at = None
+                self._last_requested_at = None
+                self._is_running = True
+            try:
+                self._target()
+            except Exception as e:
+                print_exception(e)
+            finally:
+                with self._condition:
+                    self._is_running = False
+                    self._condition.notify_all()
+
+
 class UserDictionary:
     """ユーザー辞書"""
 
@@ -124,6 +519,7 @@ class UserDictionary:
         self,
         default_dict_path: Path = DEFAULT_DICT_PATH,
         user_dict_path: Path = _USER_DICT_PATH,
+        enable_background_update: bool = False,
     ) -> None:
         """
         ユーザー辞書を利用可能にする。
@@ -134,11 +530,47 @@ class UserDictionary:
             デフォルト辞書ファイルのパス
         user_dict_path : Path
             ユーザー辞書ファイルのパス
+        enable_background_update : bool
+            単語の編集後の辞書の更新をバックグラウンドでおこなうか否か。
+            有効な場合、編集は即座に保存され、連続した編集はまとめて一度の更新で辞書へ適用される。
         """
         self._default_dict_path = default_dict_path
         self._user_dict_path = user_dict_path
+
+        # ユーザー辞書ファイルの内容のキャッシュ
+        self._words: dict[str, UserDictWord] = {}  # 単語 UUID から単語への対応
+        self._words_json: bytes | None = None  # API 向けにシリアライズ済みの全単語
+        self._file_state: tuple[int, int] | None = None  # ファイルの更新時刻とサイズ
+        self._is_cache_loaded = False
+
+        # OpenJTalk へ読み込まれているコンパイル済み辞書のパス
+        self._loaded_dict_paths: list[Path] = []
+
         self.update_dict()
 
+        self._update_worker: _DebouncedWorker | None = None
+        if enable_background_update:
+            self._update_worker = _DebouncedWorker(
+                self.update_dict, _UPDATE_DEBOUNCE_SEC, _UPDATE_MAX_DELAY_SEC
+            )
+
+    def _request_update(self) -> None:
+        """保存された辞書データを辞書へ適用する。バックグラウンド更新が有効な場合は更新を予約する。"""
+        if self._update_worker is None:
+            self.update_dict()
+        else:
+            self._update_worker.request()
+
+    @property
+    def loaded_dict_paths(self) -> list[Path]:
+        """OpenJTalk へ読み込まれているコンパイル済み辞書のパス。辞書の更新ごとに差し替えられる。"""
+        return list(self._loaded_dict_paths)
+
+    def wait_for_update(self) -> None:
+        """予約された辞書の更新が全て完了するまで待機する。"""
+        if self._update_worker is not None:
+            self._update_worker.wait()
+
     @_mutex_wrapper(mutex_user_dict)
     def _write_to_json(self, user_dict: dict[str, UserDictWord]) -> None:
         """ユーザー辞書データをファイルへ書き込む。"""
@@ -149,97 +581,124 @@ class UserDictionary:
         user_dict_json = _save_format_dict_adapter.dump_json(save_format_user_dict)
         self._user_dict_path.write_bytes(user_dict_json)
 
-    @_mutex_wrapper(mutex_openjtalk_dict)
-    def update_dict(self) -> None:
-        """辞書を更新する。"""
-        default_dict_path = self._default_dict_path
-        user_dict_path = self._user_dict_path
-
-        random_string = uuid4()
-        tmp_csv_path = user_dict_path.with_name(
-            f"user.dict_csv-{random_string}.tmp"
-        )  # csv形式辞書データの一時保存ファイル
-        tmp_compiled_path = user_dict_path.with_name(
-            f"user.dict_compiled-{random_string}.tmp"
-        )  # コンパイル済み辞書データの一時保存ファイル
+        # 書き込んだ内容をキャッシュへ反映する
+        self._set_cache(dict(user_dict), self._read_file_state())
 
+    def _read_file_state(self) -> tuple[int, int] | None:
+        """ユーザー辞書ファイルの更新時刻とサイズを取得する。ファイルが存在しない場合は None を返す。"""
         try:
-            # 辞書.csvを作成
-            csv_text = ""
-
-            # デフォルト辞書データの追加
-            if not default_dict_path.is_file():
-                warnings.warn("Cannot find default dictionary.", stacklevel=1)
-                return
-            default_dict = default_dict_path.read_text(encoding="utf-8")
-            if default_dict == default_dict.rstrip():
-                default_dict += "\n"
-            csv_text += default_dict
-
-            # ユーザー辞書データの追加
-            user_dict = self.read_dict()
-            for word_uuid in user_dict:
-                word = user_dict[word_uuid]
-                csv_text += (
-                    "{surface},{context_id},{context_id},{cost},{part_of_speech},"
-                    + "{part_of_speech_detail_1},{part_of_speech_detail_2},"
-                    + "{part_of_speech_detail_3},{inflectional_type},"
-                    + "{inflectional_form},{stem},{yomi},{pronunciation},"
-                    + "{accent_type}/{mora_count},{accent_associative_rule}\n"
-                ).format(
-                    surface=word.surface,
-                    context_id=word.context_id,
-                    cost=priority2cost(word.context_id, word.priority),
-                    part_of_speech=word.part_of_speech,
-                    part_of_speech_detail_1=word.part_of_speech_detail_1,
-                    part_of_speech_detail_2=word.part_of_speech_detail_2,
-                    part_of_speech_detail_3=word.part_of_speech_detail_3,
-                    inflectional_type=word.inflectional_type,
-                    inflectional_form=word.inflectional_form,
-                    stem=word.stem,
-                    yomi=word.yomi,
-                    pronunciation=word.pronunciation,
-                    accent_type=word.accent_type,
-                    mora_count=word.mora_count,
-                    accent_associative_rule=word.accent_associative_rule,
-                )
-            # 辞書データを辞書.csv へ一時保存
-            tmp_csv_path.write_text(csv_text, encoding="utf-8")
-
-            # 辞書.csvをOpenJTalk用にコンパイル
-            pyopenjtalk.mecab_dict_index(str(tmp_csv_path), str(tmp_compiled_path))
-            if not tmp_compiled_path.is_file():
-                raise RuntimeError("辞書のコンパイル時にエラーが発生しました。")
-
-            # コンパイル済み辞書の読み込み
-            pyopenjtalk.update_global_jtalk_with_user_dict(
-                str(tmp_compiled_path.resolve(strict=True))
-            )  # NOTE: resolveによりコンパイル実行時でも相対パスを正しく認識できる
-
-        except Exception as e:
-            raise e
-
-        finally:
-            # 後処理
-            if tmp_csv_path.exists():
-                tmp_csv_path.unlink()
-            if tmp_compiled_path.exists():
-                _delete_file_on_close(tmp_compiled_path)
+            stat = self._user_dict_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
 
-    @_mutex_wrapper(mutex_user_dict)
-    def read_dict(self) -> dict[str, UserDictWord]:
-        """ユーザー辞書を読み出す。"""
-        # 指定ユーザー辞書が存在しない場合、空辞書を返す
-        if not self._user_dict_path.is_file():
-            return {}
+    def _set_cache(
+        self, words: dict[str, UserDictWord], file_state: tuple[int, int] | None
+    ) -> None:
+        """ユーザー辞書データをキャッシュする。"""
+        self._words = words
+        self._words_json = None
+        self._file_state = file_state
+        self._is_cache_loaded = True
+
+    def _refresh_cache(self) -> None:
+        """ユーザー辞書ファイルの最新状態をキャッシュへ反映する。"""
+        # ファイル更新の確認（タイムスタンプとサイズベース）
+        file_state = self._read_file_state()
+        if self._is_cache_loaded and file_state == self._file_state:
+            # 更新無し
+            return
+
+        # 指定ユーザー辞書が存在しない場合、空辞書とする
+        if file_state is None:
+            self._set_cache({}, None)
+            return
 
         save_format_dict = _save_format_dict_adapter.validate_json(
             self._user_dict_path.read_bytes()
         )
-        result: dict[str, UserDictWord] = {}
+        words: dict[str, UserDictWord] = {}
         for word_uuid, word in save_format_dict.items():
-            result[str(UUID(word_uuid))] = convert_from_save_format(word)
-        return result
+            words[str(UUID(word_uuid))] = convert_from_save_format(word)
+        self._set_cache(words, file_state)
+
+    @_mutex_wrapper(mutex_openjtalk_dict)
+    def update_dict(self) -> None:
+        """
+        辞書を更新する。
+
+        デフォルト辞書とユーザー辞書をそれぞれ OpenJTalk 用にコンパイルし、両方を読み込む。
+        コンパイル済み辞書は内容に基づくキーでキャッシュされるため、単語の編集時に再コンパイルされるのはユーザー辞書のみである。
+        辞書を同時に読み込めない環境では、両者を結合した辞書をコンパイルして読み込む。
+        新しい辞書はコンパイルが完了してから読み込まれるため、コンパイル中のテキスト解析は以前の辞書でおこなわれる。
+        """
+        default_dict_path = self._default_dict_path
+        cache_dir = self._user_dict_path.parent
+
+        # デフォルト辞書データの読み込み
+        if not default_dict_path.is_file():
+            warnings.warn("Cannot find default dictionary.", stacklevel=1)
+            return
+        default_csv_text = default_dict_path.read_text(encoding="utf-8")
+        if default_csv_text == default_csv_text.rstrip():
+            default_csv_text += "\n"
+
+        # ユーザー辞書データの変換
+        user_csv_text = _to_csv_text(self.read_dict())
+
+        # 層ごとにコンパイルした辞書の読み込み
+        default_compiled_path = _prepare_compiled_dict(
+            default_csv_text, "default", cache_dir
+        )
+        in_use_paths: list[Path] = []
+        loaded_paths: list[Path] = []
+        if user_csv_text == "":
+            _load_compiled_dict(
+                default_compiled_path,
+                lambda: _compile_dict_csv(default_csv_text, default_compiled_path),
+            )
+            in_use_paths = [default_compiled_path]
+            loaded_paths = [default_compiled_path]
+        elif _is_layered_dict_supported:
+            user_compiled_path = _prepare_compiled_dict(
+                user_csv_text, "user", cache_dir
+            )
+            if _load_layered_dicts([default_compiled_path, user_compiled_path]):
+                in_use_paths = [default_compiled_path, user_compiled_path]
+                loaded_paths = [default_compiled_path, user_compiled_path]
+
+        # 層ごとに読み込めない場合、結合した辞書の読み込み
+        if len(in_use_paths) == 0:
+            merged_csv_text = default_csv_text + user_csv_text
+            merged_compiled_path = _prepare_compiled_dict(
+                merged_csv_text, "merged", cache_dir
+            )
+            _load_compiled_dict(
+                merged_compiled_path,
+                lambda: _compile_dict_csv(merged_csv_text, merged_compiled_path),
+            )
+            # NOTE: ユーザー辞書が空になった場合に備えてデフォルト辞書のキャッシュも残す
+            in_use_paths = [default_compiled_path, merged_compiled_path]
+            loaded_paths = [merged_compiled_path]
+        self._loaded_dict_paths = loaded_paths
+
+        # 使われなくなったキャッシュの削除
+        _delete_stale_caches(cache_dir, in_use_paths)
+
+    @_mutex_wrapper(mutex_user_dict)
+    def read_dict(self) -> dict[str, UserDictWord]:
+        """ユーザー辞書を読み出す。"""
+        self._refresh_cache()
+        return dict(self._words)
+
+    @_mutex_wrapper(mutex_user_dict)
+    def read_dict_json(self) -> bytes:
+        """ユーザー辞書を API の応答形式の JSON として読み出す。"""
+        self._refresh_cache()
+        # NOTE: 変更が無い限り同じ JSON を使い回し、単語数に比例するシリアライズを省く
+        if self._words_json is None:
+            self._words_json = _user_dict_adapter.dump_json(self._words)
+        return self._words_json
 
     def import_user_dict(
         self, dict_data: dict[str, UserDictWord], override: bool = False
@@ -257,28 +716,7 @@ class UserDictionary:
         # インポートする辞書データのバリデーション
         for word_uuid, word in dict_data.items():
             UUID(word_uuid)
-            for pos_detail in part_of_speech_data.values():
-                if word.context_id == pos_detail.context_id:
-                    assert word.part_of_speech == pos_detail.part_of_speech
-                    assert (
-                        word.part_of_speech_detail_1
-                        == pos_detail.part_of_speech_detail_1
-                    )
-                    assert (
-                        word.part_of_speech_detail_2
-                        == pos_detail.part_of_speech_detail_2
-                    )
-                    assert (
-                        word.part_of_speech_detail_3
-                        == pos_detail.part_of_speech_detail_3
-                    )
-                    assert (
-                        word.accent_associative_rule
-                        in pos_detail.accent_associative_rules
-                    )
-                    break
-            else:
-                raise ValueError("対応していない品詞です")
+            _validate_import_word(word)
 
         # 既存辞書の読み出し
         old_dict = self.read_dict()
@@ -293,7 +731,47 @@ class UserDictionary:
 
         # 更新された辞書データの保存と適用
         self._write_to_json(new_dict)
-        self.update_dict()
+        self._request_update()
+
+    def import_user_dict_lines(
+        self,
+        lines: Iterable[str],
+        file_format: Literal["csv", "ndjson"],
+        override: bool = False,
+    ) -> None:
+        """
+        CSV または NDJSON 形式のユーザー辞書を 1 行ずつ読み込んでインポートする。
+
+        全ての行を検証してから保存するため、不正な行が含まれる場合は辞書を変更しない。
+        辞書データの保存と適用は一度だけおこなう。
+
+        Parameters
+        ----------
+        lines : Iterable[str]
+            インポートするユーザー辞書の各行
+        file_format : Literal["csv", "ndjson"]
+            ユーザー辞書の形式。csv は MeCab 辞書.csv 形式、ndjson は各行が単語 UUID から単語への対応を表す JSON である。
+        override : bool
+            重複したエントリがあった場合、上書きするかどうか
+
+        Raises
+        ------
+        UserDictInputError
+            不正な行が含まれる場合
+        """
+        # 既存辞書の読み出し
+        user_dict = self.read_dict()
+        old_word_uuids = set(user_dict)
+
+        # 辞書データの更新
+        for word_uuid, word in _iter_import_words(lines, file_format):
+            # 重複エントリは上書き指定時のみ置き換える
+            if override or word_uuid not in old_word_uuids:
+                user_dict[word_uuid] = word
+
+        # 更新された辞書データの保存と適用
+        self._write_to_json(user_dict)
+        self._request_update()
 
     def apply_word(self, word_property: WordProperty) -> str:
         """新規単語を追加し、その単語に割り当てられた UUID を返す。"""
@@ -304,7 +782,7 @@ class UserDictionary:
 
         # 更新された辞書データの保存と適用
         self._write_to_json(user_dict)
-        self.update_dict()
+        self._request_update()
 
         return word_uuid
 
@@ -318,7 +796,7 @@ class UserDictionary:
 
         # 更新された辞書データの保存と適用
         self._write_to_json(user_dict)
-        self.update_dict()
+        self._request_update()
 
     def delete_word(self, word_uuid: str) -> None:
         """単語UUIDで指定された単語を削除する。"""
@@ -330,4 +808,34 @@ class UserDictionary:
 
         # 更新された辞書データの保存と適用
         self._write_to_json(user_dict)
-        self.update_dict()
+        self._request_update()
+
+    def apply_operations(self, operations: list[UserDictWordOperation]) -> list[str]:
+        """
+        単語の追加・更新・削除からなる一連の操作を一括で適用し、各操作の対象となった単語の UUID を返す。
+
+        操作は先頭から順に適用される。全ての操作を検証してから保存するため、不正な操作が含まれる場合は辞書を変更しない。
+        辞書データの保存と適用は一度だけおこなう。
+
+        Raises
+        ------
+        UserDictOperationsError
+            不正な操作が含まれる場合。不正な操作ごとのエラー内容を持つ。
+        """
+        # 一括操作による辞書データの更新
+        user_dict = self.read_dict()
+        word_uuids: list[str] = []
+        errors: dict[int, str] = {}
+        for index, operation in enumerate(operations):
+            try:
+                word_uuids.append(_apply_operation(user_dict, operation))
+            except (UserDictInputError, ValidationError) as e:
+                errors[index] = str(e)
+        if errors:
+            raise UserDictOperationsError(errors)
+
+        # 更新された辞書データの保存と適用
+        self._write_to_json(user_dict)
+        self._request_update()
+
+        return word_uuids
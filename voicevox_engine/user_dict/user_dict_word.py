@@ -80,6 +80,29 @@ part_of_speech_data: dict[WordTypes, _PartOfSpeechDetail] = {
     ),
 }
 
+# 文脈IDから品詞ごとの情報への対応
+_part_of_speech_by_context_id: dict[int, _PartOfSpeechDetail] = {
+    pos_detail.context_id: pos_detail for pos_detail in part_of_speech_data.values()
+}
+
+
+def search_part_of_speech(context_id: int) -> _PartOfSpeechDetail | None:
+    """文脈IDに対応する品詞の情報を返す。対応する品詞が無い場合は None を返す。"""
+    return _part_of_speech_by_context_id.get(context_id)
+
+
+def is_consistent_part_of_speech(
+    word: UserDictWord, pos_detail: _PartOfSpeechDetail
+) -> bool:
+    """単語の品詞とアクセント結合規則が、文脈IDの示す品詞の情報と整合するか否かを判定する。"""
+    return (
+        word.part_of_speech == pos_detail.part_of_speech
+        and word.part_of_speech_detail_1 == pos_detail.part_of_speech_detail_1
+        and word.part_of_speech_detail_2 == pos_detail.part_of_speech_detail_2
+        and word.part_of_speech_detail_3 == pos_detail.part_of_speech_detail_3
+        and word.accent_associative_rule in pos_detail.accent_associative_rules
+    )
+
 
 @dataclass
 class WordProperty:
@@ -132,11 +155,19 @@ class UserDictInputError(Exception):
     pass
 
 
+class UserDictOperationsError(UserDictInputError):
+    """一括操作に受け入れ不可能な操作が含まれることに起因するエラー"""
+
+    def __init__(self, errors: dict[int, str]) -> None:
+        self.errors = errors  # 不正な操作のインデックスとエラー内容
+        super().__init__("不正な操作が含まれています")
+
+
 def _search_cost_candidates(context_id: int) -> list[int]:
-    for value in part_of_speech_data.values():
-        if value.context_id == context_id:
-            return value.cost_candidates
-    raise UserDictInputError("品詞IDが不正です")
+    pos_detail = search_part_of_speech(context_id)
+    if pos_detail is None:
+        raise UserDictInputError("品詞IDが不正です")
+    return pos_detail.cost_candidates
 
 
 def _cost2priority(context_id: int, cost: int) -> int: